@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Completion benchmarks over a registry of 5000 commands: command names by
+prefix and fuzzily, and the options of one command.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.document import Document
+
+from fastshell.command import Command
+from fastshell.completer import FastShellCompleter
+from fastshell.index import IndexedDict
+from harness import BENCHMARKS, benchmark, run
+
+COUNT = 5000
+VERBS = ["get", "set", "list", "delete", "describe", "deploy", "restart", "scale"]
+
+
+def sync_user(name: str, email: str = "", admin: bool = False, region: str = "eu", dry_run: bool = False):
+    """Synchronize a user."""
+    return name
+
+
+def registry():
+    """Build COUNT commands sharing one function, indexed as the app does."""
+    commands = IndexedDict()
+    for i in range(COUNT):
+        name = f"{VERBS[i % len(VERBS)]}-resource-{i}"
+        commands[name] = Command.from_function(sync_user, name, use_pydantic=False)
+    return commands
+
+
+def _complete(text, fuzzy=False):
+    completer = FastShellCompleter(registry(), fuzzy=fuzzy)
+    document = Document(text)
+    return lambda: list(completer.get_completions(document, None))
+
+
+@benchmark("complete.command_prefix")
+def complete_command_prefix():
+    return _complete("deploy-resource-1")
+
+
+@benchmark("complete.command_fuzzy")
+def complete_command_fuzzy():
+    return _complete("dplres42", fuzzy=True)
+
+
+@benchmark("complete.option_names")
+def complete_option_names():
+    return _complete("get-resource-0 alice --")
+
+
+if __name__ == "__main__":
+    run(sorted(name for name in BENCHMARKS if name.startswith("complete.")))
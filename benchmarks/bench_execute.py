@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Command execution benchmarks: binding and converting arguments with the
+built-in converters and with Pydantic, and a full FastShell._execute.
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import List, Optional
+
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.command import Command
+from harness import BENCHMARKS, benchmark, run
+
+
+def deploy(env: str, replicas: int = 1, ratio: float = 0.5, tag: Optional[str] = None, force: bool = False):
+    """Deploy a service."""
+    return env
+
+
+def total(values: List[int]):
+    """Sum values."""
+    return sum(values)
+
+
+ARGS = (["production"], {"replicas": "3", "ratio": "0.25", "tag": "v1.2", "force": "true"})
+IDS = ",".join(str(i) for i in range(1000))
+
+
+def _execute(use_pydantic, func, args, kwargs):
+    execute = Command.from_function(func, func.__name__, use_pydantic=use_pydantic).execute
+    return lambda: execute(args, kwargs)
+
+
+@benchmark("execute.plain")
+def execute_plain():
+    return _execute(False, deploy, *ARGS)
+
+
+@benchmark("execute.pydantic")
+def execute_pydantic():
+    return _execute(True, deploy, *ARGS)
+
+
+@benchmark("execute.list_plain")
+def execute_list_plain():
+    return _execute(False, total, [IDS], {})
+
+
+@benchmark("execute.list_pydantic")
+def execute_list_pydantic():
+    return _execute(True, total, [IDS], {})
+
+
+@benchmark("execute.app_line")
+def execute_app_line():
+    """Parse, bind and call through the app, with metrics collection on."""
+    app = FastShell(name="bench", use_pydantic=False)
+    app.console = Console(file=io.StringIO())
+    app.command()(deploy)
+    return lambda: app._execute("deploy production --replicas 3 --force", format_output=False)
+
+
+if __name__ == "__main__":
+    run(sorted(name for name in BENCHMARKS if name.startswith("execute.")))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Formatter benchmarks: every output format rendered to an in-memory console.
+
+format.<name> renders a 100,000-row result with the default max_rows cap,
+so its cost must not grow with the result. format.<name>.uncapped renders
+every row with max_rows=None; it uses a smaller result of 10 times the cap,
+as rendering all 100,000 rows takes over a minute per format.
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell.formatter import DEFAULT_MAX_ROWS, OutputFormat, create_formatter
+from harness import BENCHMARKS, benchmark, run
+
+ROWS = 100_000
+UNCAPPED_ROWS = 10 * DEFAULT_MAX_ROWS
+
+
+def rows(count):
+    return [
+        {"id": i, "name": f"user-{i}", "email": f"user{i}@example.com", "active": i % 3 != 0,
+         "groups": ["staff", "ops"] if i % 5 == 0 else ["staff"]}
+        for i in range(count)
+    ]
+
+
+def _format(format_type, capped=True):
+    console = Console(file=io.StringIO(), width=120)
+    if capped:
+        formatter = create_formatter(console, format_type.value)
+        result = rows(ROWS)
+    else:
+        formatter = create_formatter(console, format_type.value, max_rows=None)
+        result = rows(UNCAPPED_ROWS)
+
+    def render():
+        console.file.seek(0)
+        console.file.truncate()
+        formatter.format_result(result)
+    return render
+
+
+def _register(format_type):
+    benchmark(f"format.{format_type.value}")(lambda: _format(format_type))
+    if format_type is not OutputFormat.SUMMARY:
+        # The summary does not depend on max_rows
+        benchmark(f"format.{format_type.value}.uncapped")(lambda: _format(format_type, capped=False))
+
+
+for _format_type in OutputFormat:
+    _register(_format_type)
+
+
+if __name__ == "__main__":
+    run(sorted(name for name in BENCHMARKS if name.startswith("format.")))
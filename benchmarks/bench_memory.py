@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Registry memory benchmark.
+
+Measures the memory held by 10k Parameter objects with the slotted
+representation in fastshell.types and with the plain dataclass it
+replaced, and the allocations made by parse_partial per keystroke.
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import make_dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.parser import CommandParser
+from fastshell.types import Parameter, ParameterType, ParsedCommand
+
+COUNT = 10_000
+
+# The previous, __dict__-based layout of Parameter
+DictParameter = make_dataclass("DictParameter", [(name, object) for name in Parameter.__slots__])
+
+
+def footprint(cls):
+    """Bytes held by COUNT instances of cls, excluding their field values."""
+    rows = [(f"param_{i}", int, "", None, True, ParameterType.ARGUMENT) for i in range(COUNT)]
+    tracemalloc.start()
+    objects = [cls(*row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def keystroke_allocations(parse, line):
+    """Peak bytes allocated while parsing each prefix of line."""
+    parse(line[:1])
+    tracemalloc.start()
+    for end in range(2, len(line) + 1):
+        parse(line[:end])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    before = footprint(DictParameter)
+    after = footprint(Parameter)
+    print(f"{COUNT} parameters, dataclass with __dict__  {before / 1024:9.1f} KiB")
+    print(f"{COUNT} parameters, slotted                  {after / 1024:9.1f} KiB")
+    print(f"saved: {(before - after) / 1024:.1f} KiB ({1 - after / before:.0%})")
+
+    line = "deploy production --tag 'release 1.2' --region eu-west-1 -v"
+    parser = CommandParser()
+    reused = keystroke_allocations(parser.parse_partial, line)
+    print(f"parse_partial peak over {len(line)} keystrokes: {reused} bytes "
+          f"(ParsedCommand instance size: {sys.getsizeof(ParsedCommand())} bytes)")
+
+
+if __name__ == "__main__":
+    main()
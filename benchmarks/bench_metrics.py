@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Metrics recording microbenchmark.
+
+Measures the cost of MetricsRegistry.record and the overhead metrics
+collection adds to FastShell._execute, which should both stay below a
+microsecond per call.
+"""
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.metrics import MetricsRegistry
+from harness import benchmark
+
+BUDGET_US = 1.0
+
+
+@benchmark("metrics.record")
+def metrics_record():
+    record = MetricsRegistry().record
+    return lambda: record("ping", 12345)
+
+
+def bench(label, func, number=200000):
+    """Time func and print the per-call cost."""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    per_call_us = best / number * 1e6
+    print(f"{label:<32} {per_call_us:8.3f} us/call")
+    return per_call_us
+
+
+def make_app(collect_metrics):
+    app = FastShell(name="bench", use_pydantic=False, collect_metrics=collect_metrics)
+    app.console = Console(file=io.StringIO())
+
+    @app.command()
+    def ping(count: int = 1):
+        """Return immediately."""
+        return count
+
+    return app
+
+
+def main():
+    registry = MetricsRegistry()
+    error = ValueError("bad value")
+    record_cost = max(
+        bench("record (ok)", lambda: registry.record("ping", 12345)),
+        bench("record (error)", lambda: registry.record("ping", 12345, error)),
+    )
+
+    with_metrics, without_metrics = make_app(True), make_app(False)
+    number = 50000
+    measured = bench("_execute with metrics", lambda: with_metrics._execute("ping 3", False), number)
+    baseline = bench("_execute without metrics", lambda: without_metrics._execute("ping 3", False), number)
+    overhead = measured - baseline
+    print(f"{'metrics overhead per command':<32} {overhead:8.3f} us/call")
+
+    within = record_cost < BUDGET_US and overhead < BUDGET_US
+    print(f"budget {BUDGET_US:g} us: {'ok' if within else 'EXCEEDED'}")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+CommandParser microbenchmark.
+
+Compares the single-pass tokenizer used by CommandParser.parse with
+shlex.split, which it replaced, on a mix of typical command lines. The
+parse.* benchmarks of the suite (benchmarks/run.py) are defined here.
+"""
+
+import os
+import shlex
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.parser import CommandParser, tokenize
+from harness import benchmark
+
+LINES = [
+    "hello",
+    "greet Alice --count 3 --loud",
+    "search 'hello world' file1.txt file2.txt --case-sensitive -n",
+    'deploy --env=production --tag "release 1.2" -v -f config.yaml',
+    "ids " + ",".join(str(i) for i in range(200)),
+]
+
+
+PIPELINE = "numbers 1000 | double --factor 3 | head 5"
+
+
+@benchmark("parse.shlex", ops=len(LINES))
+def parse_shlex():
+    return lambda: [shlex.split(line) for line in LINES]
+
+
+@benchmark("parse.tokenize", ops=len(LINES))
+def parse_tokenize():
+    return lambda: [list(tokenize(line)) for line in LINES]
+
+
+@benchmark("parse.parse", ops=len(LINES))
+def parse_parse():
+    parse = CommandParser().parse
+    return lambda: [parse(line) for line in LINES]
+
+
+@benchmark("parse.pipeline")
+def parse_pipeline():
+    parse_pipeline = CommandParser().parse_pipeline
+    return lambda: parse_pipeline(PIPELINE)
+
+
+@benchmark("parse.partial_keystroke", ops=len(LINES[3]))
+def parse_partial_keystroke():
+    """Re-parse the line after every keystroke, as completion does."""
+    parse_partial = CommandParser().parse_partial
+    prefixes = [LINES[3][:end] for end in range(1, len(LINES[3]) + 1)]
+    return lambda: [parse_partial(prefix) for prefix in prefixes]
+
+
+def bench(label, func, number=2000):
+    """Time func over all sample lines and print the per-line cost."""
+    best = min(timeit.repeat(lambda: [func(line) for line in LINES], number=number, repeat=5))
+    per_line_us = best / (number * len(LINES)) * 1e6
+    print(f"{label:<28} {per_line_us:8.2f} us/line")
+    return per_line_us
+
+
+def main():
+    parser = CommandParser()
+    shlex_cost = bench("shlex.split", shlex.split)
+    tokenize_cost = bench("tokenize", lambda line: list(tokenize(line)))
+    bench("CommandParser.parse", parser.parse)
+    print(f"tokenizer speedup over shlex: {shlex_cost / tokenize_cost:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
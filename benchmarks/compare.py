@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compare benchmark results against a baseline.
+
+    python benchmarks/compare.py benchmarks/baseline.json results.json
+
+Prints the change of the median time of every benchmark and exits with
+status 1 if any benchmark got slower by more than the threshold.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import load
+
+
+def compare(baseline, current, threshold):
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions = []
+    print(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            print(f"{name:<40} {baseline[name]['median_us']:12.3f} {'-':>12} {'missing':>8}")
+            continue
+        if name not in baseline:
+            print(f"{name:<40} {'-':>12} {current[name]['median_us']:12.3f} {'new':>8}")
+            continue
+        before = baseline[name]["median_us"]
+        after = current[name]["median_us"]
+        change = after / before - 1
+        marker = ""
+        if change > threshold:
+            marker = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40} {before:12.3f} {after:12.3f} {change:+8.1%}{marker}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", help="results JSON to compare against")
+    parser.add_argument("current", help="results JSON of the new run")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15,
+        help="relative slowdown reported as a regression (default: 0.15)",
+    )
+    args = parser.parse_args(argv)
+
+    regressions = compare(load(args.baseline), load(args.current), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Minimal benchmark harness for the FastShell hot paths.
+
+Benchmarks register a setup function with the ``benchmark`` decorator.
+The setup function builds its fixtures once and returns the callable to
+time. Like pyperf, each benchmark is calibrated so that one sample runs
+for at least ``min_time`` seconds, and the median over several samples
+is reported per operation.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Registered benchmarks by name: (setup function, operations per call)
+BENCHMARKS: Dict[str, Tuple[Callable[[], Callable[[], object]], int]] = {}
+
+
+def benchmark(name: str, ops: int = 1) -> Callable:
+    """Register a benchmark.
+
+    Args:
+        name: Dotted benchmark name, e.g. "parse.typical"
+        ops: Operations performed by one call of the timed callable;
+            timings are reported per operation
+    """
+    def decorator(setup: Callable[[], Callable[[], object]]) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark: {name}")
+        BENCHMARKS[name] = (setup, ops)
+        return setup
+    return decorator
+
+
+def _calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Find a loop count whose run takes at least min_time seconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return loops
+        loops *= 2
+
+
+def measure(
+    func: Callable[[], object], ops: int = 1, samples: int = 7, min_time: float = 0.05
+) -> Dict[str, float]:
+    """Time a callable.
+
+    Args:
+        func: Callable to time
+        ops: Operations performed by one call
+        samples: Number of timed samples
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        Median, minimum and standard deviation in microseconds per
+        operation, and the loop count of each sample
+    """
+    loops = _calibrate(func, min_time)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((time.perf_counter() - start) / (loops * ops) * 1e6)
+    return {
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "stdev_us": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "loops": loops,
+    }
+
+
+def run(
+    names: Optional[List[str]] = None, samples: int = 7, min_time: float = 0.05
+) -> Dict[str, Dict[str, float]]:
+    """Run registered benchmarks, printing each result as it completes.
+
+    Args:
+        names: Benchmarks to run (all when omitted)
+        samples: Number of timed samples per benchmark
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        Results by benchmark name
+    """
+    results = {}
+    for name in names if names is not None else sorted(BENCHMARKS):
+        setup, ops = BENCHMARKS[name]
+        result = measure(setup(), ops, samples, min_time)
+        results[name] = result
+        print(f"{name:<40} {result['median_us']:12.3f} us  +- {result['stdev_us']:.3f}")
+    return results
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine and interpreter a run was made on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "argv": " ".join(sys.argv),
+    }
+
+
+def save(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Write results with a description of the environment as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path: str) -> Dict[str, Dict[str, float]]:
+    """Read the results of a saved run."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Run the FastShell benchmark suite.
+
+    python benchmarks/run.py                          # run everything
+    python benchmarks/run.py -k parse                 # names containing "parse"
+    python benchmarks/run.py -o results.json          # save the results
+    python benchmarks/run.py --compare baseline.json  # fail on regressions
+
+Benchmarks are collected from the bench_*.py modules in this directory.
+Update the stored baseline with ``-o benchmarks/baseline.json`` on the
+reference machine when a change is expected to move the numbers.
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.dirname(HERE))
+
+import harness
+from compare import compare
+
+
+def collect():
+    """Import the benchmark modules, registering their benchmarks."""
+    for path in sorted(glob.glob(os.path.join(HERE, "bench_*.py"))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results against a baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="regression threshold for --compare")
+    parser.add_argument("--samples", type=int, default=7, help="timed samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter samples for a smoke run")
+    args = parser.parse_args(argv)
+
+    collect()
+    names = sorted(name for name in harness.BENCHMARKS if not args.pattern or args.pattern in name)
+    if not names:
+        print(f"No benchmarks match '{args.pattern}'")
+        return 1
+
+    samples, min_time = (3, 0.01) if args.quick else (args.samples, args.min_time)
+    results = harness.run(names, samples, min_time)
+    if args.output:
+        harness.save(args.output, results)
+
+    if args.compare:
+        print()
+        baseline = {name: result for name, result in harness.load(args.compare).items() if name in results}
+        if compare(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """FastShell - A FastAPI-like framework for building interactive shell applications."""
 
 from .app import FastShell
+from .cancellation import CancellationToken
 
 __version__ = "0.1.0"
-__all__ = ["FastShell"]
\ No newline at end of file
+__all__ = ["FastShell", "CancellationToken"]
\ No newline at end of file
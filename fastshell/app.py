@@ -1,17 +1,34 @@
 """FastShell main application class."""
 
+import atexit
+import inspect
+import os
 import sys
-from typing import Dict, Any, Callable, Optional, List
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import InMemoryHistory
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Callable, Iterable, Iterator, Optional, List, Sequence, TextIO, Tuple, Union
 from rich.console import Console
 
-from .parser import CommandParser
-from .completer import FastShellCompleter
-from .command import Command
-from .exceptions import FastShellException, CommandNotFound
+from .parser import CommandParser, tokenize
+from .command import Command, LazyCommand
+from .exceptions import FastShellException, CommandCancelled, CommandNotFound, InvalidArguments, ParseError
+from .cancellation import CancellationToken
+from .index import IndexedDict, PrefixIndex
+from .jobs import JobManager, JobState
+from .metrics import MetricsRegistry
+from .profiling import ExecutionProfile, ProfileHook
+from .types import BatchSummary, ExecutionOutcome, ParsedCommand
 from .validation import ValidationConfig, set_validation_config
-from .formatter import OutputFormat, create_formatter
+from .formatter import DEFAULT_MAX_ROWS, OutputFormat, create_formatter
+
+if TYPE_CHECKING:
+    # prompt_toolkit and asyncio are imported lazily to keep startup fast
+    import asyncio
+
+    from prompt_toolkit import PromptSession
+
+    from .cache import MetadataCache
+    from .jobs import Job
 
 
 class FastShell:
@@ -23,6 +40,12 @@ class FastShell:
         description: str = "",
         use_pydantic: bool = True,
         output_format: str = "auto",
+        fuzzy_completion: bool = False,
+        metadata_cache: Optional[Union[str, "os.PathLike"]] = None,
+        default_timeout: Optional[float] = None,
+        collect_metrics: bool = True,
+        max_rows: Optional[int] = DEFAULT_MAX_ROWS,
+        pager: bool = False,
     ):
         """Initialize FastShell application.
 
@@ -31,15 +54,41 @@ class FastShell:
             description: Application description
             use_pydantic: Whether to use Pydantic for type validation
             output_format: Default output format for command results
+            fuzzy_completion: Whether completion matches names fuzzily
+            metadata_cache: Path of an on-disk cache of command metadata;
+                speeds up startup of apps with many commands
+            default_timeout: Seconds before a command without its own
+                ``timeout`` is cancelled; None for no limit
+            collect_metrics: Whether to record call counts, errors and
+                latencies of executed commands in ``metrics``
+            max_rows: Number of rows, items or keys of a result shown
+                before an "N more" footer; None to show everything
+            pager: Whether results longer than max_rows are shown page by
+                page on a terminal instead of being cut off
         """
         self.name = name
         self.description = description
         self.use_pydantic = use_pydantic
-        self.commands: Dict[str, Command] = {}
+        self.fuzzy_completion = fuzzy_completion
+        self.default_timeout = default_timeout
+        self.command_index = PrefixIndex()
+        # Registering or removing a command keeps command_index in step
+        self.commands: Dict[str, Union[Command, LazyCommand]] = IndexedDict(self.command_index)
         self.console = Console()
         self.parser = CommandParser()
-        self.session: Optional[PromptSession] = None
-        self.formatter = create_formatter(self.console, output_format)
+        self.session: Optional["PromptSession"] = None
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self.jobs = JobManager()
+        self._profile_hooks: List[ProfileHook] = []
+        self.metrics: Optional[MetricsRegistry] = MetricsRegistry() if collect_metrics else None
+        self.formatter_options: Dict[str, Any] = {"max_rows": max_rows, "pager": pager}
+        self.formatter = create_formatter(self.console, output_format, **self.formatter_options)
+        self.metadata_cache: Optional["MetadataCache"] = None
+        if metadata_cache is not None:
+            from .cache import MetadataCache
+
+            self.metadata_cache = MetadataCache(metadata_cache)
+            atexit.register(self.metadata_cache.save)
 
         # Configure global validation
         validation_config = ValidationConfig(use_pydantic=use_pydantic)
@@ -59,6 +108,7 @@ class FastShell:
                     func,
                     name or func.__name__,
                     use_pydantic=self.use_pydantic,
+                    metadata_cache=self.metadata_cache,
                     **kwargs,
                 )
             )
@@ -74,8 +124,72 @@ class FastShell:
         """
         self.commands[command.name] = command
 
+    def add_lazy_commands(
+        self,
+        module: str,
+        names: Union[Iterable[str], Dict[str, Optional[str]]],
+    ) -> None:
+        """Register commands whose module is imported on first use.
+
+        Only the names and descriptions are recorded. The module is imported
+        and the commands are built when one of them is first executed or its
+        help or completion is requested. The module may define plain
+        functions named after the commands or register them with
+        ``@app.command``.
+
+        Args:
+            module: Dotted name of the module defining the commands
+            names: Command names, or a mapping of names to short descriptions
+        """
+        descriptions = names if isinstance(names, dict) else dict.fromkeys(names)
+        for name, description in descriptions.items():
+            self.commands[name] = LazyCommand(name, module, description)
+
+    def add_entry_point_commands(self, group: str) -> None:
+        """Register the commands advertised by installed packages.
+
+        Each entry point in the group names a command and the function that
+        implements it (``name = package.module:function``); the module is
+        imported on first use, as with ``add_lazy_commands``.
+
+        Args:
+            group: Entry point group name
+        """
+        from importlib.metadata import entry_points
+
+        found = entry_points()
+        # Python < 3.10 returns a dict of groups
+        selected = found.select(group=group) if hasattr(found, "select") else found.get(group, ())
+        for entry_point in selected:
+            module, _, attribute = entry_point.value.partition(":")
+            self.commands[entry_point.name] = LazyCommand(
+                entry_point.name, module.strip(), attribute=attribute.strip() or None
+            )
+
+    def add_profile_hook(self, hook: ProfileHook) -> None:
+        """Register a function to receive the phase timings of every execution.
+
+        While any hook is registered, each command line run through
+        ``execute_command`` or its async variant is timed per phase (parse,
+        bind, validate, call and format) and the hooks are called with the
+        resulting ExecutionProfile once it finishes, whether it succeeded
+        or not.
+
+        Args:
+            hook: Function called with the profile of each execution
+        """
+        self._profile_hooks.append(hook)
+
+    def remove_profile_hook(self, hook: ProfileHook) -> None:
+        """Unregister a hook added with ``add_profile_hook``.
+
+        Args:
+            hook: Previously added hook
+        """
+        self._profile_hooks.remove(hook)
+
     def get_command(self, name: str) -> Command:
-        """Get a command by name.
+        """Get a command by name, loading it if it was registered lazily.
 
         Args:
             name: Command name
@@ -84,49 +198,810 @@ class FastShell:
             Command instance
 
         Raises:
-            CommandNotFound: If command doesn't exist
+            CommandNotFound: If command doesn't exist or cannot be loaded
         """
         if name not in self.commands:
             raise CommandNotFound(f"Command '{name}' not found")
-        return self.commands[name]
+        command = self.commands[name]
+        if isinstance(command, LazyCommand):
+            command = command.resolve(
+                self.commands, use_pydantic=self.use_pydantic, metadata_cache=self.metadata_cache
+            )
+            self.add_command(command)
+        return command
 
-    def execute_command(self, command_line: str, format_output: bool = True) -> Any:
+    def execute_command(
+        self,
+        command_line: str,
+        format_output: bool = True,
+        token: Optional[CancellationToken] = None,
+    ) -> Any:
         """Execute a command from command line string.
 
         Args:
             command_line: Command line to execute
             format_output: Whether to format and display the output
+            token: Token to cancel the command with from elsewhere
 
         Returns:
             Command execution result
         """
         try:
-            parsed = self.parser.parse(command_line)
-            if not parsed.command:
-                return
-
-            # Handle built-in help command
-            if parsed.command.lower() == "help":
-                self._show_help()
-                return
+            return self._execute(command_line, format_output, token)
+        except FastShellException as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+        except Exception as e:
+            self.console.print(f"[red]Unexpected error: {e}[/red]")
 
-            command = self.get_command(parsed.command)
-            result = command.execute(parsed.args, parsed.kwargs)
+    async def execute_command_async(
+        self,
+        command_line: str,
+        format_output: bool = True,
+        token: Optional[CancellationToken] = None,
+    ) -> Any:
+        """Execute a command from command line string on the running event loop.
 
-            # Format and display result if requested
-            if format_output and result is not None:
-                self.formatter.format_result(result)
+        Coroutine commands are awaited directly, so they share the caller's
+        loop instead of blocking it.
 
-            return result
+        Args:
+            command_line: Command line to execute
+            format_output: Whether to format and display the output
+            token: Token to cancel the command with from elsewhere
 
+        Returns:
+            Command execution result
+        """
+        try:
+            return await self._execute_async(command_line, format_output, token)
         except FastShellException as e:
             self.console.print(f"[red]Error: {e}[/red]")
         except Exception as e:
             self.console.print(f"[red]Unexpected error: {e}[/red]")
 
+    def execute_many(
+        self,
+        command_name: str,
+        arg_sets: Iterable[Union[str, Sequence[str]]],
+        workers: int = 8,
+        executor: str = "thread",
+        format_output: bool = True,
+    ) -> List[ExecutionOutcome]:
+        """Run one command over many argument sets concurrently.
+
+        Every argument set is parsed and bound with the command's compiled
+        binding plan up front. The calls are then dispatched to a thread or
+        process pool. Coroutine commands instead run concurrently on the
+        app's event loop, with at most ``workers`` in flight. Results and
+        errors are collected in input order and rendered once.
+
+        Args:
+            command_name: Name of the command to run
+            arg_sets: Argument strings (e.g. "host1 --count 3") or token lists
+            workers: Maximum number of concurrent runs
+            executor: "thread" or "process"; with "process" the command
+                function and its arguments must be picklable
+            format_output: Whether to render the collected outcomes
+
+        Returns:
+            One ExecutionOutcome per argument set, in input order
+
+        Raises:
+            CommandNotFound: If the command doesn't exist
+        """
+        command, outcomes, calls = self._bind_many(command_name, arg_sets, executor)
+        if command.is_async:
+            self.loop.run_until_complete(self._gather_calls(command, calls, workers))
+        else:
+            self._pool_calls(command, calls, workers, executor)
+        if format_output:
+            self._show_outcomes(outcomes)
+        return outcomes
+
+    async def execute_many_async(
+        self,
+        command_name: str,
+        arg_sets: Iterable[Union[str, Sequence[str]]],
+        workers: int = 8,
+        executor: str = "thread",
+        format_output: bool = True,
+    ) -> List[ExecutionOutcome]:
+        """Run one command over many argument sets concurrently on the running event loop.
+
+        Like execute_many, but coroutine commands are awaited on the caller's
+        loop and the pool of a sync command is waited for in a worker
+        thread, so the loop is never blocked or re-entered.
+
+        Args:
+            command_name: Name of the command to run
+            arg_sets: Argument strings (e.g. "host1 --count 3") or token lists
+            workers: Maximum number of concurrent runs
+            executor: "thread" or "process"; with "process" the command
+                function and its arguments must be picklable
+            format_output: Whether to render the collected outcomes
+
+        Returns:
+            One ExecutionOutcome per argument set, in input order
+
+        Raises:
+            CommandNotFound: If the command doesn't exist
+        """
+        import asyncio
+
+        command, outcomes, calls = self._bind_many(command_name, arg_sets, executor)
+        if command.is_async:
+            await self._gather_calls(command, calls, workers)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._pool_calls, command, calls, workers, executor
+            )
+        if format_output:
+            self._show_outcomes(outcomes)
+        return outcomes
+
+    def _bind_many(
+        self,
+        command_name: str,
+        arg_sets: Iterable[Union[str, Sequence[str]]],
+        executor: str,
+    ) -> Tuple[Command, List[ExecutionOutcome], List]:
+        """Parse and bind every argument set of a fan-out run.
+
+        Returns:
+            The command, one outcome per argument set, and the bound calls
+            of the argument sets that bound successfully
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}")
+
+        command = self.get_command(command_name)
+        outcomes = []
+        calls = []
+        for arg_set in arg_sets:
+            tokens = list(tokenize(arg_set)) if isinstance(arg_set, str) else list(arg_set)
+            outcome = ExecutionOutcome(input=arg_set if isinstance(arg_set, str) else " ".join(tokens))
+            outcomes.append(outcome)
+            try:
+                parsed = self.parser.parse_tokens([command_name, *tokens])
+                calls.append((outcome, command.bind(parsed.args, parsed.kwargs)))
+            except Exception as e:
+                outcome.error = e
+        return command, outcomes, calls
+
+    @staticmethod
+    def _pool_calls(command: Command, calls: List, workers: int, executor: str) -> None:
+        """Run bound calls of a sync command in a thread or process pool."""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool_class(max_workers=max(workers, 1)) as pool:
+            futures = [
+                (outcome, pool.submit(command.func, *args, **kwargs))
+                for outcome, (args, kwargs) in calls
+            ]
+            for outcome, future in futures:
+                try:
+                    outcome.result = future.result()
+                except Exception as e:
+                    outcome.error = e
+
+    def _show_outcomes(self, outcomes: List[ExecutionOutcome]) -> None:
+        """Render the outcomes of a fan-out run as one result."""
+        if outcomes:
+            self.formatter.format_result([
+                {
+                    "input": outcome.input,
+                    "status": "ok" if outcome.ok else "error",
+                    "result": outcome.result if outcome.ok else str(outcome.error),
+                }
+                for outcome in outcomes
+            ])
+
+    async def _gather_calls(self, command: Command, calls: List, workers: int) -> None:
+        """Await bound calls of a coroutine command with bounded concurrency."""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(workers, 1))
+
+        async def run(outcome: ExecutionOutcome, args: List[Any], kwargs: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    outcome.result = await command.func(*args, **kwargs)
+                except Exception as e:
+                    outcome.error = e
+
+        await asyncio.gather(*(run(outcome, args, kwargs) for outcome, (args, kwargs) in calls))
+
+    @property
+    def loop(self) -> "asyncio.AbstractEventLoop":
+        """Event loop that runs coroutine commands for the app's lifetime."""
+        if self._loop is None or self._loop.is_closed():
+            import asyncio
+
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def close(self) -> None:
+        """Save the metadata cache, export metrics, cancel outstanding tasks and close the app's event loop."""
+        if self.metadata_cache is not None:
+            self.metadata_cache.save()
+        if self.metrics is not None:
+            self.metrics.export()
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+
+        import asyncio
+
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+    def _execute(
+        self,
+        command_line: str,
+        format_output: bool = True,
+        token: Optional[CancellationToken] = None,
+        profile: Optional[ExecutionProfile] = None,
+    ) -> Any:
+        """Execute a command line, letting errors propagate to the caller."""
+        metrics = self.metrics
+        if metrics is None:
+            return self._execute_line(command_line, format_output, token, profile)
+        start = time.perf_counter_ns()
+        try:
+            result = self._execute_line(command_line, format_output, token, profile)
+        except Exception as e:
+            metrics.record(self._metric_name(command_line), time.perf_counter_ns() - start, e)
+            raise
+        metrics.record(self._metric_name(command_line), time.perf_counter_ns() - start)
+        return result
+
+    async def _execute_async(
+        self,
+        command_line: str,
+        format_output: bool = True,
+        token: Optional[CancellationToken] = None,
+        profile: Optional[ExecutionProfile] = None,
+    ) -> Any:
+        """Execute a command line on the running loop, letting errors propagate."""
+        metrics = self.metrics
+        if metrics is None:
+            return await self._execute_line_async(command_line, format_output, token, profile)
+        start = time.perf_counter_ns()
+        try:
+            result = await self._execute_line_async(command_line, format_output, token, profile)
+        except Exception as e:
+            metrics.record(self._metric_name(command_line), time.perf_counter_ns() - start, e)
+            raise
+        metrics.record(self._metric_name(command_line), time.perf_counter_ns() - start)
+        return result
+
+    def _metric_name(self, command_line: str) -> str:
+        """Get the command a line's metrics are recorded under.
+
+        Pipelines count as their first command; names of unknown commands
+        are folded together to keep the number of series bounded.
+        """
+        words = command_line.split(None, 1)
+        if words and words[0] in self.commands:
+            return words[0]
+        return "<unknown>"
+
+    def _execute_line(
+        self,
+        command_line: str,
+        format_output: bool,
+        token: Optional[CancellationToken],
+        profile: Optional[ExecutionProfile],
+    ) -> Any:
+        """Execute a command line, profiling it if requested or hooks are registered."""
+        if profile is None and self._profile_hooks:
+            profile = ExecutionProfile(command_line)
+        if profile is None:
+            return self._run_plan(self._plan(command_line), format_output, token)
+        with self._recording(profile):
+            return self._run_plan(self._plan(command_line, profile), format_output, token, profile)
+
+    async def _execute_line_async(
+        self,
+        command_line: str,
+        format_output: bool,
+        token: Optional[CancellationToken],
+        profile: Optional[ExecutionProfile],
+    ) -> Any:
+        """Execute a command line on the running loop, profiling it if requested."""
+        if profile is None and self._profile_hooks:
+            profile = ExecutionProfile(command_line)
+        if profile is None:
+            return await self._run_plan_async(self._plan(command_line), format_output, token)
+        with self._recording(profile):
+            stages = self._plan(command_line, profile)
+            return await self._run_plan_async(stages, format_output, token, profile)
+
+    @contextmanager
+    def _recording(self, profile: ExecutionProfile) -> Iterator[None]:
+        """Pass a finished profile to the hooks, noting the error it ended with."""
+        try:
+            yield
+        except BaseException as e:
+            profile.error = e
+            raise
+        finally:
+            for hook in list(self._profile_hooks):
+                hook(profile)
+
+    def _run_plan(
+        self,
+        stages: List[Tuple[Command, ParsedCommand]],
+        format_output: bool,
+        token: Optional[CancellationToken] = None,
+        profile: Optional[ExecutionProfile] = None,
+    ) -> Any:
+        """Run the stages of a pipeline, waiting for coroutine results."""
+        wait, finish = self._wait, self._finish
+        if profile is not None:
+            wait, finish = profile.timed("call", wait), profile.timed("format", finish)
+        token = self._prepare_token(stages, token)
+        result = None
+        for index, (command, parsed) in enumerate(stages):
+            result = self._call_stage(command, parsed, index, result, token, profile)
+            if inspect.isawaitable(result):
+                result = wait(result, token)
+        return finish(result, format_output)
+
+    async def _run_plan_async(
+        self,
+        stages: List[Tuple[Command, ParsedCommand]],
+        format_output: bool,
+        token: Optional[CancellationToken] = None,
+        profile: Optional[ExecutionProfile] = None,
+    ) -> Any:
+        """Run the stages of a pipeline on the running loop."""
+        token = self._prepare_token(stages, token)
+        result = None
+        for index, (command, parsed) in enumerate(stages):
+            result = self._call_stage(command, parsed, index, result, token, profile)
+            if inspect.isawaitable(result):
+                if profile is None:
+                    result = await token.guard(result)
+                else:
+                    with profile.measure("call"):
+                        result = await token.guard(result)
+        if profile is None:
+            return self._finish(result, format_output)
+        with profile.measure("format"):
+            return self._finish(result, format_output)
+
+    def _prepare_token(
+        self, stages: List[Tuple[Command, ParsedCommand]], token: Optional[CancellationToken]
+    ) -> CancellationToken:
+        """Get the token of a run, with the deadline of its strictest stage."""
+        if token is None:
+            token = CancellationToken()
+        for command, _ in stages:
+            timeout = command.timeout if command.timeout is not None else self.default_timeout
+            if timeout is not None:
+                token.limit(timeout)
+        return token
+
+    def _wait(self, awaitable: Any, token: CancellationToken) -> Any:
+        """Wait for an awaitable on the app's event loop.
+
+        From a worker thread, while the loop is serving the interactive
+        prompt, the awaitable is handed over to the loop.
+
+        Raises:
+            FastShellException: If called on the thread running the loop,
+                where waiting would block the loop forever
+        """
+        loop = self.loop
+        if loop.is_running():
+            import asyncio
+
+            if asyncio._get_running_loop() is loop:
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+                raise FastShellException(
+                    "Cannot wait for a coroutine command from code running on the event loop; "
+                    "use execute_command_async instead"
+                )
+            return asyncio.run_coroutine_threadsafe(token.guard(awaitable), loop).result()
+        return loop.run_until_complete(token.guard(awaitable))
+
+    def _plan(
+        self, command_line: str, profile: Optional[ExecutionProfile] = None
+    ) -> List[Tuple[Command, ParsedCommand]]:
+        """Parse a command line into the commands of its pipeline.
+
+        Args:
+            command_line: Command line to parse
+            profile: Profile to record the parse time and command names in
+
+        Returns:
+            (command, parsed) pairs in pipeline order; empty for a blank
+            line or the built-in help command
+        """
+        if profile is not None:
+            with profile.measure("parse"):
+                plan = self._plan(command_line)
+            profile.commands = [command.name for command, _ in plan]
+            return plan
+
+        stages = self.parser.parse_pipeline(command_line)
+        if not stages:
+            return []
+
+        # Handle built-in help command
+        if len(stages) == 1 and stages[0].command.lower() == "help":
+            self._show_help()
+            return []
+
+        return [(self.get_command(parsed.command), parsed) for parsed in stages]
+
+    def _call_stage(
+        self,
+        command: Command,
+        parsed: ParsedCommand,
+        index: int,
+        piped: Any,
+        token: CancellationToken,
+        profile: Optional[ExecutionProfile] = None,
+    ) -> Any:
+        """Call one pipeline stage, passing it the previous stage's result.
+
+        The result is bound to the command's pipe parameter as the Python
+        object itself. Iterators are passed on unconsumed, so a pipeline
+        of generators runs lazily, one item at a time; under a deadline
+        they stop once it passes.
+
+        Returns:
+            Command result, or an awaitable for coroutine commands
+        """
+        token.raise_if_cancelled()
+        if index == 0:
+            result = command.execute(parsed.args, parsed.kwargs, token=token, profile=profile)
+        elif command.pipe_parameter is None:
+            raise InvalidArguments(f"Command '{command.name}' does not accept piped input")
+        else:
+            result = command.execute(
+                parsed.args, parsed.kwargs, {command.pipe_parameter: piped}, token=token, profile=profile
+            )
+        if token.deadline is not None and isinstance(result, Iterator):
+            result = token.iterate(result)
+        return result
+
+    def _finish(self, result: Any, format_output: bool) -> Any:
+        """Format and display a command result if requested."""
+        if format_output and result is not None:
+            self.formatter.format_result(result)
+
+        return result
+
+    def run_script(
+        self,
+        source: Union[str, "os.PathLike", TextIO],
+        stop_on_error: bool = False,
+        show_summary: bool = True,
+    ) -> BatchSummary:
+        """Execute newline-delimited commands from a file or stream.
+
+        Blank lines and lines starting with '#' are skipped, and 'exit' or
+        'quit' ends the script early.
+
+        Args:
+            source: Script path, '-' for stdin, or an open text stream
+            stop_on_error: Whether to stop at the first failing command
+            show_summary: Whether to print the end-of-run summary
+
+        Returns:
+            BatchSummary describing the run
+        """
+        if isinstance(source, (str, os.PathLike)):
+            if source == "-":
+                return self._run_stream(sys.stdin, stop_on_error, show_summary)
+            with open(source, encoding="utf-8") as stream:
+                return self._run_stream(stream, stop_on_error, show_summary)
+        return self._run_stream(source, stop_on_error, show_summary)
+
+    def _run_stream(self, stream: TextIO, stop_on_error: bool, show_summary: bool) -> BatchSummary:
+        """Execute each command line read from a stream."""
+        summary = BatchSummary()
+        start = time.perf_counter()
+
+        for line_number, line in enumerate(stream, 1):
+            command_line = line.strip()
+            if not command_line or command_line.startswith("#"):
+                continue
+
+            if command_line.lower() in ["exit", "quit"]:
+                break
+
+            summary.total += 1
+            try:
+                if not self._handle_builtin(command_line):
+                    self._execute(command_line)
+                summary.succeeded += 1
+            except Exception as e:
+                summary.failed += 1
+                summary.errors.append((line_number, str(e)))
+                prefix = "Error" if isinstance(e, FastShellException) else "Unexpected error"
+                self.console.print(f"[red]{prefix} at line {line_number}: {e}[/red]")
+                if stop_on_error:
+                    summary.stopped_early = True
+                    break
+
+        summary.elapsed = time.perf_counter() - start
+
+        if show_summary:
+            status = "green" if not summary.failed else "red"
+            self.console.print(
+                f"[{status}]{summary.total} commands: {summary.succeeded} succeeded, "
+                f"{summary.failed} failed[/{status}]"
+            )
+            self.console.print(
+                f"[dim]Elapsed {summary.elapsed:.3f}s "
+                f"({summary.commands_per_second:.1f} commands/s)[/dim]"
+            )
+            if summary.stopped_early:
+                self.console.print("[dim]Stopped at first error.[/dim]")
+
+        return summary
+
+    def _handle_builtin(self, command_line: str) -> bool:
+        """Handle built-in shell commands.
+
+        Args:
+            command_line: Stripped command line
+
+        Returns:
+            True if the line was a built-in command
+        """
+        # Handle built-in format command
+        if command_line.lower().startswith("format "):
+            format_type = command_line[7:].strip()
+            if format_type in self.get_available_formats():
+                self.set_output_format(format_type)
+            else:
+                self.console.print(f"[red]Invalid format: {format_type}[/red]")
+                self.console.print(
+                    f"[dim]Available formats: {', '.join(self.get_available_formats())}[/dim]"
+                )
+            return True
+
+        if command_line.lower() == "format":
+            self.console.print(
+                f"[cyan]Current format: {self.formatter.default_format.value}[/cyan]"
+            )
+            self.console.print(
+                f"[dim]Available formats: {', '.join(self.get_available_formats())}[/dim]"
+            )
+            self.console.print("[dim]Usage: format <type>[/dim]")
+            return True
+
+        if command_line.lower().startswith("parallel "):
+            self._run_parallel(command_line)
+            return True
+
+        if command_line.lower().startswith("profile "):
+            with self._profiling(command_line[8:].strip()) as profile:
+                self._execute(profile.command_line, profile=profile)
+            return True
+
+        if command_line.lower().split() in (["stats"], ["stats", "reset"], ["stats", "export"]):
+            self._show_stats(command_line.split()[1:])
+            return True
+
+        return False
+
+    def _show_stats(self, action: List[str]) -> None:
+        """Run the 'stats [reset|export]' built-in.
+
+        'stats' shows the calls, errors and latency percentiles of each
+        command, 'stats reset' clears them and 'stats export' runs the
+        registered metrics exporters.
+        """
+        if self.metrics is None:
+            raise FastShellException("stats: metrics collection is disabled")
+        if action == ["reset"]:
+            self.metrics.reset()
+            self.console.print("[green]Metrics reset[/green]")
+        elif action == ["export"]:
+            self.metrics.export()
+            self.console.print(f"[green]Metrics exported to {len(self.metrics.exporters)} exporter(s)[/green]")
+        elif self.metrics.commands:
+            self.formatter.format_result(self.metrics.summary())
+        else:
+            self.console.print("[dim]No commands recorded[/dim]")
+
+    @contextmanager
+    def _profiling(self, command_line: str) -> Iterator[ExecutionProfile]:
+        """Run the 'profile <command line>' built-in around the execution in the block.
+
+        The execution runs under cProfile; afterwards its phase timings and
+        the functions with the highest cumulative time are printed.
+        """
+        import cProfile
+
+        from .profiling import format_stats
+
+        profile = ExecutionProfile(command_line)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profile
+        finally:
+            profiler.disable()
+            self.console.print(f"[bold]Profile of '{command_line}'[/bold]")
+            self.console.print(profile.format_table(), markup=False, highlight=False)
+            self.console.print(format_stats(profiler), markup=False, highlight=False)
+
+    async def _handle_job_builtin(self, command_line: str) -> bool:
+        """Handle the job control built-ins of the interactive shell.
+
+        '<command line> &' starts a background job; 'jobs' lists the jobs,
+        'fg [id]' waits for one and 'kill <id>' cancels one.
+
+        Args:
+            command_line: Stripped command line
+
+        Returns:
+            True if the line was a job control command
+        """
+        words = command_line.split()
+        name = words[0].lower()
+
+        if name == "jobs" and len(words) == 1:
+            if not len(self.jobs):
+                self.console.print("[dim]No jobs[/dim]")
+            for job in self.jobs.list():
+                self.console.print(job.describe())
+            self.jobs.prune()
+            return True
+
+        if name in ("fg", "kill") and len(words) <= 2:
+            job_id = self._parse_job_id(name, words[1:])
+            if name == "kill":
+                if job_id is None:
+                    raise FastShellException("Usage: kill <job id>")
+                self.jobs.kill(job_id)
+                return True
+
+            import asyncio
+
+            # The outcome is reported when the job finishes
+            await asyncio.wait({self.jobs.get(job_id).task})
+            return True
+
+        if words[-1] == "&" and list(tokenize(command_line))[-1:] == ["&"]:
+            self._start_job(command_line[:-1].rstrip())
+            return True
+
+        return False
+
+    @staticmethod
+    def _parse_job_id(name: str, words: List[str]) -> Optional[int]:
+        """Parse the optional job id ('3' or '%3') of fg and kill."""
+        if not words:
+            return None
+        try:
+            return int(words[0].lstrip("%"))
+        except ValueError:
+            raise FastShellException(f"{name}: invalid job id '{words[0]}'")
+
+    def _start_job(self, command_line: str) -> None:
+        """Run a command line as a background job.
+
+        Pipelines made only of coroutine commands run as a task on the
+        running loop; anything else runs in a worker thread so the prompt
+        stays responsive.
+        """
+        import asyncio
+
+        stages = self._plan(command_line)
+        if not stages:
+            return
+        token = CancellationToken()
+        if all(command.is_async for command, _ in stages):
+            work = self._run_plan_async(stages, True, token)
+        else:
+            work = asyncio.get_running_loop().run_in_executor(None, self._run_plan, stages, True, token)
+        job = self.jobs.submit(command_line, work, self._report_job, token)
+        self.console.print(f"[dim][{job.id}] {command_line}[/dim]")
+
+    def _report_job(self, job: "Job") -> None:
+        """Print how a background job finished."""
+        state = job.state
+        if state is JobState.FAILED:
+            self.console.print(f"[red][{job.id}] Error: {job.task.exception()}[/red]")
+        else:
+            self.console.print(
+                f"[dim][{job.id}] {state.value} after {job.elapsed:.1f}s: {job.command_line}[/dim]"
+            )
+
+    def _run_parallel(self, command_line: str) -> None:
+        """Run the 'parallel [-j N] <command> [args with {}] ::: inputs...' built-in.
+
+        Each input replaces '{}' in the argument template, or is appended
+        when the template has no '{}'.
+
+        Raises:
+            ParseError: If the line is malformed
+            FastShellException: If any of the runs failed
+        """
+        command_name, arg_sets, workers = self._parse_parallel(command_line)
+        self._check_parallel(self.execute_many(command_name, arg_sets, workers=workers))
+
+    async def _run_parallel_async(self, command_line: str) -> None:
+        """Run the 'parallel' built-in on the running event loop.
+
+        Raises:
+            ParseError: If the line is malformed
+            FastShellException: If any of the runs failed
+        """
+        command_name, arg_sets, workers = self._parse_parallel(command_line)
+        self._check_parallel(await self.execute_many_async(command_name, arg_sets, workers=workers))
+
+    @staticmethod
+    def _parse_parallel(command_line: str) -> Tuple[str, List[List[str]], int]:
+        """Parse a 'parallel' line into the command name, argument sets and workers."""
+        tokens = list(tokenize(command_line))[1:]
+        if ":::" not in tokens:
+            raise ParseError("Usage: parallel [-j N] <command> [args with {}] ::: input...")
+        separator = tokens.index(":::")
+        template, inputs = tokens[:separator], tokens[separator + 1:]
+
+        workers = 8
+        if template and template[0] in ("-j", "--jobs"):
+            try:
+                workers = int(template[1])
+            except (IndexError, ValueError):
+                raise ParseError("parallel: -j expects a number of workers")
+            template = template[2:]
+        if not template:
+            raise ParseError("parallel: missing command")
+
+        command_name, arg_template = template[0], template[1:]
+        if "{}" in arg_template:
+            arg_sets = [[value if token == "{}" else token for token in arg_template] for value in inputs]
+        else:
+            arg_sets = [arg_template + [value] for value in inputs]
+        return command_name, arg_sets, workers
+
+    @staticmethod
+    def _check_parallel(outcomes: List[ExecutionOutcome]) -> None:
+        """Report failed runs of the 'parallel' built-in."""
+        failed = sum(1 for outcome in outcomes if not outcome.ok)
+        if failed:
+            raise FastShellException(f"parallel: {failed} of {len(outcomes)} runs failed")
+
     def run_interactive(self):
         """Run the application in interactive mode."""
-        completer = FastShellCompleter(self.commands)
+        self.loop.run_until_complete(self.run_interactive_async())
+
+    async def run_interactive_async(self):
+        """Run the interactive shell on the running event loop.
+
+        The prompt and coroutine commands share the loop, so state such as
+        open connections carries over from one command to the next.
+        """
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import InMemoryHistory
+        from prompt_toolkit.patch_stdout import patch_stdout
+
+        from .completer import FastShellCompleter
+
+        completer = FastShellCompleter(
+            self.commands,
+            self.command_index,
+            fuzzy=self.fuzzy_completion,
+            resolve=self.get_command,
+        )
         history = InMemoryHistory()
 
         self.session = PromptSession(
@@ -140,59 +1015,90 @@ class FastShell:
             self.console.print(f"[dim]{self.description}[/dim]")
         self.console.print("Type 'help' for available commands or 'exit' to quit.\n")
 
-        while True:
-            try:
-                command_line = self.session.prompt(f"{self.name}> ")
-                command_line = command_line.strip()
+        # Output of background jobs is drawn above the prompt
+        with patch_stdout(raw=True):
+            while True:
+                try:
+                    command_line = await self.session.prompt_async(f"{self.name}> ")
+                    command_line = command_line.strip()
 
-                if not command_line:
-                    continue
+                    if not command_line:
+                        continue
 
-                if command_line.lower() in ["exit", "quit"]:
-                    break
+                    if command_line.lower() in ["exit", "quit"]:
+                        break
 
-                if command_line.lower() == "help":
-                    self._show_help()
-                    continue
+                    if command_line.lower() == "help":
+                        self._show_help()
+                        continue
 
-                # Handle built-in format command
-                if command_line.lower().startswith("format "):
-                    format_type = command_line[7:].strip()
-                    if format_type in self.get_available_formats():
-                        self.set_output_format(format_type)
-                    else:
-                        self.console.print(f"[red]Invalid format: {format_type}[/red]")
-                        self.console.print(
-                            f"[dim]Available formats: {', '.join(self.get_available_formats())}[/dim]"
-                        )
-                    continue
+                    if await self._handle_job_builtin(command_line):
+                        continue
 
-                if command_line.lower() == "format":
-                    self.console.print(
-                        f"[cyan]Current format: {self.formatter.default_format.value}[/cyan]"
-                    )
-                    self.console.print(
-                        f"[dim]Available formats: {', '.join(self.get_available_formats())}[/dim]"
-                    )
-                    self.console.print("[dim]Usage: format <type>[/dim]")
-                    continue
+                    token = CancellationToken()
+                    if command_line.lower().startswith("profile "):
+                        with self._profiling(command_line[8:].strip()) as profile, \
+                                self._interrupt_cancels(token):
+                            await self._execute_async(profile.command_line, True, token, profile)
+                        continue
 
-                self.execute_command(command_line)
+                    # The loop is running, so fan-out must not block on it
+                    if command_line.lower().startswith("parallel "):
+                        await self._run_parallel_async(command_line)
+                        continue
 
-            except KeyboardInterrupt:
-                continue
-            except EOFError:
-                break
+                    if self._handle_builtin(command_line):
+                        continue
+
+                    with self._interrupt_cancels(token):
+                        await self.execute_command_async(command_line, token=token)
+
+                except KeyboardInterrupt:
+                    continue
+                except EOFError:
+                    break
+                except FastShellException as e:
+                    self.console.print(f"[red]Error: {e}[/red]")
+                except Exception as e:
+                    self.console.print(f"[red]Unexpected error: {e}[/red]")
 
         self.console.print("\n[dim]Goodbye![/dim]")
 
+    @contextmanager
+    def _interrupt_cancels(self, token: CancellationToken) -> Iterator[None]:
+        """Make Ctrl-C cancel the command running under token instead of the shell.
+
+        A coroutine command is cancelled where it awaits; sync code is
+        interrupted with CommandCancelled, which is reported like any other
+        command error.
+        """
+        import signal
+        import threading
+
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+
+        import asyncio
+
+        def interrupt(signum, frame):
+            # Only raise inside the command's own code, never from the loop's internals
+            if not token.cancel() and asyncio.current_task() is not None:
+                raise CommandCancelled("Command cancelled")
+
+        previous = signal.signal(signal.SIGINT, interrupt)
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGINT, previous)
+
     def set_output_format(self, format_type: str) -> None:
         """Set the output format for command results.
 
         Args:
-            format_type: Output format (auto, json, table, tree, plain, pretty)
+            format_type: Output format (auto, json, table, tree, plain, pretty, summary)
         """
-        self.formatter = create_formatter(self.console, format_type)
+        self.formatter = create_formatter(self.console, format_type, **self.formatter_options)
         self.console.print(f"[green]Output format set to: {format_type}[/green]")
 
     def get_available_formats(self) -> List[str]:
@@ -206,17 +1112,31 @@ class FastShell:
     def run(self, args: Optional[List[str]] = None):
         """Run the application.
 
+        Passing '--batch [PATH]' runs a script of commands from PATH (or
+        stdin when omitted) in this process; add '--stop-on-error' to stop
+        at the first failure. The process exits with status 1 if any
+        command in the script failed.
+
         Args:
             args: Command line arguments (defaults to sys.argv[1:])
         """
         if args is None:
             args = sys.argv[1:]
 
-        if not args:
-            self.run_interactive()
-        else:
-            command_line = " ".join(args)
-            self.execute_command(command_line)
+        try:
+            if not args:
+                self.run_interactive()
+            elif args[0] == "--batch":
+                options = [arg for arg in args[1:] if arg == "--stop-on-error"]
+                paths = [arg for arg in args[1:] if arg != "--stop-on-error"]
+                summary = self.run_script(paths[0] if paths else "-", stop_on_error=bool(options))
+                if summary.failed:
+                    sys.exit(1)
+            else:
+                command_line = " ".join(args)
+                self.execute_command(command_line)
+        finally:
+            self.close()
 
     def _show_help(self):
         """Show help information."""
@@ -236,3 +1156,5 @@ class FastShell:
             f"[dim]Available formats: {', '.join(self.get_available_formats())}[/dim]"
         )
         self.console.print("[dim]Use 'format <type>' to change output format.[/dim]")
+        self.console.print("[dim]Use 'profile <command line>' to time a command.[/dim]")
+        self.console.print("[dim]Use 'stats' to show command call counts and latencies.[/dim]")
@@ -0,0 +1,154 @@
+"""On-disk cache of command metadata for FastShell."""
+
+import inspect
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from .types import Parameter
+
+# Bump when the layout of cached entries changes
+CACHE_FORMAT = 2
+
+
+class MetadataCache:
+    """Persistent cache of the metadata derived from command functions.
+
+    Stores each function's description and parameter list so that warm
+    starts skip signature inspection, type hint evaluation and docstring
+    parsing. Entries are keyed by module and qualified name and are only
+    used while the defining file's modification time and size are
+    unchanged.
+
+    The cache file is a pickle and must only be read from a trusted
+    location.
+    """
+
+    def __init__(self, path: "os.PathLike"):
+        """Initialize the cache, loading the file if it exists.
+
+        Args:
+            path: Location of the cache file
+        """
+        self.path = os.fspath(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple[int, int], bytes]] = self._load()
+        self._stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[Tuple[str, str], Tuple[Tuple[int, int], bytes]]:
+        """Read the cache file, ignoring missing or unreadable files."""
+        try:
+            with open(self.path, 'rb') as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return {}
+        return entries if version == CACHE_FORMAT else {}
+
+    def _stamp(self, filename: str) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of a source file, once per file."""
+        if filename not in self._stamps:
+            try:
+                stat = os.stat(filename)
+                self._stamps[filename] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self._stamps[filename] = None
+        return self._stamps[filename]
+
+    @staticmethod
+    def _locate(func: Any) -> Optional[Tuple[Tuple[str, str], str]]:
+        """Get the cache key of a function and the file it is defined in.
+
+        Functions defined inside other functions and lambdas are not
+        cached: functions built by one factory share a qualified name but
+        may differ in docstring and annotations. Decorated functions are
+        unwrapped so that edits to the module defining them invalidate
+        their entry.
+
+        Returns:
+            (key, filename), or None if the function is not cacheable
+        """
+        qualname = getattr(func, '__qualname__', '')
+        if '<locals>' in qualname or '<lambda>' in qualname:
+            return None
+        code = getattr(inspect.unwrap(func), '__code__', None)
+        if code is None:
+            return None
+        return (func.__module__, qualname), code.co_filename
+
+    def get(self, func: Any) -> Optional[Tuple[str, List[Parameter]]]:
+        """Look up the metadata of a function.
+
+        Args:
+            func: Command function
+
+        Returns:
+            (description, parameters), or None on a miss or stale entry
+        """
+        location = self._locate(func)
+        if location is None:
+            return None
+        key, filename = location
+        entry = self._entries.get(key)
+        stamp = self._stamp(filename)
+        if entry is not None and stamp is not None and entry[0] == stamp:
+            try:
+                result = pickle.loads(entry[1])
+            except Exception:
+                pass
+            else:
+                self.hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    def put(self, func: Any, description: str, parameters: List[Parameter]) -> None:
+        """Store the metadata of a function.
+
+        Nested functions, lambdas, functions whose source file cannot be
+        stat'ed and functions whose parameters cannot be pickled (e.g. a
+        lambda default) are not cached.
+
+        Args:
+            func: Command function
+            description: Command description
+            parameters: Parameters derived from the function
+        """
+        location = self._locate(func)
+        if location is None:
+            return
+        key, filename = location
+        stamp = self._stamp(filename)
+        if stamp is None:
+            return
+        try:
+            data = pickle.dumps((description, parameters), pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        self._entries[key] = (stamp, data)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if it changed.
+
+        The file is replaced atomically so that concurrent starts never
+        read a partially written cache.
+        """
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.fastshell-cache-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((CACHE_FORMAT, self._entries), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
@@ -0,0 +1,149 @@
+"""Cooperative cancellation and deadlines for FastShell commands."""
+
+import time
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from .exceptions import CommandCancelled, CommandTimeout
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class CancellationToken:
+    """Signals a running command that it should stop.
+
+    A command function receives the token of its run by annotating a
+    parameter with this class. Long-running sync commands should check
+    ``cancelled`` or call ``raise_if_cancelled()`` regularly; coroutine
+    commands are cancelled where they await. The token is cancelled by
+    Ctrl-C in the interactive shell, by ``kill`` for background jobs, or
+    when its deadline passes.
+    """
+
+    __slots__ = ('deadline', 'timeout', '_cancelled', '_task')
+
+    def __init__(self, timeout: Optional[float] = None):
+        """Initialize token.
+
+        Args:
+            timeout: Seconds from now until the deadline, if any
+        """
+        self.deadline: Optional[float] = None
+        self.timeout: Optional[float] = None
+        self._cancelled = False
+        # Awaitable of the running command, cancelled together with the token
+        self._task: Optional["asyncio.Future"] = None
+        if timeout is not None:
+            self.limit(timeout)
+
+    def limit(self, timeout: float) -> None:
+        """Move the deadline to at most timeout seconds from now.
+
+        Args:
+            timeout: Seconds from now
+        """
+        deadline = time.monotonic() + timeout
+        if self.deadline is None or deadline < self.deadline:
+            self.deadline = deadline
+            self.timeout = timeout
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the command should stop, by cancellation or deadline."""
+        return self._cancelled or self.expired
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self) -> bool:
+        """Cancel the command.
+
+        Thread-safe. Interrupts the awaitable the command is waiting on, if
+        any.
+
+        Returns:
+            True if a pending awaitable was interrupted
+        """
+        self._cancelled = True
+        task = self._task
+        if task is None or task.done():
+            return False
+        task.get_loop().call_soon_threadsafe(task.cancel)
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """Stop the command if it was cancelled or ran out of time.
+
+        Raises:
+            CommandTimeout: If the deadline has passed
+            CommandCancelled: If the token was cancelled
+        """
+        if self._cancelled:
+            raise CommandCancelled("Command cancelled")
+        if self.expired:
+            raise CommandTimeout(f"Command timed out after {self.timeout:g}s")
+
+    async def guard(self, awaitable: Any) -> Any:
+        """Await the result of a coroutine command under this token.
+
+        Args:
+            awaitable: Awaitable returned by the command
+
+        Returns:
+            Its result
+
+        Raises:
+            CommandTimeout: If the deadline passes first
+            CommandCancelled: If the token is cancelled first
+        """
+        import asyncio
+
+        self.raise_if_cancelled()
+        task = asyncio.ensure_future(awaitable)
+        self._task = task
+        try:
+            return await asyncio.wait_for(task, self.remaining)
+        except asyncio.TimeoutError:
+            # A timeout raised by the command itself is its own error
+            if not self.expired or not task.cancelled():
+                raise
+            raise CommandTimeout(f"Command timed out after {self.timeout:g}s") from None
+        except asyncio.CancelledError:
+            if self._cancelled and not _cancelling():
+                raise CommandCancelled("Command cancelled") from None
+            raise
+        finally:
+            self._task = None
+
+    def iterate(self, items: Iterator) -> Iterator:
+        """Pass items through, stopping once the token is cancelled.
+
+        Enforces the deadline on streamed results between items.
+
+        Args:
+            items: Iterator returned by the command
+
+        Yields:
+            The items
+        """
+        for item in items:
+            self.raise_if_cancelled()
+            yield item
+
+
+def _cancelling() -> bool:
+    """Whether the current task itself is being cancelled (Python 3.11+)."""
+    import asyncio
+
+    task = asyncio.current_task()
+    cancelling = getattr(task, 'cancelling', None)
+    return bool(cancelling and cancelling())
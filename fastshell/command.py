@@ -1,13 +1,26 @@
 """Command class for FastShell."""
 
+import importlib
 import inspect
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, get_type_hints
 from dataclasses import dataclass
 
-from .types import Parameter, ParameterType
-from .exceptions import InvalidArguments
-from .utils import parse_docstring, convert_value
-from .validation import validate_and_convert, ValidationConfig
+from .index import PrefixIndex
+from .files import load_file_argument, unwrap_optional
+from .cancellation import CancellationToken
+from .types import FileReference, Parameter, ParameterType
+from .exceptions import CommandNotFound, InvalidArguments
+from .utils import parse_docstring, get_converter
+from .validation import validate_and_convert
+
+if TYPE_CHECKING:
+    from .cache import MetadataCache
+    from .profiling import ExecutionProfile
+
+
+def _is_injected(param_type: Any) -> bool:
+    """Check if a parameter of this type is supplied by the shell."""
+    return isinstance(param_type, type) and issubclass(param_type, CancellationToken)
 
 
 @dataclass
@@ -19,23 +32,112 @@ class Command:
     description: Optional[str] = None
     parameters: List[Parameter] = None
     use_pydantic: bool = True  # Enable Pydantic validation by default
+    pipe: Optional[str] = None  # Parameter receiving piped input (default: first argument)
+    timeout: Optional[float] = None  # Seconds before the command is cancelled
     
     def __post_init__(self):
         if self.parameters is None:
             self.parameters = []
+        self.compile()
+    
+    def compile(self) -> None:
+        """Precompute the argument binding plan.
+        
+        Builds the name-to-slot maps, one converter per parameter and the
+        defaults used to fill in omitted values, so that binding a call does
+        no per-parameter lookups. Call again after changing ``parameters``
+        or ``use_pydantic``.
+        """
+        self._arg_params = [p for p in self.parameters if p.parameter_type == ParameterType.ARGUMENT]
+        self._option_params = {p.name: p for p in self.parameters if p.parameter_type == ParameterType.OPTION}
+        self._arg_slots = {p.name: i for i, p in enumerate(self._arg_params)}
+        self._params_by_name = {p.name: p for p in self.parameters}
+        # Option names as typed on the command line, for completion
+        self.option_index = PrefixIndex(
+            (p.name.replace('_', '-'), p) for p in self._option_params.values()
+        )
+        self._converters = {
+            p.name: self._make_converter(p)
+            for p in self.parameters if p.parameter_type != ParameterType.INJECTED
+        }
+        self._arg_converters = [self._converters[p.name] for p in self._arg_params]
+        self._arg_defaults = [(p.name, p.required, p.default) for p in self._arg_params]
+        self.is_async = inspect.iscoroutinefunction(self.func)
+        self._option_defaults = [
+            (p.name, p.default) for p in self._option_params.values() if p.default is not None
+        ]
+        if self.pipe is not None and self.pipe not in self._params_by_name:
+            raise ValueError(f"Command '{self.name}' has no parameter named '{self.pipe}'")
+        self.pipe_parameter = self.pipe or (self._arg_params[0].name if self._arg_params else None)
+        self.token_parameter = next(
+            (p.name for p in self.parameters if p.parameter_type == ParameterType.INJECTED), None
+        )
+    
+    def get_parameter(self, name: str) -> Optional[Parameter]:
+        """Get a parameter by name.
+        
+        Args:
+            name: Parameter name
+            
+        Returns:
+            Parameter instance, or None if the command has no such parameter
+        """
+        return self._params_by_name.get(name)
+    
+    def _make_converter(self, param: Parameter) -> Callable[[str], Any]:
+        """Create the value converter for a parameter."""
+        param_type = param.type
+        if self.use_pydantic:
+            param_name = param.name
+            return lambda value: validate_and_convert(value, param_type, param_name)
+        return get_converter(param_type)
     
     @classmethod
-    def from_function(cls, func: Callable, name: str, **kwargs) -> "Command":
+    def from_function(
+        cls,
+        func: Callable,
+        name: str,
+        metadata_cache: Optional["MetadataCache"] = None,
+        **kwargs
+    ) -> "Command":
         """Create a Command from a function.
         
         Args:
             func: Function to wrap
             name: Command name
+            metadata_cache: Cache to read the derived metadata from and
+                store it in, skipping inspection on a hit
             **kwargs: Additional command options
             
         Returns:
             Command instance
         """
+        cached = metadata_cache.get(func) if metadata_cache is not None else None
+        if cached is None:
+            description, parameters = cls.inspect_function(func)
+            if metadata_cache is not None:
+                metadata_cache.put(func, description, parameters)
+        else:
+            description, parameters = cached
+        
+        return cls(
+            name=name,
+            func=func,
+            description=description,
+            parameters=parameters,
+            **kwargs
+        )
+    
+    @staticmethod
+    def inspect_function(func: Callable) -> Tuple[str, List[Parameter]]:
+        """Derive a command description and parameters from a function.
+        
+        Args:
+            func: Function to inspect
+            
+        Returns:
+            Tuple of description and parameter list
+        """
         # Parse docstring
         docstring_info = parse_docstring(func.__doc__ or "")
         description = docstring_info.get("description", "")
@@ -49,10 +151,25 @@ class Command:
         parameters = []
         param_list = list(sig.parameters.items())
         
+        # Parameters supplied by the shell are not on the command line
+        injected = {
+            name for name, _ in param_list if _is_injected(type_hints.get(name))
+        }
+        
         for i, (param_name, param) in enumerate(param_list):
             param_type = type_hints.get(param_name, str)
             param_doc = param_docs.get(param_name, "")
             
+            if param_name in injected:
+                parameters.append(Parameter(
+                    name=param_name,
+                    type=param_type,
+                    description=param_doc,
+                    required=False,
+                    parameter_type=ParameterType.INJECTED
+                ))
+                continue
+            
             # Determine parameter type
             # Parameters without defaults are always ARGUMENT
             # Parameters with defaults are ARGUMENT if they come before any OPTION
@@ -65,7 +182,8 @@ class Command:
                 # Check if all remaining parameters have defaults
                 remaining_params = param_list[i:]
                 all_remaining_have_defaults = all(
-                    p[1].default != inspect.Parameter.empty for p in remaining_params
+                    p[1].default != inspect.Parameter.empty
+                    for p in remaining_params if p[0] not in injected
                 )
                 
                 if all_remaining_have_defaults:
@@ -88,23 +206,28 @@ class Command:
                 parameter_type=ptype
             ))
         
-        return cls(
-            name=name,
-            func=func,
-            description=description,
-            parameters=parameters,
-            **kwargs
-        )
+        return description, parameters
     
-    def execute(self, args: List[str], kwargs: Dict[str, str]) -> Any:
+    def execute(
+        self,
+        args: List[str],
+        kwargs: Dict[str, str],
+        preset: Optional[Dict[str, Any]] = None,
+        token: Optional[CancellationToken] = None,
+        profile: Optional["ExecutionProfile"] = None,
+    ) -> Any:
         """Execute the command with given arguments.
         
         Args:
             args: Positional arguments
             kwargs: Keyword arguments
+            preset: Values bound by name as-is, without conversion
+            token: Cancellation token passed to a command that takes one
+            profile: Profile to record the bind, validate and call times in
             
         Returns:
-            Function execution result
+            Function execution result, or a coroutine to await if the
+            command is an ``async def`` function
             
         Raises:
             InvalidArguments: If arguments are invalid
@@ -117,90 +240,172 @@ class Command:
             return
             
         try:
-            # Convert arguments to proper types
-            converted_args = []
-            converted_kwargs = {}
-            
-            # Get parameter lists
-            arg_params = [p for p in self.parameters if p.parameter_type == ParameterType.ARGUMENT]
-            option_params = {p.name: p for p in self.parameters if p.parameter_type == ParameterType.OPTION}
-            
-            # First, handle keyword arguments to know which parameters are already provided
-            provided_as_kwargs = set()
-            for key, value in kwargs.items():
-                provided_as_kwargs.add(key)
-                if key in option_params:
-                    param = option_params[key]
-                    if self.use_pydantic:
-                        converted_value = validate_and_convert(value, param.type, param.name)
-                    else:
-                        converted_value = convert_value(value, param.type)
-                    converted_kwargs[key] = converted_value
-                else:
-                    # Check if it's an argument parameter provided as keyword
-                    arg_param = next((p for p in arg_params if p.name == key), None)
-                    if arg_param:
-                        if self.use_pydantic:
-                            converted_value = validate_and_convert(value, arg_param.type, arg_param.name)
-                        else:
-                            converted_value = convert_value(value, arg_param.type)
-                        converted_kwargs[key] = converted_value
-                    else:
-                        # Unknown option
-                        converted_kwargs[key] = value
-            
-            # Handle positional arguments
-            # If any argument parameter is provided as keyword, convert all to kwargs
-            if any(p.name in provided_as_kwargs for p in arg_params):
-                # Convert all positional args to keyword args
-                available_arg_params = [p for p in arg_params if p.name not in provided_as_kwargs]
-                for i, arg in enumerate(args):
-                    if i < len(available_arg_params):
-                        param = available_arg_params[i]
-                        if self.use_pydantic:
-                            converted_value = validate_and_convert(arg, param.type, param.name)
-                        else:
-                            converted_value = convert_value(arg, param.type)
-                        converted_kwargs[param.name] = converted_value
-                    else:
-                        # Extra positional arguments - this shouldn't happen in well-formed commands
-                        converted_args.append(arg)
-            else:
-                # Normal positional argument handling
-                for i, arg in enumerate(args):
-                    if i < len(arg_params):
-                        param = arg_params[i]
-                        if self.use_pydantic:
-                            converted_value = validate_and_convert(arg, param.type, param.name)
-                        else:
-                            converted_value = convert_value(arg, param.type)
-                        converted_args.append(converted_value)
-                    else:
-                        # Extra positional arguments
-                        converted_args.append(arg)
+            if profile is None:
+                converted_args, converted_kwargs = self.bind(args, kwargs, preset, token)
                 
-                # Handle missing arguments (add defaults for non-required ones)
-                for i in range(len(args), len(arg_params)):
-                    param = arg_params[i]
-                    if param.required:
-                        raise InvalidArguments(f"Missing required argument: {param.name}")
-                    else:
-                        # Add default value for optional argument
-                        converted_args.append(param.default)
-            
-            # Add default values for missing options
-            for param in option_params.values():
-                if param.name not in converted_kwargs and param.default is not None:
-                    converted_kwargs[param.name] = param.default
+                # Execute function
+                return self.func(*converted_args, **converted_kwargs)
             
-            # Execute function
-            return self.func(*converted_args, **converted_kwargs)
+            phases = profile.phases
+            validated = phases['validate']
+            with profile.measure('bind'):
+                converted_args, converted_kwargs = self.bind(args, kwargs, preset, token, profile)
+            # Conversions ran inside bind and are counted separately
+            phases['bind'] -= phases['validate'] - validated
+            with profile.measure('call'):
+                return self.func(*converted_args, **converted_kwargs)
             
         except TypeError as e:
             raise InvalidArguments(f"Invalid arguments: {e}")
         except ValueError as e:
             raise InvalidArguments(f"Type conversion error: {e}")
     
+    def bind(
+        self,
+        args: List[str],
+        kwargs: Dict[str, str],
+        preset: Optional[Dict[str, Any]] = None,
+        token: Optional[CancellationToken] = None,
+        profile: Optional["ExecutionProfile"] = None,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Convert raw command line values into call arguments.
+        
+        Args:
+            args: Positional arguments
+            kwargs: Keyword arguments
+            preset: Values bound by name as-is, without conversion, such as
+                the result piped in from the previous command
+            token: Cancellation token for a command that takes one; a new
+                token is created if omitted
+            profile: Profile to add the time spent converting values to
+            
+        Returns:
+            Tuple of converted positional and keyword arguments
+            
+        Raises:
+            InvalidArguments: If a required argument is missing or a preset
+                parameter is also given on the command line
+        """
+        for value in args:
+            if value.__class__ is FileReference:
+                args, kwargs, preset = self._load_files(args, kwargs, preset)
+                break
+        else:
+            for value in kwargs.values():
+                if value.__class__ is FileReference:
+                    args, kwargs, preset = self._load_files(args, kwargs, preset)
+                    break
+        
+        converters = self._converters
+        arg_converters = self._arg_converters
+        if profile is not None:
+            converters = {
+                name: profile.timed('validate', converter) for name, converter in converters.items()
+            }
+            arg_converters = [converters[p.name] for p in self._arg_params]
+        converted_args = []
+        converted_kwargs = {}
+        
+        # First, handle keyword arguments to know which parameters are already provided
+        provided_args = None
+        for key, value in kwargs.items():
+            converter = converters.get(key)
+            if converter is None:
+                # Unknown option
+                converted_kwargs[key] = value
+                continue
+            converted_kwargs[key] = converter(value)
+            if key in self._arg_slots:
+                if provided_args is None:
+                    provided_args = set()
+                provided_args.add(key)
+        
+        if preset:
+            for key, value in preset.items():
+                if key in converted_kwargs:
+                    raise InvalidArguments(f"Parameter '{key}' is already supplied by the pipeline")
+                converted_kwargs[key] = value
+                if key in self._arg_slots:
+                    if provided_args is None:
+                        provided_args = set()
+                    provided_args.add(key)
+        
+        # Handle positional arguments
+        if provided_args or self.token_parameter is not None:
+            # An argument parameter was provided as keyword, or the injected
+            # token may sit between arguments - bind the rest by name
+            taken = provided_args or ()
+            remaining = (p for p in self._arg_params if p.name not in taken)
+            for arg in args:
+                param = next(remaining, None)
+                if param is None:
+                    # Extra positional arguments - this shouldn't happen in well-formed commands
+                    converted_args.append(arg)
+                else:
+                    converted_kwargs[param.name] = converters[param.name](arg)
+        else:
+            for i, arg in enumerate(args):
+                if i < len(arg_converters):
+                    converted_args.append(arg_converters[i](arg))
+                else:
+                    # Extra positional arguments
+                    converted_args.append(arg)
+            
+            # Handle missing arguments (add defaults for non-required ones)
+            for name, required, default in self._arg_defaults[len(args):]:
+                if required:
+                    raise InvalidArguments(f"Missing required argument: {name}")
+                converted_args.append(default)
+        
+        # Add default values for missing options
+        for name, default in self._option_defaults:
+            if name not in converted_kwargs:
+                converted_kwargs[name] = default
+        
+        if self.token_parameter is not None:
+            converted_kwargs[self.token_parameter] = token if token is not None else CancellationToken()
+        
+        return converted_args, converted_kwargs
+    
+    def _load_files(
+        self, args: List[str], kwargs: Dict[str, str], preset: Optional[Dict[str, Any]]
+    ) -> Tuple[List[str], Dict[str, str], Optional[Dict[str, Any]]]:
+        """Replace @file tokens by the contents of the files they name.
+        
+        Text contents are put back in place and converted as usual; binary
+        contents for bytes and memoryview parameters are bound unconverted
+        through the preset.
+        """
+        # Parameters the positional arguments bind to, as in bind()
+        taken = set(kwargs) | set(preset or ())
+        if taken & self._arg_slots.keys():
+            positional = [p for p in self._arg_params if p.name not in taken]
+        else:
+            positional = self._arg_params
+        
+        loaded = dict(preset) if preset else {}
+        new_args = []
+        for i, value in enumerate(args):
+            param = positional[i] if i < len(positional) else None
+            if value.__class__ is not FileReference:
+                new_args.append(value)
+            elif param is not None and unwrap_optional(param.type) in (bytes, memoryview):
+                loaded[param.name] = load_file_argument(value.path, param.type)
+            else:
+                new_args.append(load_file_argument(value.path, param.type if param else str))
+        
+        new_kwargs = {}
+        for key, value in kwargs.items():
+            param = self._params_by_name.get(key)
+            if value.__class__ is not FileReference:
+                new_kwargs[key] = value
+            elif param is not None and unwrap_optional(param.type) in (bytes, memoryview):
+                loaded[key] = load_file_argument(value.path, param.type)
+            else:
+                new_kwargs[key] = load_file_argument(value.path, param.type if param else str)
+        
+        return new_args, new_kwargs, loaded
+    
     def get_help(self) -> str:
         """Get help text for the command.
         
@@ -219,7 +424,8 @@ class Command:
         # Usage
         usage_parts = [self.name]
         
-        for param in self.parameters:
+        visible = [p for p in self.parameters if p.parameter_type != ParameterType.INJECTED]
+        for param in visible:
             if param.parameter_type == ParameterType.ARGUMENT:
                 if param.required:
                     usage_parts.append(f"<{param.name}>")
@@ -231,15 +437,15 @@ class Command:
         lines.append(f"Usage: {' '.join(usage_parts)}")
         
         # Parameters
-        if self.parameters:
+        if visible:
             lines.append("\nParameters:")
             
             # Calculate max width for alignment
-            max_name_width = max(len(param.name) for param in self.parameters)
-            type_names = [format_type_name(param.type) for param in self.parameters]
+            max_name_width = max(len(param.name) for param in visible)
+            type_names = [format_type_name(param.type) for param in visible]
             max_type_width = max(len(name) for name in type_names) if type_names else 0
             
-            for param in self.parameters:
+            for param in visible:
                 # Format parameter name with proper alignment
                 name_part = f"  {param.name:<{max_name_width}}"
                 
@@ -271,4 +477,52 @@ class Command:
                 
                 lines.append(param_line)
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
+
+
+@dataclass
+class LazyCommand:
+    """Placeholder for a command whose module is imported on first use.
+    
+    Holds only what listing a command needs, so registering many commands
+    imports none of their modules.
+    """
+    
+    name: str
+    module: str
+    description: Optional[str] = None
+    attribute: Optional[str] = None  # Function name in the module (default: name)
+    
+    def resolve(self, registry: Dict[str, Any], **kwargs) -> Command:
+        """Import the command's module and build the command.
+        
+        Modules that register their commands with ``@app.command`` replace
+        the placeholder in the registry while being imported; that command
+        is used as is.
+        
+        Args:
+            registry: Commands of the application, by name
+            **kwargs: Additional command options
+            
+        Returns:
+            Command instance
+            
+        Raises:
+            CommandNotFound: If the module cannot be imported or does not
+                define the command
+        """
+        try:
+            module = importlib.import_module(self.module)
+        except ImportError as e:
+            raise CommandNotFound(f"Command '{self.name}' could not be loaded: {e}") from e
+        
+        registered = registry.get(self.name)
+        if isinstance(registered, Command):
+            return registered
+        
+        func = getattr(module, self.attribute or self.name.replace('-', '_'), None)
+        if func is None:
+            raise CommandNotFound(f"Command '{self.name}' not found in module '{self.module}'")
+        if isinstance(func, Command):
+            return func
+        return Command.from_function(func, self.name, **kwargs)
@@ -1,24 +1,52 @@
 """Auto-completion for FastShell."""
 
-from typing import Dict, Iterable
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
-from .command import Command
+from .command import Command, LazyCommand
+from .index import IndexedDict, PrefixIndex
 from .parser import CommandParser
 from .types import ParameterType
+from .utils import get_enum_lookup
 
 
 class FastShellCompleter(Completer):
     """Auto-completer for FastShell commands and parameters."""
     
-    def __init__(self, commands: Dict[str, Command]):
+    def __init__(
+        self,
+        commands: Dict[str, Command],
+        command_index: Optional[PrefixIndex] = None,
+        fuzzy: bool = False,
+        max_results: int = 50,
+        resolve: Optional[Callable[[str], Command]] = None,
+    ):
         """Initialize completer.
         
         Args:
             commands: Dictionary of available commands
+            command_index: Prefix index over the command names (that of
+                an IndexedDict of commands, or built from commands, if
+                omitted)
+            fuzzy: Match command and option names as subsequences, ranked
+                by score, instead of by prefix
+            max_results: Maximum number of fuzzy completions per keystroke
+            resolve: Loads a lazily registered command by name; without
+                it only the names of such commands are completed
         """
         self.commands = commands
+        if command_index is None:
+            command_index = commands.index if isinstance(commands, IndexedDict) else PrefixIndex()
+        self.command_index = command_index
+        # An IndexedDict keeps its own index in step; other dicts are
+        # compared with the names the index was last synced with
+        self._mirrored = isinstance(commands, IndexedDict) and commands.index is command_index
+        self._indexed_names = frozenset()
+        self.fuzzy = fuzzy
+        self.max_results = max_results
+        self.resolve = resolve
         self.parser = CommandParser()
     
     def get_completions(self, document: Document, complete_event) -> Iterable[Completion]:
@@ -47,6 +75,13 @@ class FastShellCompleter(Completer):
         # Complete command parameters
         if parsed.command in self.commands:
             command = self.commands[parsed.command]
+            if isinstance(command, LazyCommand):
+                if self.resolve is None:
+                    return
+                try:
+                    command = self.resolve(parsed.command)
+                except Exception:
+                    return
             yield from self._complete_parameters(command, parsed, text)
     
     def _complete_commands(self, text: str) -> Iterable[Completion]:
@@ -60,15 +95,52 @@ class FastShellCompleter(Completer):
         """
         word = text.strip().split()[-1] if text.strip() else ""
         
-        for command_name, command in self.commands.items():
-            if command_name.startswith(word):
+        # Comparing the key sets catches a removal paired with an addition
+        if not self._mirrored and self.commands.keys() != self._indexed_names:
+            self._sync_command_index()
+        
+        for command_name, score in self._match(self.command_index, word):
+            command = self.commands.get(command_name)
+            if command is not None:
                 display_meta = command.description or "No description"
+                if score is not None:
+                    display_meta += f" (score {score})"
                 yield Completion(
                     command_name,
                     start_position=-len(word),
                     display_meta=display_meta
                 )
     
+    def _match(self, index: PrefixIndex, word: str) -> Iterator[Tuple[str, Optional[int]]]:
+        """Find index keys matching the word being typed.
+        
+        Args:
+            index: Index to search
+            word: Current word
+            
+        Yields:
+            (key, score) pairs; score is None for prefix matches
+        """
+        if not self.fuzzy:
+            for key in index.keys_with_prefix(word):
+                yield key, None
+        elif not word:
+            for key in islice(index.keys_with_prefix(word), self.max_results):
+                yield key, None
+        else:
+            for score, key, _ in index.fuzzy_search(word, self.max_results):
+                yield key, score
+    
+    def _sync_command_index(self) -> None:
+        """Bring the index in line with commands added to or removed from the dict directly."""
+        for name in list(self.command_index.keys_with_prefix("")):
+            if name not in self.commands:
+                self.command_index.remove(name)
+        for name in self.commands:
+            if name not in self.command_index:
+                self.command_index.add(name)
+        self._indexed_names = frozenset(self.commands)
+    
     def _complete_parameters(self, command: Command, parsed, text: str) -> Iterable[Completion]:
         """Complete command parameters.
         
@@ -111,22 +183,21 @@ class FastShellCompleter(Completer):
         prefix = "--" if current_word.startswith('--') else "-"
         word = current_word.lstrip('-')
         
-        for param in command.parameters:
-            if param.parameter_type == ParameterType.OPTION:
-                option_name = param.name.replace('_', '-')
-                
-                if option_name.startswith(word):
-                    completion_text = f"{prefix}{option_name}"
-                    display_meta = param.description or f"{param.type.__name__}"
-                    
-                    if param.is_flag:
-                        display_meta += " (flag)"
-                    
-                    yield Completion(
-                        completion_text,
-                        start_position=-len(current_word),
-                        display_meta=display_meta
-                    )
+        for option_name, score in self._match(command.option_index, word):
+            param = command.option_index.get(option_name)
+            completion_text = f"{prefix}{option_name}"
+            display_meta = param.description or f"{param.type.__name__}"
+            
+            if param.is_flag:
+                display_meta += " (flag)"
+            if score is not None:
+                display_meta += f" (score {score})"
+            
+            yield Completion(
+                completion_text,
+                start_position=-len(current_word),
+                display_meta=display_meta
+            )
     
     def _complete_option_values(self, command: Command, option_name: str, current_word: str) -> Iterable[Completion]:
         """Complete option values.
@@ -140,11 +211,7 @@ class FastShellCompleter(Completer):
             Option value completions
         """
         # Find the parameter
-        param = None
-        for p in command.parameters:
-            if p.name == option_name:
-                param = p
-                break
+        param = command.get_parameter(option_name)
         
         if not param:
             return
@@ -159,13 +226,12 @@ class FastShellCompleter(Completer):
                         display_meta="boolean value"
                     )
         elif hasattr(param.type, '__members__'):  # Enum
-            for member in param.type.__members__:
-                if member.lower().startswith(current_word.lower()):
-                    yield Completion(
-                        member,
-                        start_position=-len(current_word),
-                        display_meta=f"enum value"
-                    )
+            for member in get_enum_lookup(param.type).names_with_prefix(current_word):
+                yield Completion(
+                    member,
+                    start_position=-len(current_word),
+                    display_meta=f"enum value"
+                )
     
     def _complete_positional_or_options(self, command: Command, parsed, current_word: str) -> Iterable[Completion]:
         """Complete positional arguments or suggest options.
@@ -199,9 +265,9 @@ class FastShellCompleter(Completer):
         # Also suggest available options that haven't been used
         used_options = set(parsed.kwargs.keys())
         
-        for param in command.parameters:
-            if param.parameter_type == ParameterType.OPTION and param.name not in used_options:
-                option_name = f"--{param.name.replace('_', '-')}"
+        for name, param in command.option_index.items():
+            if param.name not in used_options:
+                option_name = f"--{name}"
                 if option_name.startswith(current_word) or not current_word:
                     display_meta = param.description or f"{param.type.__name__}"
                     if param.is_flag:
@@ -23,4 +23,14 @@ class ParseError(FastShellException):
 
 class TypeConversionError(FastShellException):
     """Raised when type conversion fails."""
-    pass
\ No newline at end of file
+    pass
+
+
+class CommandCancelled(FastShellException):
+    """Raised when a running command is cancelled."""
+    pass
+
+
+class CommandTimeout(CommandCancelled):
+    """Raised when a command runs past its deadline."""
+    pass
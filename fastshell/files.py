@@ -0,0 +1,91 @@
+"""Loading of @file argument values for FastShell."""
+
+import array
+import os
+import types
+from typing import Any, List, Type, Union
+from typing_extensions import Annotated, get_args, get_origin
+
+from .exceptions import InvalidArguments
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
+# Type of X | Y unions (Python 3.10+); no instance matches an empty tuple
+_UNION_TYPE = getattr(types, 'UnionType', ())
+
+
+def load_file_argument(path: str, target_type: Type) -> Any:
+    """Load an argument value from a file.
+
+    Files of at least MMAP_THRESHOLD bytes are memory-mapped. ``memoryview``
+    parameters get a read-only view of the file, which for mapped files
+    copies nothing; ``bytes`` parameters get the raw contents. For any other
+    type the contents are decoded as UTF-8 with trailing newlines removed,
+    ready for the usual string conversion; for list types each line is an
+    item. ``Optional[T]`` parameters are treated as ``T``.
+
+    Args:
+        path: Path of the file
+        target_type: Type of the parameter receiving the value
+
+    Returns:
+        memoryview, bytes or str
+
+    Raises:
+        InvalidArguments: If the file cannot be read or decoded
+    """
+    target_type = unwrap_optional(target_type)
+    try:
+        with open(path, 'rb') as f:
+            if target_type is bytes:
+                return f.read()
+            # Large files are decoded straight from the mapping
+            view = _view(f)
+    except OSError as e:
+        raise InvalidArguments(f"Cannot read file argument '@{path}': {e.strerror or e}")
+
+    if target_type is memoryview:
+        return view
+    try:
+        text = str(view, 'utf-8')
+    except UnicodeDecodeError as e:
+        raise InvalidArguments(f"File argument '@{path}' is not valid UTF-8: {e}")
+    finally:
+        view.release()
+    text = text.rstrip('\r\n')
+    if _is_sequence(target_type):
+        # Lists are comma-separated on the command line
+        text = text.replace('\r\n', ',').replace('\n', ',')
+    return text
+
+
+def unwrap_optional(target_type: Type) -> Type:
+    """Get T from Optional[T]; any other type is returned unchanged."""
+    if isinstance(target_type, _UNION_TYPE) or get_origin(target_type) is Union:
+        args = [arg for arg in get_args(target_type) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return target_type
+
+
+def _is_sequence(target_type: Type) -> bool:
+    """Check if values of a type are given as comma-separated items."""
+    origin = get_origin(target_type)
+    if origin is Annotated:
+        target_type = get_args(target_type)[0]
+        origin = get_origin(target_type)
+    return origin in (list, List) or target_type is array.array
+
+
+def _view(f: Any) -> memoryview:
+    """Get a read-only view of an open file's contents."""
+    size = os.fstat(f.fileno()).st_size
+    if size < MMAP_THRESHOLD:
+        return memoryview(f.read())
+
+    import mmap
+
+    # The mapping stays valid after the file is closed and is released with
+    # the last view of it
+    return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
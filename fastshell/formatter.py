@@ -1,15 +1,17 @@
 """Output formatting for FastShell command results."""
 
 import json
-from typing import Any, Optional
+import sys
+from collections.abc import Iterator
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
-from rich.syntax import Syntax
-from rich.pretty import Pretty
+
+if TYPE_CHECKING:
+    # Rich renderables are imported on first use to keep startup fast
+    from rich.console import Console
+    from rich.tree import Tree
 
 
 class OutputFormat(Enum):
@@ -20,20 +22,51 @@ class OutputFormat(Enum):
     TREE = "tree"
     PLAIN = "plain"
     PRETTY = "pretty"
+    SUMMARY = "summary"
+
+
+# Marks an iterator that produced no items
+_EMPTY = object()
+
+# Default number of rows, items or keys rendered per container
+DEFAULT_MAX_ROWS = 100
+# Default number of nesting levels rendered by the tree and pretty formats
+DEFAULT_MAX_DEPTH = 6
 
 
 class ResultFormatter:
     """Formats command execution results for display."""
     
-    def __init__(self, console: Console, default_format: OutputFormat = OutputFormat.AUTO):
+    def __init__(
+        self,
+        console: "Console",
+        default_format: OutputFormat = OutputFormat.AUTO,
+        stream_chunk_size: int = 100,
+        max_rows: Optional[int] = DEFAULT_MAX_ROWS,
+        max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+        pager: bool = False,
+    ):
         """Initialize formatter.
         
         Args:
             console: Rich console instance
             default_format: Default output format
+            stream_chunk_size: Number of items rendered at a time when
+                streaming an iterator result
+            max_rows: Number of rows, items or keys of a list or dict
+                result rendered before an "N more" footer; None for all
+            max_depth: Number of nesting levels rendered by the tree and
+                pretty formats; None for all
+            pager: Whether results longer than max_rows are shown page by
+                page when both the console and stdin are terminals, each
+                page rendered on request, instead of being cut off
         """
         self.console = console
         self.default_format = default_format
+        self.stream_chunk_size = stream_chunk_size
+        self.max_rows = max_rows
+        self.max_depth = max_depth
+        self.pager = pager
     
     def format_result(self, result: Any, format_type: Optional[OutputFormat] = None) -> None:
         """Format and display command result.
@@ -45,17 +78,45 @@ class ResultFormatter:
         if result is None:
             return
         
+        if isinstance(result, Iterator):
+            # Generators and other iterators are rendered as they produce items
+            self.format_stream(result, format_type)
+            return
+        
         format_to_use = format_type or self.default_format
         
         # Auto-detect best format if AUTO is selected
         if format_to_use == OutputFormat.AUTO:
             format_to_use = self._detect_best_format(result)
         
-        # Format based on type
+        if format_to_use == OutputFormat.SUMMARY:
+            self._format_summary(result)
+        elif (
+            self.pager
+            and self.max_rows is not None
+            and isinstance(result, (list, tuple, dict))
+            and len(result) > self.max_rows
+            and self.console.is_terminal
+            # Prompting would consume piped input such as a batch script
+            and sys.stdin is not None
+            and sys.stdin.isatty()
+        ):
+            self._page(result, format_to_use)
+        else:
+            self._render(result, format_to_use)
+    
+    def _render(self, result: Any, format_to_use: OutputFormat, start: int = 0) -> None:
+        """Render a result in a concrete format.
+        
+        Args:
+            result: Command execution result
+            format_to_use: Format other than AUTO and SUMMARY
+            start: Index of the first item, for results shown page by page
+        """
         if format_to_use == OutputFormat.JSON:
             self._format_json(result)
         elif format_to_use == OutputFormat.TABLE:
-            self._format_table(result)
+            self._format_table(result, start)
         elif format_to_use == OutputFormat.TREE:
             self._format_tree(result)
         elif format_to_use == OutputFormat.PLAIN:
@@ -65,6 +126,135 @@ class ResultFormatter:
         else:
             self._format_auto(result)
     
+    def format_stream(self, items: Iterator, format_type: Optional[OutputFormat] = None) -> None:
+        """Render an iterator incrementally without materializing it.
+        
+        Tables are rendered in chunks of ``stream_chunk_size`` rows, JSON is
+        written as one object per line (NDJSON) and plain text line by line.
+        Other formats render each item on its own.
+        
+        Args:
+            items: Iterator of result items
+            format_type: Specific format to use (overrides default)
+        """
+        first = next(items, _EMPTY)
+        if first is _EMPTY:
+            return
+        items = chain((first,), items)
+        
+        format_to_use = format_type or self.default_format
+        if format_to_use == OutputFormat.AUTO:
+            format_to_use = OutputFormat.TABLE if isinstance(first, dict) else OutputFormat.PLAIN
+        
+        if format_to_use == OutputFormat.JSON:
+            self._write_lines(json.dumps(item, ensure_ascii=False, default=str) for item in items)
+        elif format_to_use == OutputFormat.PLAIN:
+            self._write_lines(str(item) for item in items)
+        elif format_to_use == OutputFormat.TABLE:
+            self._stream_table(items, first)
+        else:
+            for item in items:
+                self.format_result(item, format_to_use)
+    
+    def _page(self, result: Any, format_to_use: OutputFormat) -> None:
+        """Show a list or dict result max_rows at a time, asking before each page."""
+        total = len(result)
+        items = iter(result.items()) if isinstance(result, dict) else iter(result)
+        shown = 0
+        while shown < total:
+            page = list(islice(items, self.max_rows))
+            self._render(dict(page) if isinstance(result, dict) else page, format_to_use, shown)
+            shown += len(page)
+            if shown >= total:
+                break
+            answer = self.console.input(
+                f"[dim]-- {shown:,} of {total:,} shown; Enter for more, q to quit --[/dim] "
+            )
+            if answer.strip().lower().startswith("q"):
+                self._footer(total - shown, total)
+                break
+    
+    def _cap(self, result: Any) -> Tuple[Any, int]:
+        """Cut a list, tuple or dict result down to max_rows entries.
+        
+        Returns:
+            The entries to render and the number left out
+        """
+        limit = self.max_rows
+        if limit is None or not isinstance(result, (list, tuple, dict)) or len(result) <= limit:
+            return result, 0
+        if isinstance(result, dict):
+            return dict(islice(result.items(), limit)), len(result) - limit
+        return result[:limit], len(result) - limit
+    
+    def _footer(self, remaining: int, total: int, noun: str = "rows") -> None:
+        """Tell how much of a result was left out."""
+        self.console.print(
+            f"[dim]... {remaining:,} more {noun} ({total:,} in total; "
+            f"'format summary' gives an overview)[/dim]"
+        )
+    
+    def _write_lines(self, lines: Iterator) -> None:
+        """Write lines straight to the console's file, flushing per chunk.
+        
+        The first line is flushed on its own so output starts immediately.
+        """
+        file = self.console.file
+        chunk_size = max(self.stream_chunk_size, 1)
+        first = next(lines, None)
+        if first is None:
+            return
+        file.write(first + "\n")
+        file.flush()
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            file.write("\n".join(chunk) + "\n")
+            file.flush()
+    
+    def _stream_table(self, items: Iterator, first: Any) -> None:
+        """Render a stream of rows as a sequence of table chunks.
+        
+        The first row is rendered and flushed on its own so output starts
+        immediately; the rest follow in chunks of ``stream_chunk_size``.
+        """
+        from rich.table import Table
+        
+        chunk_size = 1
+        keys = list(first.keys()) if isinstance(first, dict) else None
+        index = 0
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                break
+            
+            # Only the first chunk carries the title and header
+            is_first = index == 0
+            table = Table(
+                title="Command Result" if is_first else None,
+                show_header=is_first,
+                header_style="bold magenta",
+            )
+            if keys is not None:
+                for key in keys:
+                    table.add_column(str(key), style="cyan")
+                for item in chunk:
+                    if isinstance(item, dict):
+                        table.add_row(*[str(item.get(key, "")) for key in keys])
+                    else:
+                        table.add_row(str(item))
+            else:
+                table.add_column("Index", style="dim")
+                table.add_column("Value", style="cyan")
+                for offset, item in enumerate(chunk):
+                    table.add_row(str(index + offset), str(item))
+            
+            index += len(chunk)
+            self.console.print(table)
+            self.console.file.flush()
+            chunk_size = max(self.stream_chunk_size, 1)
+    
     def _detect_best_format(self, result: Any) -> OutputFormat:
         """Detect the best format for the given result.
         
@@ -94,33 +284,43 @@ class ResultFormatter:
     def _format_json(self, result: Any) -> None:
         """Format result as JSON."""
         try:
-            if isinstance(result, str):
-                # Try to parse if it's a JSON string
-                parsed = json.loads(result)
-                json_str = json.dumps(parsed, indent=2, ensure_ascii=False, default=str)
-            else:
-                json_str = json.dumps(result, indent=2, ensure_ascii=False, default=str)
+            # Parse JSON strings so that they are capped and re-indented
+            value = json.loads(result) if isinstance(result, str) else result
+            shown, remaining = self._cap(value)
+            json_str = json.dumps(shown, indent=2, ensure_ascii=False, default=str)
             
+            from rich.panel import Panel
+            from rich.syntax import Syntax
+
             syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
             self.console.print(Panel(syntax, title="[bold blue]JSON Output[/bold blue]", border_style="blue"))
+            if remaining:
+                self._footer(remaining, len(value), "entries")
         except (json.JSONDecodeError, TypeError):
             # Fallback to pretty format
             self._format_pretty(result)
     
-    def _format_table(self, result: Any) -> None:
-        """Format result as table."""
+    def _format_table(self, result: Any, start: int = 0) -> None:
+        """Format result as table.
+        
+        Only the first max_rows rows are built and converted to text.
+        """
+        from rich.table import Table
+
         if isinstance(result, list) and len(result) > 0:
+            rows, remaining = self._cap(result)
             if isinstance(result[0], dict):
                 # List of dictionaries
                 table = Table(title="Command Result", show_header=True, header_style="bold magenta")
                 
                 # Add columns from first item
-                for key in result[0].keys():
+                keys = list(result[0].keys())
+                for key in keys:
                     table.add_column(str(key), style="cyan")
                 
                 # Add rows
-                for item in result:
-                    row = [str(item.get(key, "")) for key in result[0].keys()]
+                for item in rows:
+                    row = [str(item.get(key, "")) for key in keys]
                     table.add_row(*row)
                 
                 self.console.print(table)
@@ -130,46 +330,65 @@ class ResultFormatter:
                 table.add_column("Index", style="dim")
                 table.add_column("Value", style="cyan")
                 
-                for i, item in enumerate(result):
+                for i, item in enumerate(rows, start):
                     table.add_row(str(i), str(item))
                 
                 self.console.print(table)
+            if remaining:
+                self._footer(remaining, len(result))
         elif isinstance(result, dict):
             # Dictionary as table
             table = Table(title="Command Result", show_header=True, header_style="bold magenta")
             table.add_column("Key", style="bold cyan")
             table.add_column("Value", style="green")
             
-            for key, value in result.items():
+            entries, remaining = self._cap(result)
+            for key, value in entries.items():
                 table.add_row(str(key), str(value))
             
             self.console.print(table)
+            if remaining:
+                self._footer(remaining, len(result), "keys")
         else:
             # Fallback to pretty format
             self._format_pretty(result)
     
     def _format_tree(self, result: Any) -> None:
         """Format result as tree structure."""
+        from rich.tree import Tree
+
         tree = Tree("[bold blue]Command Result[/bold blue]")
         self._add_to_tree(tree, result)
         self.console.print(tree)
     
-    def _add_to_tree(self, parent: Tree, obj: Any, key: str = None) -> None:
+    def _add_to_tree(self, parent: "Tree", obj: Any, key: str = None, depth: int = 0) -> None:
         """Recursively add objects to tree.
         
+        Containers nested deeper than max_depth are shown collapsed, and
+        only the first max_rows entries of each container are added.
+        
         Args:
             parent: Parent tree node
             obj: Object to add
             key: Key name for the object
+            depth: Nesting level of the object
         """
+        if isinstance(obj, (dict, list)) and self.max_depth is not None and depth > self.max_depth:
+            kind = f"dict, {len(obj)} keys" if isinstance(obj, dict) else f"list[{len(obj)}]"
+            parent.add(f"[bold cyan]{key}[/bold cyan] [dim]({kind})[/dim]" if key else f"[dim]({kind})[/dim]")
+            return
+        
         if isinstance(obj, dict):
             if key:
                 node = parent.add(f"[bold cyan]{key}[/bold cyan] (dict)")
             else:
                 node = parent
             
-            for k, v in obj.items():
-                self._add_to_tree(node, v, str(k))
+            entries, remaining = self._cap(obj)
+            for k, v in entries.items():
+                self._add_to_tree(node, v, str(k), depth + 1)
+            if remaining:
+                node.add(f"[dim]... {remaining:,} more keys[/dim]")
         
         elif isinstance(obj, list):
             if key:
@@ -177,8 +396,11 @@ class ResultFormatter:
             else:
                 node = parent
             
-            for i, item in enumerate(obj):
-                self._add_to_tree(node, item, f"[{i}]")
+            items, remaining = self._cap(obj)
+            for i, item in enumerate(items):
+                self._add_to_tree(node, item, f"[{i}]", depth + 1)
+            if remaining:
+                node.add(f"[dim]... {remaining:,} more items[/dim]")
         
         else:
             value_str = str(obj)
@@ -195,11 +417,73 @@ class ResultFormatter:
         if isinstance(result, str):
             self.console.print(result)
         else:
-            self.console.print(str(result))
+            shown, remaining = self._cap(result)
+            self.console.print(str(shown))
+            if remaining:
+                self._footer(remaining, len(result), "entries")
     
     def _format_pretty(self, result: Any) -> None:
-        """Format result using Rich's pretty printer."""
-        self.console.print(Pretty(result, expand_all=True))
+        """Format result using Rich's pretty printer, abbreviating large containers."""
+        from rich.pretty import Pretty
+
+        self.console.print(
+            Pretty(result, expand_all=True, max_length=self.max_rows, max_depth=self.max_depth)
+        )
+    
+    def _format_summary(self, result: Any) -> None:
+        """Describe the shape of a result instead of rendering it.
+        
+        Column and value types are taken from the first max_rows entries,
+        so the cost does not grow with the size of the result.
+        """
+        from rich.table import Table
+
+        name = type(result).__name__
+        if not isinstance(result, (list, tuple, dict)):
+            size = f", length {len(result):,}" if hasattr(result, "__len__") else ""
+            self.console.print(f"[cyan]{name}[/cyan]{size}: {_preview(repr(result), 80)}")
+            return
+        
+        sample, remaining = self._cap(result)
+        if isinstance(result, dict):
+            self.console.print(f"[cyan]dict[/cyan] with {len(result):,} keys")
+            table = Table(title="Keys", show_header=True, header_style="bold magenta")
+            table.add_column("Key", style="bold cyan")
+            table.add_column("Type", style="green")
+            table.add_column("Size", justify="right")
+            for key, value in sample.items():
+                table.add_row(str(key), type(value).__name__, _size(value))
+        elif sample and all(isinstance(item, dict) for item in sample):
+            columns = {}
+            for row in sample:
+                for key, value in row.items():
+                    columns.setdefault(key, {})[type(value).__name__] = None
+            self.console.print(f"[cyan]{name}[/cyan] of {len(result):,} rows, {len(columns)} columns")
+            table = Table(title="Columns", show_header=True, header_style="bold magenta")
+            table.add_column("Column", style="bold cyan")
+            table.add_column("Types", style="green")
+            table.add_column("Example")
+            first = sample[0]
+            for key, types in columns.items():
+                table.add_row(str(key), ", ".join(types), _preview(first.get(key, "")))
+        else:
+            self.console.print(f"[cyan]{name}[/cyan] of {len(result):,} items")
+            table = Table(title="Item types", show_header=True, header_style="bold magenta")
+            table.add_column("Type", style="green")
+            table.add_column("Count", justify="right")
+            table.add_column("Example")
+            counts = {}
+            examples = {}
+            for item in sample:
+                type_name = type(item).__name__
+                counts[type_name] = counts.get(type_name, 0) + 1
+                examples.setdefault(type_name, item)
+            for type_name, count in counts.items():
+                table.add_row(type_name, f"{count:,}", _preview(examples[type_name]))
+        
+        if remaining:
+            table.caption = f"from the first {len(sample):,} entries"
+        self.console.print(table)
     
     def _format_auto(self, result: Any) -> None:
         """Auto-format result with enhanced styling."""
@@ -255,12 +539,26 @@ class ResultFormatter:
             self._format_pretty(result)
 
 
-def create_formatter(console: Console, format_type: str = "auto") -> ResultFormatter:
+def _size(value: Any) -> str:
+    """Number of entries of a container value, for summaries."""
+    return f"{len(value):,}" if isinstance(value, (list, tuple, dict, set, str)) else ""
+
+
+def _preview(value: Any, width: int = 40) -> str:
+    """Short text of a value, escaped for console markup, for summaries."""
+    from rich.markup import escape
+
+    text = str(value)
+    return escape(text if len(text) <= width else text[:width - 3] + "...")
+
+
+def create_formatter(console: "Console", format_type: str = "auto", **options: Any) -> ResultFormatter:
     """Create a result formatter.
     
     Args:
         console: Rich console instance
         format_type: Output format type
+        **options: Size limits and paging options of ResultFormatter
         
     Returns:
         ResultFormatter instance
@@ -270,4 +568,4 @@ def create_formatter(console: Console, format_type: str = "auto") -> ResultForma
     except ValueError:
         output_format = OutputFormat.AUTO
     
-    return ResultFormatter(console, output_format)
\ No newline at end of file
+    return ResultFormatter(console, output_format, **options)
\ No newline at end of file
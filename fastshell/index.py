@@ -0,0 +1,246 @@
+"""Name indexes used for command and option completion."""
+
+import heapq
+import re
+import sys
+from bisect import bisect_left, insort
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# Sorts after every other character, so prefix + _MAX_CHAR bounds a prefix range
+_MAX_CHAR = chr(0x10FFFF)
+
+# Fuzzy match scoring, loosely following fzf
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 6
+BONUS_FIRST_CHAR = 8
+PENALTY_GAP = 1
+_WORD_SEPARATORS = frozenset("_-. /:")
+
+# Possessive quantifiers (Python 3.11+) stop the gap scan from backtracking
+_GAP = "[^\\n{}]*+" if sys.version_info >= (3, 11) else "[^\\n{}]*"
+
+
+class PrefixIndex:
+    """Sorted-array index over names supporting prefix lookups.
+    
+    Lookups bisect the sorted key list, so finding the names that start with
+    a prefix costs O(log n) plus the number of matches.
+    """
+    
+    def __init__(self, items: Optional[Iterable[Tuple[str, Any]]] = None):
+        """Initialize index.
+        
+        Args:
+            items: Initial (key, value) pairs
+        """
+        self._values = dict(items or ())
+        self._keys = sorted(self._values)
+        # Newline-joined lowercased keys searched by fuzzy_search, built on demand
+        self._haystack = None
+        self._line_starts = []
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+    
+    def add(self, key: str, value: Any = None) -> None:
+        """Add a key, replacing the value if it is already indexed.
+        
+        Args:
+            key: Name to index
+            value: Value returned with the key
+        """
+        if key not in self._values:
+            insort(self._keys, key)
+            self._haystack = None
+        self._values[key] = value
+    
+    def remove(self, key: str) -> None:
+        """Remove a key if present.
+        
+        Args:
+            key: Name to remove
+        """
+        if key in self._values:
+            del self._values[key]
+            del self._keys[bisect_left(self._keys, key)]
+            self._haystack = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value stored for a key."""
+        return self._values.get(key, default)
+    
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """Get all keys starting with prefix, in sorted order.
+        
+        Args:
+            prefix: Prefix to look up
+            
+        Returns:
+            Matching keys
+        """
+        if not prefix:
+            return list(self._keys)
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _MAX_CHAR, lo)
+        return self._keys[lo:hi]
+    
+    def items_with_prefix(self, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Iterate (key, value) pairs whose key starts with prefix.
+        
+        Args:
+            prefix: Prefix to look up
+            
+        Yields:
+            Matching (key, value) pairs in sorted key order
+        """
+        values = self._values
+        for key in self.keys_with_prefix(prefix):
+            yield key, values[key]
+    
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate all (key, value) pairs in sorted key order."""
+        return self.items_with_prefix("")
+    
+    def fuzzy_search(self, query: str, limit: int = 50) -> List[Tuple[int, str, Any]]:
+        """Find keys containing the query as a case-insensitive subsequence.
+        
+        Candidates are found with one regular expression scan over all keys
+        and ranked by a score that rewards matches at word boundaries and
+        runs of consecutive characters and penalizes gaps. Only the best
+        ``limit`` results are kept.
+        
+        Args:
+            query: Characters to match in order
+            limit: Maximum number of results
+            
+        Returns:
+            List of (score, key, value) tuples, best match first
+        """
+        if not query or limit <= 0:
+            return []
+        
+        values = self._values
+        if len(query) == 1:
+            # A key starting with the character always gets the highest
+            # single-character score, so enough of them settle the ranking
+            prefixed = self._prefix_keys_any_case(query)
+            if len(prefixed) >= limit:
+                score = SCORE_MATCH + BONUS_FIRST_CHAR + BONUS_BOUNDARY
+                best = heapq.nsmallest(limit, prefixed, key=len)
+                return [(score, key, values[key]) for key in best]
+        
+        haystack = self._haystack
+        if haystack is None:
+            # One line per key, each preceded by a newline the pattern anchors on
+            lowered = [key.lower() for key in self._keys]
+            haystack = self._haystack = "".join("\n" + key for key in lowered)
+            self._line_starts = []
+            offset = 0
+            for key in lowered:
+                self._line_starts.append(offset)
+                offset += len(key) + 1
+        
+        # Each group captures the leftmost position of the next query character
+        pattern = "\n" + "".join(
+            _GAP.format(re.escape(char)) + f"({re.escape(char)})" for char in query.lower()
+        )
+        keys = self._keys
+        line_starts = self._line_starts
+        
+        scored = []
+        for match in re.finditer(pattern, haystack):
+            # regs[0] spans the whole match, starting at the key's leading newline
+            spans = match.regs
+            key = keys[bisect_left(line_starts, spans[0][0])]
+            scored.append((_fuzzy_score(key, spans), key))
+        
+        best = heapq.nlargest(limit, scored, key=lambda item: (item[0], -len(item[1])))
+        return [(score, key, values[key]) for score, key in best]
+    
+    def _prefix_keys_any_case(self, char: str) -> List[str]:
+        """Get keys starting with a character, ignoring case."""
+        variants = {char, char.lower(), char.upper()}
+        keys = []
+        for variant in variants:
+            keys.extend(self.keys_with_prefix(variant))
+        return keys
+
+
+class IndexedDict(dict):
+    """Dict whose keys are mirrored in a PrefixIndex.
+    
+    Every way of adding or removing a key also updates the index, so the
+    index cannot fall out of step with the dict, whoever changes it.
+    """
+    
+    def __init__(self, index: Optional[PrefixIndex] = None):
+        """Initialize an empty dict.
+        
+        Args:
+            index: Index to keep in step (a new one if omitted)
+        """
+        super().__init__()
+        self.index = index if index is not None else PrefixIndex()
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.index.add(key)
+    
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.index.remove(key)
+    
+    def __ior__(self, other: Any) -> "IndexedDict":
+        self.update(other)
+        return self
+    
+    def pop(self, key: str, *default: Any) -> Any:
+        value = super().pop(key, *default)
+        self.index.remove(key)
+        return value
+    
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self.index.remove(key)
+        return key, value
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def clear(self) -> None:
+        for key in list(self):
+            self.index.remove(key)
+        super().clear()
+
+
+def _fuzzy_score(key: str, spans: Tuple[Tuple[int, int], ...]) -> int:
+    """Score a fuzzy match from the regex group spans of the matched characters."""
+    # Offset of the key's first character in the haystack
+    base = spans[0][0] + 1
+    first = spans[1][0] - base
+    # Unmatched leading characters count as a small gap
+    score = -PENALTY_GAP * first
+    previous = first - 2
+    for start, _ in spans[1:]:
+        position = start - base
+        score += SCORE_MATCH
+        if position == 0:
+            score += BONUS_FIRST_CHAR + BONUS_BOUNDARY
+        elif key[position - 1] in _WORD_SEPARATORS:
+            score += BONUS_BOUNDARY
+        if position == previous + 1:
+            score += BONUS_CONSECUTIVE
+        elif position != first:
+            score -= PENALTY_GAP * (position - previous - 1)
+        previous = position
+    return score
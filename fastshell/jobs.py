@@ -0,0 +1,143 @@
+"""Background job control for the FastShell interactive shell."""
+
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+from .exceptions import FastShellException
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .cancellation import CancellationToken
+
+
+class JobState(Enum):
+    """State of a background job."""
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class Job:
+    """A command line running in the background."""
+
+    def __init__(
+        self,
+        job_id: int,
+        command_line: str,
+        task: "asyncio.Future",
+        token: Optional["CancellationToken"] = None,
+    ):
+        self.id = job_id
+        self.command_line = command_line
+        self.task = task
+        self.token = token
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    @property
+    def state(self) -> JobState:
+        """Current state of the job."""
+        task = self.task
+        if not task.done():
+            return JobState.RUNNING
+        if task.cancelled():
+            return JobState.CANCELLED
+        return JobState.FAILED if task.exception() is not None else JobState.DONE
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running, or ran for."""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def describe(self) -> str:
+        """One-line summary in the style of a shell's job table."""
+        return f"[{self.id}] {self.state.value:<9} {self.elapsed:8.1f}s  {self.command_line}"
+
+
+class JobManager:
+    """Numbered background jobs running on an event loop."""
+
+    def __init__(self):
+        self._jobs: Dict[int, Job] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def submit(
+        self,
+        command_line: str,
+        awaitable: Awaitable,
+        on_done: Optional[Callable[[Job], Any]] = None,
+        token: Optional["CancellationToken"] = None,
+    ) -> Job:
+        """Start a job on the running event loop.
+
+        Args:
+            command_line: Command line the job runs, for display
+            awaitable: Work of the job
+            on_done: Called with the job once it finishes
+            token: Cancellation token of the job's command, cancelled by kill
+
+        Returns:
+            The new job
+        """
+        import asyncio
+
+        job = Job(self._next_id, command_line, asyncio.ensure_future(awaitable), token)
+        self._next_id += 1
+        self._jobs[job.id] = job
+
+        def finished(task: "asyncio.Future") -> None:
+            job.finished = time.perf_counter()
+            if not task.cancelled():
+                # Mark the exception as retrieved; it is reported through on_done
+                task.exception()
+            if on_done is not None:
+                on_done(job)
+
+        job.task.add_done_callback(finished)
+        return job
+
+    def get(self, job_id: Optional[int] = None) -> Job:
+        """Get a job by id, or the most recent one.
+
+        Raises:
+            FastShellException: If there is no such job
+        """
+        if job_id is None:
+            if not self._jobs:
+                raise FastShellException("No current job")
+            return self._jobs[max(self._jobs)]
+        if job_id not in self._jobs:
+            raise FastShellException(f"No such job: {job_id}")
+        return self._jobs[job_id]
+
+    def list(self) -> List[Job]:
+        """All jobs in start order."""
+        return list(self._jobs.values())
+
+    def kill(self, job_id: int) -> Job:
+        """Cancel a running job.
+
+        Coroutine commands are cancelled where they await. A command running
+        in a worker thread cannot be interrupted, but its cancellation token
+        is cancelled, and its result is discarded.
+
+        Raises:
+            FastShellException: If there is no such job
+        """
+        job = self.get(job_id)
+        if job.token is not None:
+            job.token.cancel()
+        job.task.cancel()
+        return job
+
+    def prune(self) -> None:
+        """Forget finished jobs."""
+        for job_id in [job.id for job in self._jobs.values() if job.task.done()]:
+            del self._jobs[job_id]
@@ -0,0 +1,310 @@
+"""Command call, error and latency metrics for FastShell."""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Latencies are bucketed with 3 significant bits (at most 12.5% relative
+# error): values below 16 ns have a bucket each, larger values fall into
+# one of 8 buckets per power of two
+_SUB_BUCKETS = 8
+# Values from 2**45 ns (about 9.8 hours) up share the last bucket
+_BUCKET_COUNT = (45 - 2) * _SUB_BUCKETS
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """Get the [low, high) nanosecond range of a histogram bucket."""
+    if index < 2 * _SUB_BUCKETS:
+        return index, index + 1
+    shift = (index >> 3) - 1
+    mantissa = (index & 7) + _SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """Histogram of durations in nanoseconds with log-linear buckets.
+
+    Like an HDR histogram, buckets have a fixed relative width, so
+    recording is a few integer operations and a list increment whatever
+    the range of values, and memory use is constant.
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Record a duration.
+
+        Args:
+            value: Duration in nanoseconds
+        """
+        if value < 16:
+            index = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - 4
+            index = (shift << 3) + (value >> shift)
+            if index >= _BUCKET_COUNT:
+                index = _BUCKET_COUNT - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in nanoseconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """Get the upper bound of the bucket holding a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Duration in nanoseconds, at most the largest recorded value
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index == _BUCKET_COUNT - 1:
+                    return self.max
+                return min(_bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """Yield (largest value in ns, cumulative count) of each non-empty bucket.
+
+        Durations are whole nanoseconds, so each bucket holds exactly the
+        values up to and including its largest value, as the Prometheus
+        ``le`` bound requires. The open-ended last bucket is left out.
+        """
+        seen = 0
+        for index, count in enumerate(self.counts[:-1]):
+            if count:
+                seen += count
+                yield _bucket_bounds(index)[1] - 1, seen
+
+
+class CommandMetrics:
+    """Metrics of one command."""
+
+    __slots__ = ('name', 'latency', 'errors')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency = LatencyHistogram()
+        # Failed calls by exception class name
+        self.errors: Dict[str, int] = {}
+
+    @property
+    def calls(self) -> int:
+        """Number of recorded calls."""
+        return self.latency.count
+
+    @property
+    def error_count(self) -> int:
+        """Number of failed calls."""
+        return sum(self.errors.values())
+
+
+class MetricsRegistry:
+    """Per-command call counts, error counts and latency histograms.
+
+    Recording takes no lock: under the GIL each update is a handful of
+    dict and list operations, so calls from concurrent threads may very
+    rarely lose an increment, which keeps recording cheap.
+    """
+
+    def __init__(self):
+        self.commands: Dict[str, CommandMetrics] = {}
+        self.exporters: List["MetricsExporter"] = []
+
+    def record(self, command: str, elapsed: int, error: Optional[BaseException] = None) -> None:
+        """Record one call of a command.
+
+        Args:
+            command: Command name
+            elapsed: Duration in nanoseconds
+            error: Exception the call failed with, if any
+        """
+        metrics = self.commands.get(command)
+        if metrics is None:
+            metrics = self.commands.setdefault(command, CommandMetrics(command))
+        metrics.latency.record(elapsed)
+        if error is not None:
+            errors = metrics.errors
+            kind = error.__class__.__name__
+            errors[kind] = errors.get(kind, 0) + 1
+
+    def reset(self) -> None:
+        """Forget all recorded metrics."""
+        self.commands = {}
+
+    def summary(self) -> List[Dict[str, Union[str, int, float]]]:
+        """Summarize each command's metrics, latencies in milliseconds."""
+        rows = []
+        for name, metrics in sorted(self.commands.items()):
+            latency = metrics.latency
+            rows.append({
+                "command": name,
+                "calls": metrics.calls,
+                "errors": metrics.error_count,
+                "mean_ms": round(latency.mean / 1e6, 3),
+                "p50_ms": round(latency.percentile(50) / 1e6, 3),
+                "p99_ms": round(latency.percentile(99) / 1e6, 3),
+                "max_ms": round(latency.max / 1e6, 3),
+            })
+        return rows
+
+    def add_exporter(self, exporter: "MetricsExporter") -> None:
+        """Register an exporter run by ``export``.
+
+        Args:
+            exporter: Exporter to add
+        """
+        self.exporters.append(exporter)
+
+    def export(self) -> None:
+        """Run all registered exporters."""
+        for exporter in self.exporters:
+            exporter.export(self)
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(registry: MetricsRegistry, namespace: str = "fastshell") -> str:
+    """Render metrics in the Prometheus text exposition format.
+
+    Histogram buckets are the non-empty latency buckets, plus ``+Inf``.
+
+    Args:
+        registry: Metrics to render
+        namespace: Prefix of the metric names
+
+    Returns:
+        Exposition text
+    """
+    calls = f"{namespace}_command_calls_total"
+    errors = f"{namespace}_command_errors_total"
+    duration = f"{namespace}_command_duration_seconds"
+    lines = [
+        f"# HELP {calls} Commands executed.",
+        f"# TYPE {calls} counter",
+    ]
+    items = sorted(registry.commands.items())
+    for name, metrics in items:
+        lines.append(f'{calls}{{command="{_label(name)}"}} {metrics.calls}')
+
+    lines += [
+        f"# HELP {errors} Failed commands by error type.",
+        f"# TYPE {errors} counter",
+    ]
+    for name, metrics in items:
+        for kind, count in sorted(metrics.errors.items()):
+            lines.append(f'{errors}{{command="{_label(name)}",error="{_label(kind)}"}} {count}')
+
+    lines += [
+        f"# HELP {duration} Command latency.",
+        f"# TYPE {duration} histogram",
+    ]
+    for name, metrics in items:
+        label = _label(name)
+        latency = metrics.latency
+        for bound, count in latency.buckets():
+            # Shortest exact float text, so a value equal to the bound stays in the bucket
+            lines.append(f'{duration}_bucket{{command="{label}",le="{bound / 1e9!r}"}} {count}')
+        lines.append(f'{duration}_bucket{{command="{label}",le="+Inf"}} {latency.count}')
+        lines.append(f'{duration}_sum{{command="{label}"}} {latency.total / 1e9:g}')
+        lines.append(f'{duration}_count{{command="{label}"}} {latency.count}')
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter(ABC):
+    """Base class of metrics exporters."""
+
+    @abstractmethod
+    def export(self, registry: MetricsRegistry) -> None:
+        """Export the current metrics.
+
+        Args:
+            registry: Metrics to export
+        """
+
+
+class PrometheusFileExporter(MetricsExporter):
+    """Writes metrics to a file in the Prometheus text format.
+
+    The file is replaced atomically, so it can be read by the node
+    exporter's textfile collector at any time.
+    """
+
+    def __init__(self, path: "os.PathLike", namespace: str = "fastshell"):
+        """Initialize exporter.
+
+        Args:
+            path: File to write
+            namespace: Prefix of the metric names
+        """
+        self.path = os.fspath(path)
+        self.namespace = namespace
+
+    def export(self, registry: MetricsRegistry) -> None:
+        """Write the current metrics to the file."""
+        import tempfile
+
+        text = render_prometheus(registry, self.namespace)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class PrometheusSocketExporter(MetricsExporter):
+    """Sends metrics in the Prometheus text format over a local socket."""
+
+    def __init__(self, address: Union[str, Tuple[str, int]], namespace: str = "fastshell", timeout: float = 1.0):
+        """Initialize exporter.
+
+        Args:
+            address: Path of a Unix socket, or (host, port) of a TCP socket
+            namespace: Prefix of the metric names
+            timeout: Seconds to wait for connecting and sending
+        """
+        self.address = address
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def export(self, registry: MetricsRegistry) -> None:
+        """Connect to the socket and send the current metrics."""
+        import socket
+
+        data = render_prometheus(registry, self.namespace).encode('utf-8')
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            with sock:
+                sock.connect(self.address)
+                sock.sendall(data)
+        else:
+            with socket.create_connection(self.address, self.timeout) as sock:
+                sock.sendall(data)
@@ -1,17 +1,112 @@
 """Command line parser for FastShell."""
 
-import shlex
+import re
+from bisect import bisect_right
+from typing import Iterable, Iterator, List
 
-from .types import ParsedCommand
+from .types import FileReference, ParsedCommand
 from .exceptions import ParseError
 
 
+# One alternative per lexical element; together they cover every character,
+# so consecutive matches walk the whole line.
+_TOKEN_RE = re.compile(r"""
+    (?P<space>[ \t\r\n]+)
+  | (?P<word>[^ \t\r\n'"\\|]+)
+  | (?P<pipe>\|)
+  | '(?P<single>[^']*)'
+  | "(?P<double>(?:[^"\\]|\\.)*)"
+  | \\(?P<escaped>.)
+  | (?P<unclosed>['"])
+  | (?P<dangling>\\)
+""", re.VERBOSE | re.DOTALL)
+
+# Inside double quotes a backslash only escapes a quote or another backslash
+_DOUBLE_QUOTED_ESCAPE_RE = re.compile(r'\\(["\\])')
+
+
+# Yielded by tokenize(split_pipes=True) between the commands of a pipeline
+PIPE = object()
+
+
+def _token(text: str, reference: bool) -> str:
+    """Wrap a token that started with an unquoted '@' as a FileReference."""
+    return FileReference(text) if reference and len(text) > 1 else text
+
+
+def tokenize(command_line: str, split_pipes: bool = False) -> Iterator[str]:
+    """Split a command line into tokens with POSIX shell quoting rules.
+    
+    Behaves like ``shlex.split`` (without comment handling) but scans the
+    line with a single compiled regular expression. A token starting with
+    an unquoted '@' is yielded as a FileReference, whose value is loaded
+    from the named file when the command is bound.
+    
+    Args:
+        command_line: Command line to split
+        split_pipes: Whether an unquoted '|' separates commands; if so the
+            PIPE marker is yielded in its place
+        
+    Yields:
+        Tokens with quotes and escapes removed
+        
+    Raises:
+        ParseError: If a quote is not closed or the line ends with a backslash
+    """
+    current = None
+    # Whether the current token started with an unquoted '@'
+    reference = False
+    for match in _TOKEN_RE.finditer(command_line):
+        kind = match.lastgroup
+        if kind == 'space':
+            if current is not None:
+                yield _token(current, reference)
+                current = None
+                reference = False
+            continue
+        
+        if kind == 'pipe':
+            if split_pipes:
+                if current is not None:
+                    yield _token(current, reference)
+                    current = None
+                    reference = False
+                yield PIPE
+                continue
+            piece = '|'
+        elif kind == 'double':
+            piece = match.group(kind)
+            if '\\' in piece:
+                piece = _DOUBLE_QUOTED_ESCAPE_RE.sub(r'\1', piece)
+        elif kind == 'unclosed':
+            raise ParseError("Failed to parse command line: No closing quotation")
+        elif kind == 'dangling':
+            raise ParseError("Failed to parse command line: No escaped character")
+        else:
+            piece = match.group(kind)
+            if current is None and kind == 'word' and piece[0] == '@':
+                reference = True
+        
+        current = piece if current is None else current + piece
+    
+    if current is not None:
+        yield _token(current, reference)
+
+
 class CommandParser:
     """Parses command line input into structured format."""
     
+    def __init__(self):
+        # Cached prefix of the last line seen by parse_partial
+        self._partial_state = _PartialState()
+    
     def parse(self, command_line: str) -> ParsedCommand:
         """Parse a command line string.
         
+        Tokens are classified as they are lexed: positional arguments,
+        ``--long``/``--long=value`` options, ``-s`` short options and
+        combined short flags.
+        
         Args:
             command_line: Command line to parse
             
@@ -21,154 +116,294 @@ class CommandParser:
         Raises:
             ParseError: If parsing fails
         """
-        try:
-            tokens = shlex.split(command_line)
-        except ValueError as e:
-            raise ParseError(f"Failed to parse command line: {e}")
+        return self.parse_tokens(tokenize(command_line))
+    
+    def parse_pipeline(self, command_line: str) -> List[ParsedCommand]:
+        """Parse a command line that may chain commands with '|'.
         
-        if not tokens:
+        Args:
+            command_line: Command line to parse
+            
+        Returns:
+            One ParsedCommand per pipeline stage; empty for a blank line
+            
+        Raises:
+            ParseError: If parsing fails or a pipeline stage is empty
+        """
+        stages = [[]]
+        for token in tokenize(command_line, split_pipes=True):
+            if token is PIPE:
+                stages.append([])
+            else:
+                stages[-1].append(token)
+        
+        if len(stages) == 1:
+            return [self.parse_tokens(stages[0])] if stages[0] else []
+        if not all(stages):
+            raise ParseError("Failed to parse command line: empty command in pipeline")
+        return [self.parse_tokens(stage) for stage in stages]
+    
+    def parse_tokens(self, tokens: Iterable[str]) -> ParsedCommand:
+        """Classify already split tokens into a parsed command.
+        
+        Args:
+            tokens: Command name followed by its argument tokens
+            
+        Returns:
+            ParsedCommand instance
+        """
+        tokens = iter(tokens)
+        command = next(tokens, None)
+        if command is None:
             return ParsedCommand()
         
-        command = tokens[0]
         args = []
         kwargs = {}
+        # Option waiting for its value in the next token
+        pending = None
         
-        i = 1
-        while i < len(tokens):
-            token = tokens[i]
+        for token in tokens:
+            if pending is not None:
+                if not token.startswith('-'):
+                    kwargs[pending] = token
+                    pending = None
+                    continue
+                # Followed by another option - boolean flag
+                kwargs[pending] = 'true'
+                pending = None
             
             if token.startswith('--'):
                 # Long option
-                option_name = token[2:].replace('-', '_')
-                
-                if '=' in option_name:
+                option_name, sep, value = token[2:].partition('=')
+                option_name = option_name.replace('-', '_')
+                if sep:
                     # --option=value format
-                    option_name, value = option_name.split('=', 1)
                     kwargs[option_name] = value
                 else:
-                    # --option value format
-                    if i + 1 < len(tokens) and not tokens[i + 1].startswith('-'):
-                        kwargs[option_name] = tokens[i + 1]
-                        i += 1
-                    else:
-                        # Boolean flag
-                        kwargs[option_name] = 'true'
-                        
+                    # --option value format or boolean flag
+                    pending = option_name
+                    
             elif token.startswith('-') and len(token) > 1:
                 # Short option
-                option_name = token[1:]
-                
-                if len(option_name) == 1:
+                if len(token) == 2:
                     # Single character option
-                    if i + 1 < len(tokens) and not tokens[i + 1].startswith('-'):
-                        kwargs[option_name] = tokens[i + 1]
-                        i += 1
-                    else:
-                        # Boolean flag
-                        kwargs[option_name] = 'true'
+                    pending = token[1]
                 else:
                     # Multiple character short option or combined flags
-                    if '=' in option_name:
-                        option_name, value = option_name.split('=', 1)
-                        kwargs[option_name] = value
-                    else:
-                        # Treat as boolean flag
-                        kwargs[option_name] = 'true'
+                    option_name, sep, value = token[1:].partition('=')
+                    # Without a value, treat as boolean flag
+                    kwargs[option_name] = value if sep else 'true'
             else:
                 # Positional argument
                 args.append(token)
-            
-            i += 1
+        
+        if pending is not None:
+            # Boolean flag
+            kwargs[pending] = 'true'
         
         return ParsedCommand(command=command, args=args, kwargs=kwargs)
     
     def parse_partial(self, command_line: str) -> ParsedCommand:
         """Parse a partial command line for completion.
         
+        Quotes are kept in the tokens and the last token may be incomplete.
+        The tokenized prefix of the previous call is cached, so when the new
+        line extends or edits the end of the previous one only the changed
+        tail is re-lexed.
+        
         Args:
             command_line: Partial command line
             
         Returns:
-            ParsedCommand instance with partial parsing
+            ParsedCommand instance with partial parsing; it is reused, and
+            overwritten, by the next call
         """
         try:
-            # For partial parsing, we need to handle incomplete tokens
-            tokens = []
-            current_token = ""
-            in_quotes = False
-            quote_char = None
-            
-            i = 0
-            while i < len(command_line):
-                char = command_line[i]
-                
-                if char in ['"', "'"] and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                    current_token += char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = None
-                    current_token += char
-                elif char == ' ' and not in_quotes:
-                    if current_token:
-                        tokens.append(current_token)
-                        current_token = ""
-                else:
-                    current_token += char
-                
-                i += 1
-            
-            # Add the last token even if incomplete
-            if current_token or command_line.endswith(' '):
-                tokens.append(current_token)
-            
-            if not tokens:
-                return ParsedCommand()
-            
-            command = tokens[0] if tokens[0] else None
-            args = []
-            kwargs = {}
-            
-            i = 1
-            while i < len(tokens):
-                token = tokens[i]
-                
-                if token.startswith('--'):
-                    option_name = token[2:].replace('-', '_')
-                    
-                    if '=' in option_name:
-                        option_name, value = option_name.split('=', 1)
-                        kwargs[option_name] = value
-                    else:
-                        if i + 1 < len(tokens):
-                            kwargs[option_name] = tokens[i + 1]
-                            i += 1
-                        else:
-                            kwargs[option_name] = ''
-                            
-                elif token.startswith('-') and len(token) > 1:
-                    option_name = token[1:]
-                    
-                    if len(option_name) == 1:
-                        if i + 1 < len(tokens):
-                            kwargs[option_name] = tokens[i + 1]
-                            i += 1
-                        else:
-                            kwargs[option_name] = ''
-                    else:
-                        if '=' in option_name:
-                            option_name, value = option_name.split('=', 1)
-                            kwargs[option_name] = value
-                        else:
-                            kwargs[option_name] = 'true'
-                else:
-                    args.append(token)
-                
-                i += 1
-            
-            return ParsedCommand(command=command, args=args, kwargs=kwargs)
-            
+            return self._partial_state.parse(command_line)
         except Exception:
             # Fallback for any parsing errors in partial mode
-            return ParsedCommand()
\ No newline at end of file
+            self._partial_state.reset()
+            return ParsedCommand()
+
+
+# Characters that change the partial lexer's state
+_PARTIAL_SPECIAL_RE = re.compile("[ '\"]")
+
+
+class _PartialState:
+    """Incremental lexer and classifier behind CommandParser.parse_partial.
+    
+    Completed tokens, the offset at which lexing can restart after each of
+    them, and the classification of completed tokens are kept between calls.
+    """
+    
+    def __init__(self):
+        # Returned by every call, so completing a keystroke allocates no result
+        self.buffer = ParsedCommand()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget the cached prefix."""
+        self.text = ""
+        # Completed tokens and, for each, the offset just past its separator
+        self.tokens = []
+        self.resume = []
+        # Lexer position and the token being built when the text ended
+        self.pos = 0
+        self.token_start = None
+        self.quote_char = None
+        # Classification of tokens[1:self.classified]
+        self.classified = 1
+        self.args = []
+        self.kwargs = {}
+        self.pending = None
+    
+    def parse(self, text: str) -> ParsedCommand:
+        """Parse text, reusing as much of the previous parse as possible.
+        
+        The returned ParsedCommand is overwritten by the next call.
+        """
+        if not text.startswith(self.text):
+            self._rewind(text)
+        self.text = text
+        self._lex()
+        
+        tokens = self.tokens
+        if len(tokens) > self.classified:
+            self.pending = _classify_partial(
+                tokens, self.classified, self.args, self.kwargs, self.pending
+            )
+            self.classified = len(tokens)
+        
+        # Add the last token even if incomplete
+        if self.token_start is not None:
+            tail = text[self.token_start:]
+        elif text.endswith(' '):
+            tail = ""
+        else:
+            tail = None
+        
+        buffer = self.buffer
+        args = buffer.args
+        kwargs = buffer.kwargs
+        kwargs.clear()
+        if not tokens and tail is None:
+            buffer.command = None
+            args.clear()
+            return buffer
+        
+        command = tokens[0] if tokens else tail
+        args[:] = self.args
+        kwargs.update(self.kwargs)
+        pending = self.pending
+        if tail is not None and tokens:
+            pending = _classify_partial([tail], 0, args, kwargs, pending)
+        if pending is not None:
+            kwargs[pending] = ''
+        
+        buffer.command = command or None
+        return buffer
+    
+    def _rewind(self, text: str) -> None:
+        """Drop cached state that depends on text after the common prefix."""
+        old = self.text
+        if old.startswith(text):
+            # Deleting from the end
+            common = len(text)
+        else:
+            common = 0
+            limit = min(len(old), len(text))
+            while common < limit and old[common] == text[common]:
+                common += 1
+        
+        # Restart after the last completed token that lies inside the common prefix
+        keep = bisect_right(self.resume, common)
+        if keep == 0:
+            self.reset()
+            return
+        
+        del self.tokens[keep:]
+        del self.resume[keep:]
+        self.pos = self.resume[-1]
+        self.token_start = None
+        self.quote_char = None
+        if self.classified > keep:
+            self.classified = 1
+            self.args = []
+            self.kwargs = {}
+            self.pending = None
+    
+    def _lex(self) -> None:
+        """Lex text from the saved position to the end."""
+        text = self.text
+        pos = self.pos
+        end = len(text)
+        token_start = self.token_start
+        quote_char = self.quote_char
+        
+        while pos < end:
+            if quote_char is not None:
+                # Inside quotes everything up to the closing quote belongs to the token
+                close = text.find(quote_char, pos)
+                if close < 0:
+                    pos = end
+                    break
+                quote_char = None
+                pos = close + 1
+                continue
+            
+            match = _PARTIAL_SPECIAL_RE.search(text, pos)
+            if match is None:
+                if token_start is None:
+                    token_start = pos
+                pos = end
+                break
+            
+            index = match.start()
+            if token_start is None and index > pos:
+                token_start = pos
+            if text[index] == ' ':
+                if token_start is not None:
+                    self.tokens.append(text[token_start:index])
+                    self.resume.append(index + 1)
+                    token_start = None
+            else:
+                if token_start is None:
+                    token_start = index
+                quote_char = text[index]
+            pos = index + 1
+        
+        self.pos = pos
+        self.token_start = token_start
+        self.quote_char = quote_char
+
+
+def _classify_partial(tokens, start, args, kwargs, pending):
+    """Classify tokens[start:] into args and kwargs for partial parsing.
+    
+    Returns:
+        Name of an option still waiting for its value, or None
+    """
+    for token in tokens[start:]:
+        if pending is not None:
+            kwargs[pending] = token
+            pending = None
+        elif token.startswith('--'):
+            option_name = token[2:].replace('-', '_')
+            if '=' in option_name:
+                option_name, value = option_name.split('=', 1)
+                kwargs[option_name] = value
+            else:
+                pending = option_name
+        elif token.startswith('-') and len(token) > 1:
+            option_name = token[1:]
+            if len(option_name) == 1:
+                pending = option_name
+            elif '=' in option_name:
+                option_name, value = option_name.split('=', 1)
+                kwargs[option_name] = value
+            else:
+                kwargs[option_name] = 'true'
+        else:
+            args.append(token)
+    return pending
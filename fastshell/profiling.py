@@ -0,0 +1,92 @@
+"""Per-phase timing of command executions for FastShell."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Phases of one command line execution, in order
+PHASES = ("parse", "bind", "validate", "call", "format")
+
+
+class ExecutionProfile:
+    """Time spent in each phase of executing one command line.
+
+    - parse: splitting and classifying the command line
+    - bind: mapping values to parameters and loading @file arguments
+    - validate: converting and validating values
+    - call: running the command functions, including awaiting coroutines
+    - format: rendering the result; for streamed results this includes
+      producing the items
+    """
+
+    __slots__ = ("command_line", "commands", "phases", "error")
+
+    def __init__(self, command_line: str):
+        """Initialize profile.
+
+        Args:
+            command_line: Command line being executed
+        """
+        self.command_line = command_line
+        self.commands: List[str] = []
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.error: Optional[BaseException] = None
+
+    @property
+    def total(self) -> float:
+        """Seconds spent in all phases."""
+        return sum(self.phases.values())
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase] += time.perf_counter() - start
+
+    def timed(self, phase: str, func: Callable) -> Callable:
+        """Wrap a function so that the time spent in it is added to a phase."""
+        phases = self.phases
+        perf_counter = time.perf_counter
+
+        def wrapper(*args: Any) -> Any:
+            start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                phases[phase] += perf_counter() - start
+        return wrapper
+
+    def format_table(self) -> str:
+        """Render the phase timings as an aligned text table."""
+        total = self.total
+        lines = [f"{'phase':<10} {'ms':>10} {'share':>7}"]
+        for phase, seconds in self.phases.items():
+            share = seconds / total if total else 0.0
+            lines.append(f"{phase:<10} {seconds * 1e3:>10.3f} {share:>7.1%}")
+        lines.append(f"{'total':<10} {total * 1e3:>10.3f}")
+        return "\n".join(lines)
+
+
+# Receives the profile of every execution once it completes
+ProfileHook = Callable[[ExecutionProfile], Any]
+
+
+def format_stats(profiler: Any, limit: int = 15) -> str:
+    """Render the functions with the highest cumulative time of a cProfile run.
+
+    Args:
+        profiler: Disabled cProfile.Profile
+        limit: Number of functions to list
+
+    Returns:
+        pstats report text
+    """
+    import io
+    import pstats
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue().strip()
@@ -1,16 +1,32 @@
 """Type definitions for FastShell."""
 
 from enum import Enum
-from typing import Any, Type, Optional
-from dataclasses import dataclass
+from typing import Any, List, Tuple, Type, Optional
+from dataclasses import dataclass, field, fields
+
+
+def _slotted(cls: type) -> type:
+    """Rebuild a dataclass with ``__slots__`` instead of a per-instance ``__dict__``.
+    
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 
 class ParameterType(Enum):
     """Parameter type enumeration."""
     ARGUMENT = "argument"  # Positional argument
     OPTION = "option"     # Named option/flag
+    INJECTED = "injected"  # Supplied by the shell, e.g. a CancellationToken
 
 
+@_slotted
 @dataclass
 class Parameter:
     """Represents a command parameter."""
@@ -28,6 +44,7 @@ class Parameter:
         return self.type == bool and self.parameter_type == ParameterType.OPTION
 
 
+@_slotted
 @dataclass
 class ParsedCommand:
     """Represents a parsed command line."""
@@ -41,3 +58,49 @@ class ParsedCommand:
             self.args = []
         if self.kwargs is None:
             self.kwargs = {}
+
+
+class FileReference(str):
+    """Command line token naming a file to read an argument value from.
+    
+    The token keeps its text ("@path"), so it can be handled like any other
+    token until the command binds its arguments.
+    """
+    
+    __slots__ = ()
+    
+    @property
+    def path(self) -> str:
+        """Path of the referenced file."""
+        return self[1:]
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of running a script of commands."""
+    
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    stopped_early: bool = False
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    
+    @property
+    def commands_per_second(self) -> float:
+        """Throughput of the run."""
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class ExecutionOutcome:
+    """Result of one run of a command in a fan-out."""
+    
+    input: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the run succeeded."""
+        return self.error is None
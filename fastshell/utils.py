@@ -1,10 +1,17 @@
 """Utility functions for FastShell."""
 
+import array
 import re
 import types
-from typing import Any, Type, Dict, Union
+from typing import Any, Callable, Iterator, Optional, Type, Dict, Union
+# typing gained Annotated in 3.9; its get_origin does not recognize the backport
+from typing_extensions import Annotated, get_args, get_origin
 
 from .exceptions import TypeConversionError
+from .index import PrefixIndex
+
+# Type of X | Y unions (Python 3.10+); no instance matches an empty tuple
+_UNION_TYPE = getattr(types, 'UnionType', ())
 
 
 def parse_docstring(docstring: str) -> Dict[str, Any]:
@@ -71,6 +78,13 @@ def parse_docstring(docstring: str) -> Dict[str, Any]:
     }
 
 
+# Strings accepted as True by boolean parameters
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on', 'y'))
+
+# Converters built by get_converter, by target type
+_converters: Dict[Any, Callable[[str], Any]] = {}
+
+
 def convert_value(value: str, target_type: Type) -> Any:
     """Convert a string value to the target type.
     
@@ -84,91 +98,247 @@ def convert_value(value: str, target_type: Type) -> Any:
     Raises:
         TypeConversionError: If conversion fails
     """
-    if target_type == str:
-        return value
+    return get_converter(target_type)(value)
+
+
+def get_converter(target_type: Type) -> Callable[[str], Any]:
+    """Get a function converting strings to the target type.
     
+    The type is analysed once and the converter is memoized, so repeated
+    conversions do no type introspection.
+    
+    Args:
+        target_type: Target type to convert to
+        
+    Returns:
+        Converter raising TypeConversionError if conversion fails
+    """
     try:
-        if target_type == bool:
-            return value.lower() in ('true', '1', 'yes', 'on', 'y')
-        elif target_type == int:
-            return int(value)
-        elif target_type == float:
-            return float(value)
-        elif hasattr(target_type, '__origin__') or isinstance(target_type, types.UnionType):
-            # Handle generic types like List[str], Optional[int], etc.
-            if isinstance(target_type, types.UnionType):
-                # Handle new-style Union types (Python 3.10+)
-                args = target_type.__args__
-                if len(args) == 2 and type(None) in args:
-                    # This is Optional[T] (T | None)
-                    non_none_type = args[0] if args[1] == type(None) else args[1]
-                    return convert_value(value, non_none_type)
-                else:
-                    # Try each type in the union
-                    for arg_type in args:
-                        try:
-                            return convert_value(value, arg_type)
-                        except (ValueError, TypeConversionError):
-                            continue
-                    raise ValueError(f"Cannot convert '{value}' to any type in {target_type}")
-            
-            origin = target_type.__origin__
-            
-            if origin == Union:
-                # Handle Optional[T] (which is Union[T, None])
-                args = target_type.__args__
-                if len(args) == 2 and type(None) in args:
-                    # This is Optional[T]
-                    non_none_type = args[0] if args[1] == type(None) else args[1]
-                    return convert_value(value, non_none_type)
-                else:
-                    # Try each type in the union
-                    for arg_type in args:
-                        try:
-                            return convert_value(value, arg_type)
-                        except (ValueError, TypeConversionError):
-                            continue
-                    raise ValueError(f"Cannot convert '{value}' to any type in {target_type}")
-            
-            elif origin in (list, List):
-                # Handle List[T]
-                if target_type.__args__:
-                    item_type = target_type.__args__[0]
-                    # Split by comma and convert each item
-                    items = [item.strip() for item in value.split(',')]
-                    return [convert_value(item, item_type) for item in items if item]
-                else:
-                    return value.split(',')
-            
-            else:
-                # For other generic types, try direct conversion
-                return target_type(value)
+        return _converters[target_type]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotation
+        return _build_converter(target_type)
+    
+    converter = _converters[target_type] = _build_converter(target_type)
+    return converter
+
+
+def _build_converter(target_type: Type) -> Callable[[str], Any]:
+    """Create the converter for a target type."""
+    if target_type == str:
+        return _identity
+    
+    if target_type == bool:
+        convert = lambda value: value.lower() in _TRUE_VALUES
+    elif target_type == int:
+        convert = int
+    elif target_type == float:
+        convert = float
+    elif isinstance(target_type, _UNION_TYPE) or get_origin(target_type) is Union:
+        convert = _union_converter(target_type)
+    elif get_origin(target_type) in (list, List):
+        item_types = get_args(target_type)
+        if not item_types:
+            convert = lambda value: value.split(',')
+        else:
+            convert = _list_converter(item_types[0])
+    elif target_type is array.array:
+        convert = _array_converter(None)
+    elif get_origin(target_type) is Annotated:
+        base_type, *metadata = get_args(target_type)
+        if base_type is array.array and metadata and metadata[0] in array.typecodes:
+            convert = _array_converter(metadata[0])
+        else:
+            return get_converter(base_type)
+    elif hasattr(target_type, '__origin__'):
+        # For other generic types, try direct conversion
+        convert = target_type
+    elif hasattr(target_type, '__members__'):  # Enum
+        convert = _enum_converter(target_type)
+    else:
+        # Try direct conversion
+        convert = target_type
+    
+    return _checked(convert, getattr(target_type, '__name__', str(target_type)))
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+def _checked(convert: Callable[[str], Any], type_name: str) -> Callable[[str], Any]:
+    """Report a converter's ValueError and TypeError as TypeConversionError."""
+    def converter(value: str) -> Any:
+        try:
+            return convert(value)
+        except (ValueError, TypeError) as e:
+            raise TypeConversionError(f"Cannot convert '{value}' to {type_name}: {e}")
+    converter.raw = convert
+    return converter
+
+
+def _list_converter(item_type: Type) -> Callable[[str], list]:
+    """Create the converter for List[T], splitting on commas."""
+    convert_item = get_converter(item_type)
+    convert_raw = getattr(convert_item, 'raw', convert_item)
+    
+    def convert(value: str) -> list:
+        # Split by comma and convert each item
+        items = [item.strip() for item in value.split(',')]
+        try:
+            return [convert_raw(item) for item in items if item]
+        except (ValueError, TypeError):
+            # Convert again to report the failing item
+            return [convert_item(item) for item in items if item]
+    
+    if item_type not in (int, float):
+        return convert
+    
+    def convert_numbers(value: str) -> list:
+        # int() and float() ignore surrounding whitespace, so well-formed
+        # lists convert in a single pass; empty or bad items take the slow path
+        try:
+            return list(map(item_type, value.split(',')))
+        except ValueError:
+            return convert(value)
+    return convert_numbers
+
+
+def _array_converter(typecode: Optional[str]) -> Callable[[str], array.array]:
+    """Create the converter for comma-separated numbers stored in an array.
+    
+    Without a typecode, integers are stored as 'q' and anything else as 'd'.
+    """
+    def fill(code: str, items: list) -> array.array:
+        return array.array(code, map(float if code in 'fd' else int, items))
+    
+    def convert(value: str) -> array.array:
+        items = value.split(',')
+        try:
+            try:
+                return fill(typecode or 'q', items)
+            except ValueError:
+                # Skip empty items, as for lists, before choosing the typecode
+                items = [item for item in items if item.strip()]
+            if typecode is not None:
+                return fill(typecode, items)
+            try:
+                return fill('q', items)
+            except ValueError:
+                return fill('d', items)
+        except OverflowError as e:
+            raise ValueError(e)
+    return convert
+
+
+def _union_converter(target_type: Type) -> Callable[[str], Any]:
+    """Create the converter for Optional[T] and Union types."""
+    args = get_args(target_type)
+    if len(args) == 2 and type(None) in args:
+        # This is Optional[T]
+        return get_converter(args[0] if args[1] is type(None) else args[1])
+    
+    # Try each type in the union
+    converters = [get_converter(arg_type) for arg_type in args]
+    
+    def convert(value: str) -> Any:
+        for converter in converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeConversionError):
+                continue
+        raise ValueError(f"Cannot convert '{value}' to any type in {target_type}")
+    return convert
+
+
+def _enum_converter(target_type: Type) -> Callable[[str], Any]:
+    """Create the converter for an Enum type."""
+    lookup = get_enum_lookup(target_type).lookup
+    
+    def convert(value: str) -> Any:
+        member = lookup(value)
+        if member is None:
+            raise ValueError(f"'{value}' is not a valid {target_type.__name__}")
+        return member
+    return convert
+
+
+class EnumLookup:
+    """Lookup tables for an Enum type, shared by conversion and completion.
+    
+    Members are found by value, by name and by case-insensitive name with
+    dictionary lookups instead of a scan over the members.
+    """
+    
+    def __init__(self, enum_type: Type):
+        """Build the tables.
         
-        elif hasattr(target_type, '__members__'):  # Enum
-            # Handle enum types
-            if hasattr(target_type, '_value2member_map_'):
-                # Try by value first
-                if value in target_type._value2member_map_:
-                    return target_type._value2member_map_[value]
-            
-            # Try by name
-            if hasattr(target_type, '_name2value_'):
-                if value in target_type._name2value_:
-                    return target_type[value]
-            
-            # Try case-insensitive name match
-            for member in target_type:
-                if member.name.lower() == value.lower():
-                    return member
+        Args:
+            enum_type: Enum class
+        """
+        self.enum_type = enum_type
+        self._by_value = enum_type._value2member_map_
+        self._by_name = dict(enum_type.__members__)
+        self._by_folded_name = {}
+        for name, member in self._by_name.items():
+            self._by_folded_name.setdefault(name.casefold(), member)
+        # Casefolded name -> name, built on first completion
+        self._names = None
+    
+    def lookup(self, value: str) -> Any:
+        """Find the member for a command line value.
+        
+        Args:
+            value: Member value, name or case-insensitive name
             
-            raise ValueError(f"'{value}' is not a valid {target_type.__name__}")
+        Returns:
+            Enum member, or None if nothing matches
+        """
+        try:
+            if value in self._by_value:
+                return self._by_value[value]
+        except TypeError:
+            # Unhashable value
+            return None
+        member = self._by_name.get(value)
+        if member is None:
+            member = self._by_folded_name.get(value.casefold())
+        return member
+    
+    def names_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Iterate member names starting with prefix, ignoring case.
         
-        else:
-            # Try direct conversion
-            return target_type(value)
+        Args:
+            prefix: Prefix being typed
+            
+        Yields:
+            Member names in sorted order
+        """
+        if self._names is None:
+            self._names = PrefixIndex((name.casefold(), name) for name in reversed(self._by_name))
+        for _, name in self._names.items_with_prefix(prefix.casefold()):
+            yield name
+
+
+# Enum lookups built by get_enum_lookup, by Enum type
+_enum_lookups: Dict[Type, EnumLookup] = {}
+
+
+def get_enum_lookup(enum_type: Type) -> EnumLookup:
+    """Get the memoized lookup tables for an Enum type.
     
-    except (ValueError, TypeError) as e:
-        raise TypeConversionError(f"Cannot convert '{value}' to {target_type.__name__}: {e}")
+    Args:
+        enum_type: Enum class
+        
+    Returns:
+        EnumLookup instance
+    """
+    lookup = _enum_lookups.get(enum_type)
+    if lookup is None:
+        lookup = _enum_lookups[enum_type] = EnumLookup(enum_type)
+    return lookup
 
 
 def format_type_name(type_obj: Type) -> str:
@@ -182,7 +352,7 @@ def format_type_name(type_obj: Type) -> str:
     """
     from typing import Union
     
-    if isinstance(type_obj, types.UnionType):
+    if isinstance(type_obj, _UNION_TYPE):
         # Handle new-style Union types (Python 3.10+)
         args = type_obj.__args__
         if len(args) == 2 and type(None) in args:
@@ -7,18 +7,33 @@ including support for complex types, custom validators, and better error message
 """
 
 import types
-from typing import Any, Type, Union, get_origin, get_args
-from pydantic import BaseModel, ValidationError, Field
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING, Any, Type, Union, get_origin, get_args
+from typing_extensions import Annotated
 
 from .exceptions import TypeConversionError
 
+if TYPE_CHECKING:
+    # Pydantic is imported when the first validator is built
+    from pydantic import ValidationError
+
+
+ValidatorCacheInfo = namedtuple("ValidatorCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Marks a cache entry for a type Pydantic cannot build a schema for
+_NO_ADAPTER = object()
+
+# Type of X | Y unions (Python 3.10+); no instance matches an empty tuple
+_UNION_TYPE = getattr(types, 'UnionType', ())
+
 
 class ValidationConfig:
     """Configuration for validation behavior."""
     
-    def __init__(self, use_pydantic: bool = True, strict_mode: bool = False):
+    def __init__(self, use_pydantic: bool = True, strict_mode: bool = False, cache_size: int = 256):
         self.use_pydantic = use_pydantic
         self.strict_mode = strict_mode
+        self.cache_size = cache_size
 
 
 class EnhancedValidator:
@@ -26,6 +41,9 @@ class EnhancedValidator:
     
     def __init__(self, config: ValidationConfig = None):
         self.config = config or ValidationConfig()
+        self._adapters = OrderedDict()
+        self._hits = 0
+        self._misses = 0
     
     def validate_and_convert(self, value: str, target_type: Type, field_name: str = "value") -> Any:
         """Validate and convert a string value to the target type using Pydantic.
@@ -45,43 +63,120 @@ class EnhancedValidator:
             # Fallback to original validation
             return self._fallback_convert(value, target_type)
         
+        adapter = self._get_adapter(target_type, field_name)
+        if adapter is _NO_ADAPTER:
+            return self._fallback_convert(value, target_type)
+        
         try:
-            # Create a dynamic Pydantic model for validation
-            model_fields = {
-                field_name: (target_type, Field(...))
-            }
-            
-            # Configure model with strict validation
-            class Config:
-                str_strip_whitespace = True
-                validate_assignment = True
-                # Allow coercion for basic types but be strict about invalid values
-                
-            DynamicModel = type(
-                'DynamicValidationModel',
-                (BaseModel,),
-                {
-                    '__annotations__': {field_name: target_type},
-                    'Config': Config,
-                    **model_fields
-                }
-            )
-            
-            # Create model instance with the value
-            model_data = {field_name: value}
-            instance = DynamicModel(**model_data)
+            if isinstance(value, str) and self._is_list(target_type):
+                # Lists are passed on the command line as comma-separated values
+                items = [item.strip() for item in value.split(',')]
+                value = [item for item in items if item]
+            return adapter.validate_python(value)
             
-            return getattr(instance, field_name)
+        except Exception as e:
+            from pydantic import ValidationError
             
-        except ValidationError as e:
+            if not isinstance(e, ValidationError):
+                # Fallback for any other errors
+                return self._fallback_convert(value, target_type)
+            if hasattr(target_type, '__members__'):
+                # Pydantic only matches enum values; keep accepting member names
+                try:
+                    return self._fallback_convert(value, target_type)
+                except TypeConversionError:
+                    pass
             # Extract meaningful error message
             error_msg = self._format_pydantic_error(e, field_name, target_type)
             raise TypeConversionError(error_msg)
-        except Exception as e:
-            # Fallback for any other errors
-            return self._fallback_convert(value, target_type)
     
-    def _format_pydantic_error(self, error: ValidationError, field_name: str, target_type: Type) -> str:
+    def cache_info(self) -> ValidatorCacheInfo:
+        """Report validator cache statistics.
+        
+        Returns:
+            ValidatorCacheInfo with hits, misses, maxsize and currsize
+        """
+        return ValidatorCacheInfo(self._hits, self._misses, self.config.cache_size, len(self._adapters))
+    
+    def cache_clear(self) -> None:
+        """Drop all cached validators and reset the statistics."""
+        self._adapters.clear()
+        self._hits = 0
+        self._misses = 0
+    
+    def _get_adapter(self, target_type: Type, field_name: str) -> Any:
+        """Get the compiled validator for a (type, field) pair, building it on a miss."""
+        key = (target_type, field_name)
+        try:
+            adapter = self._adapters[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable type annotation - build a validator without caching it
+            self._misses += 1
+            return self._build_adapter(target_type)
+        else:
+            self._hits += 1
+            self._adapters.move_to_end(key)
+            return adapter
+        
+        self._misses += 1
+        adapter = self._build_adapter(target_type)
+        if self.config.cache_size > 0:
+            self._adapters[key] = adapter
+            if len(self._adapters) > self.config.cache_size:
+                self._adapters.popitem(last=False)
+        return adapter
+    
+    def _build_adapter(self, target_type: Type) -> Any:
+        """Build a Pydantic TypeAdapter for the target type.
+        
+        Types involving bool keep the legacy conversion, where any value
+        outside the truthy set is False rather than an error, and so do
+        containers of enums, whose items may be given by member name. Strings
+        are passed through unchanged, also like the legacy conversion.
+        Pydantic does accept integral float strings such as "5.0" for int.
+        """
+        if self._needs_legacy(target_type):
+            return _NO_ADAPTER
+        
+        from pydantic import Field, TypeAdapter
+        
+        annotated = target_type
+        if self._is_multi_union(target_type):
+            # Try union members in declaration order, like the legacy converter
+            annotated = Annotated[target_type, Field(union_mode='left_to_right')]
+        
+        try:
+            return TypeAdapter(annotated)
+        except Exception:
+            return _NO_ADAPTER
+    
+    @classmethod
+    def _needs_legacy(cls, type_obj: Type, nested: bool = False) -> bool:
+        """Check if a type is bool or has bool or an enum among its type arguments."""
+        if type_obj is bool or (nested and hasattr(type_obj, '__members__')):
+            return True
+        return any(cls._needs_legacy(arg, True) for arg in get_args(type_obj))
+    
+    @staticmethod
+    def _is_list(type_obj: Type) -> bool:
+        """Check if a type is List[T] or Optional[List[T]]."""
+        if isinstance(type_obj, _UNION_TYPE) or get_origin(type_obj) is Union:
+            args = [arg for arg in get_args(type_obj) if arg is not type(None)]
+            if len(args) != 1:
+                return False
+            type_obj = args[0]
+        return get_origin(type_obj) is list
+    
+    @staticmethod
+    def _is_multi_union(type_obj: Type) -> bool:
+        """Check if a type is a Union with more than one non-None member."""
+        if not (isinstance(type_obj, _UNION_TYPE) or get_origin(type_obj) is Union):
+            return False
+        return len([arg for arg in get_args(type_obj) if arg is not type(None)]) > 1
+    
+    def _format_pydantic_error(self, error: "ValidationError", field_name: str, target_type: Type) -> str:
         """Format Pydantic validation error into a user-friendly message."""
         errors = error.errors()
         if not errors:
@@ -105,12 +200,12 @@ class EnhancedValidator:
     
     def _fallback_convert(self, value: str, target_type: Type) -> Any:
         """Fallback conversion method (original logic)."""
-        from .utils import convert_value
-        return convert_value(value, target_type)
+        from .utils import get_converter
+        return get_converter(target_type)(value)
     
     def _format_type_name(self, type_obj: Type) -> str:
         """Format a type object into a readable string."""
-        if isinstance(type_obj, types.UnionType):
+        if isinstance(type_obj, _UNION_TYPE):
             # Handle new-style Union types (Python 3.10+)
             args = type_obj.__args__
             if len(args) == 2 and type(None) in args:
@@ -159,6 +254,11 @@ def validate_and_convert(value: str, target_type: Type, field_name: str = "value
     return _global_validator.validate_and_convert(value, target_type, field_name)
 
 
+def get_validator_cache_info() -> ValidatorCacheInfo:
+    """Get cache statistics of the global validator."""
+    return _global_validator.cache_info()
+
+
 # Import List for type annotations
 try:
     from typing import List
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+测试异步命令与应用级事件循环
+"""
+
+import sys
+import os
+import asyncio
+import io
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import FastShell
+
+app = FastShell(name="async-test")
+pool = {}
+
+
+@app.command()
+async def connect(name: str):
+    """打开一个连接。
+
+    Args:
+        name: 连接名称
+    """
+    await asyncio.sleep(0)
+    pool[name] = asyncio.get_running_loop()
+    return name
+
+
+@app.command()
+async def same_loop(name: str):
+    """检查连接是否在同一个事件循环中。
+
+    Args:
+        name: 连接名称
+    """
+    return pool.get(name) is asyncio.get_running_loop()
+
+
+@app.command()
+def add(a: int, b: int):
+    """同步命令。"""
+    return a + b
+
+
+@app.command()
+def nested(name: str):
+    """在同步命令中执行异步命令。
+
+    Args:
+        name: 连接名称
+    """
+    return app.execute_command(f"connect {name}", format_output=False)
+
+
+def test_async_command_result():
+    """异步命令的结果被等待并返回"""
+    assert app.commands["connect"].is_async
+    assert app.execute_command("connect db", format_output=False) == "db"
+
+
+def test_loop_persists_between_commands():
+    """多次调用共享同一个事件循环"""
+    app.execute_command("connect cache", format_output=False)
+    assert app.execute_command("same_loop cache", format_output=False) is True
+
+
+def test_execute_command_async():
+    """在应用的事件循环中直接等待命令"""
+    result = app.loop.run_until_complete(app.execute_command_async("same_loop db", format_output=False))
+    assert result is True
+    assert app.loop.run_until_complete(app.execute_command_async("add 1 2", format_output=False)) == 3
+
+
+def test_nested_async_command_on_loop_thread():
+    """在事件循环线程上等待异步命令时报错而不是死锁"""
+    console = app.console
+    app.console = Console(file=io.StringIO())
+    try:
+        result = app.loop.run_until_complete(app.execute_command_async("nested inner", format_output=False))
+        assert result is None
+        assert "use execute_command_async" in app.console.file.getvalue()
+    finally:
+        app.console = console
+    # 不在事件循环上时照常执行
+    assert app.execute_command("nested outer", format_output=False) == "outer"
+
+
+def test_close():
+    """close 关闭事件循环，之后按需重新创建"""
+    loop = app.loop
+    app.close()
+    assert loop.is_closed()
+    assert app.execute_command("add 2 3", format_output=False) == 5
+    assert app.execute_command("connect fresh", format_output=False) == "fresh"
+    assert app.loop is not loop
+
+
+if __name__ == "__main__":
+    print("Testing async commands...")
+    test_async_command_result()
+    test_loop_persists_between_commands()
+    test_execute_command_async()
+    test_nested_async_command_on_loop_thread()
+    test_close()
+    print("All async command tests passed!")
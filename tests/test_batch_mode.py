@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+测试批处理脚本模式
+"""
+
+import sys
+import os
+import io
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell import FastShell
+
+app = FastShell(name="batch-test")
+calls = []
+
+
+@app.command()
+def record(value: int):
+    """记录一个整数。
+
+    Args:
+        value: 整数值
+    """
+    calls.append(value)
+    return value
+
+
+SCRIPT = """# 注释行会被跳过
+record 1
+
+record abc
+missing
+record 2
+"""
+
+
+def test_run_script_collects_errors():
+    """逐行报告错误并继续执行"""
+    calls.clear()
+    summary = app.run_script(io.StringIO(SCRIPT), show_summary=False)
+    assert calls == [1, 2]
+    assert summary.total == 4
+    assert summary.succeeded == 2
+    assert summary.failed == 2
+    assert [line for line, _ in summary.errors] == [4, 5]
+    assert not summary.stopped_early
+
+
+def test_run_script_stop_on_error():
+    """遇到错误时停止"""
+    calls.clear()
+    summary = app.run_script(io.StringIO(SCRIPT), stop_on_error=True, show_summary=False)
+    assert calls == [1]
+    assert summary.failed == 1
+    assert summary.stopped_early
+
+
+def test_run_script_exit():
+    """exit 提前结束脚本"""
+    calls.clear()
+    summary = app.run_script(io.StringIO("record 1\nexit\nrecord 2\n"), show_summary=False)
+    assert calls == [1]
+    assert summary.total == 1
+
+
+if __name__ == "__main__":
+    print("Testing batch mode...")
+    test_run_script_collects_errors()
+    test_run_script_stop_on_error()
+    test_run_script_exit()
+    print("All batch mode tests passed!")
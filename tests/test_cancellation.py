@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+测试命令取消与超时
+"""
+
+import sys
+import os
+import io
+import asyncio
+import signal
+import threading
+import time
+from typing import Iterator
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import CancellationToken, FastShell
+from fastshell.exceptions import CommandCancelled, CommandTimeout
+
+app = FastShell(name="cancel-test", default_timeout=5)
+app.console = Console(file=io.StringIO())
+
+
+@app.command(timeout=0.3)
+def scan(limit: int, token: CancellationToken, step: float = 0.001):
+    """协作式扫描。
+
+    Args:
+        limit: 上限
+        step: 间隔
+    """
+    for i in range(limit):
+        token.raise_if_cancelled()
+        time.sleep(step)
+    return limit
+
+
+@app.command()
+def busy():
+    """不检查令牌的忙循环。"""
+    while True:
+        time.sleep(0.005)
+
+
+@app.command(timeout=0.3)
+async def hang():
+    """永不返回的异步命令。"""
+    await asyncio.sleep(30)
+
+
+@app.command(timeout=0.3)
+def ticks() -> Iterator[int]:
+    """无限生成。"""
+    i = 0
+    while True:
+        time.sleep(0.005)
+        yield i
+        i += 1
+
+
+@app.command()
+async def probe(seconds: float = 0.01):
+    """内部等待自行超时。
+
+    Args:
+        seconds: 内部时限
+    """
+    await asyncio.wait_for(asyncio.sleep(30), seconds)
+
+
+def expect(error, func, *args, **kwargs):
+    """断言调用抛出指定异常"""
+    try:
+        func(*args, **kwargs)
+    except error:
+        pass
+    else:
+        raise AssertionError(f"expected {error.__name__}")
+
+
+def test_token_is_injected_and_hidden():
+    """令牌按类型注入，不出现在帮助和参数中"""
+    command = app.get_command("scan")
+    assert command.token_parameter == "token"
+    assert [p.name for p in command._arg_params] == ["limit", "step"]
+    assert "token" not in command.get_help()
+    assert app._execute("scan 3", format_output=False) == 3
+
+
+def test_deadlines():
+    """同步、异步与流式命令在截止时间后停止"""
+    expect(CommandTimeout, app._execute, "scan 100000", False)
+    expect(CommandTimeout, app._execute, "hang", False)
+    expect(CommandTimeout, app._execute, "ticks", True)
+
+    token = CancellationToken()
+    threading.Timer(0.02, token.cancel).start()
+    expect(CommandCancelled, app._execute, "scan 100000 --step 0.001", False, token)
+
+
+def test_command_timeout_error_is_not_a_deadline():
+    """命令自身抛出的 TimeoutError 原样传出"""
+    for timeout in (5, None):
+        app.default_timeout = timeout
+        try:
+            app._execute("probe", False)
+        except CommandTimeout:
+            raise AssertionError("inner timeout reported as deadline")
+        except asyncio.TimeoutError:
+            pass
+        else:
+            raise AssertionError("expected TimeoutError")
+        finally:
+            app.default_timeout = 5
+
+
+def test_interrupt_cancels_only_the_command():
+    """Ctrl-C 只取消正在运行的命令"""
+    loop = app.loop
+
+    async def interrupted(line, sender):
+        token = CancellationToken()
+        with app._interrupt_cancels(token):
+            sender()
+            await app._execute_async(line, False, token)
+
+    def send_later():
+        threading.Timer(0.05, os.kill, (os.getpid(), signal.SIGINT)).start()
+
+    expect(CommandCancelled, loop.run_until_complete, interrupted("busy", send_later))
+
+    hang = app.get_command("hang")
+    hang.timeout = None
+    try:
+        expect(CommandCancelled, loop.run_until_complete, interrupted("hang", send_later))
+    finally:
+        hang.timeout = 0.3
+
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+    assert app.execute_command("scan 2", format_output=False) == 2
+
+
+if __name__ == "__main__":
+    print("Testing cancellation...")
+    test_token_is_injected_and_hidden()
+    test_deadlines()
+    test_command_timeout_error_is_not_a_deadline()
+    test_interrupt_cancels_only_the_command()
+    print("All cancellation tests passed!")
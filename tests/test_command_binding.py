@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+测试命令参数绑定计划
+"""
+
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.command import Command
+from fastshell.exceptions import InvalidArguments
+
+
+def greet(name: str, times: int = 1, *, suffix: str, loud: bool = False):
+    """问候。
+
+    Args:
+        name: 名字
+        times: 次数
+    """
+    text = f"{name}{suffix}" * times
+    return text.upper() if loud else text
+
+
+def test_plan_is_compiled_once():
+    """绑定计划在创建命令时生成"""
+    command = Command.from_function(greet, "greet", use_pydantic=False)
+    assert [p.name for p in command._arg_params] == ["name", "suffix", "loud"]
+    assert set(command._option_params) == {"times"}
+    assert command._arg_slots == {"name": 0, "suffix": 1, "loud": 2}
+
+
+def test_bind_positional_and_options():
+    """位置参数与选项的绑定"""
+    command = Command.from_function(greet, "greet", use_pydantic=False)
+    args, kwargs = command.bind(["bob", "!"], {"times": "2"})
+    assert args == ["bob", "!", False]
+    assert kwargs == {"times": 2}
+    assert command.execute([], {"name": "bob", "suffix": "!", "times": "2"}) == "bob!bob!"
+
+
+def test_bind_arguments_by_name():
+    """以关键字提供位置参数时，其余位置参数按名字绑定"""
+    command = Command.from_function(greet, "greet", use_pydantic=False)
+    args, kwargs = command.bind(["?", "yes"], {"name": "amy"})
+    assert args == []
+    assert kwargs == {"name": "amy", "suffix": "?", "loud": True, "times": 1}
+
+
+def test_missing_required_argument():
+    """缺少必需参数"""
+    command = Command.from_function(greet, "greet", use_pydantic=False)
+    try:
+        command.bind([], {})
+    except InvalidArguments as e:
+        assert "name" in str(e)
+    else:
+        raise AssertionError("expected InvalidArguments")
+
+
+if __name__ == "__main__":
+    print("Testing command binding plan...")
+    test_plan_is_compiled_once()
+    test_bind_positional_and_options()
+    test_bind_arguments_by_name()
+    test_missing_required_argument()
+    print("All command binding tests passed!")
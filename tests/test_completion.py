@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+测试命令和选项的自动补全索引
+"""
+
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.document import Document
+
+from fastshell import FastShell
+from fastshell.completer import FastShellCompleter
+from fastshell.index import PrefixIndex
+
+app = FastShell(name="completion-test")
+
+
+@app.command()
+def deploy(service: str, replicas: int = 1, *, region: str, dry_run: bool = False):
+    """部署服务。
+
+    Args:
+        service: 服务名
+        replicas: 副本数
+    """
+    return service
+
+
+@app.command()
+def describe(service: str):
+    """查看服务。"""
+    return service
+
+
+@app.command()
+def status():
+    """查看状态。"""
+    return "ok"
+
+
+def complete(completer, text):
+    """返回补全文本列表"""
+    return [c.text for c in completer.get_completions(Document(text), None)]
+
+
+def test_prefix_index():
+    """前缀索引按排序返回匹配项"""
+    index = PrefixIndex([("beta", 2), ("alpha", 1)])
+    index.add("alps", 3)
+    index.add("b", 4)
+    assert index.keys_with_prefix("al") == ["alpha", "alps"]
+    assert list(index.items_with_prefix("b")) == [("b", 4), ("beta", 2)]
+    assert index.keys_with_prefix("z") == []
+    index.remove("alps")
+    assert index.keys_with_prefix("") == ["alpha", "b", "beta"]
+
+
+def test_command_name_completion():
+    """命令名补全使用注册时构建的索引"""
+    completer = FastShellCompleter(app.commands, app.command_index)
+    assert complete(completer, "de") == ["deploy", "describe"]
+    assert complete(completer, "s") == ["status"]
+
+
+def test_index_follows_add_command():
+    """add_command 会更新索引"""
+    completer = FastShellCompleter(app.commands, app.command_index)
+
+    @app.command()
+    def stop(service: str):
+        """停止服务。"""
+        return service
+
+    assert complete(completer, "st") == ["status", "stop"]
+
+
+def test_index_follows_direct_dict_changes():
+    """直接在字典上删除一个命令并添加另一个时索引随之更新"""
+    commands = dict(app.commands)
+    completer = FastShellCompleter(commands, PrefixIndex())
+    assert "status" in complete(completer, "s")
+
+    commands["start"] = commands.pop("status")
+    names = complete(completer, "st")
+    assert "start" in names and "status" not in names
+
+    # 应用的命令字典与索引始终同步
+    shell = FastShell(name="registry")
+    shell.commands["start"] = commands["start"]
+    shell.commands.update(stop=commands["describe"])
+    del shell.commands["start"]
+    assert shell.command_index.keys_with_prefix("") == ["stop"]
+    assert complete(FastShellCompleter(shell.commands), "st") == ["stop"]
+
+
+def test_option_name_completion():
+    """选项名补全"""
+    completer = FastShellCompleter(app.commands, app.command_index)
+    assert complete(completer, "deploy api --rep") == ["--replicas"]
+
+
+def test_fuzzy_search_ranking():
+    """模糊匹配按子序列得分排序"""
+    index = PrefixIndex((name, None) for name in ["deploy", "describe", "dry_run", "status"])
+    results = index.fuzzy_search("dr", 10)
+    assert [key for _, key, _ in results] == ["dry_run", "describe"]
+    assert results[0][0] > results[1][0]
+    assert index.fuzzy_search("xyz", 10) == []
+    assert len(index.fuzzy_search("s", 1)) == 1
+
+
+def test_fuzzy_completion():
+    """模糊补全限制结果数量并在 display_meta 中显示得分"""
+    completer = FastShellCompleter(app.commands, app.command_index, fuzzy=True, max_results=1)
+    completions = list(completer.get_completions(Document("dpl"), None))
+    assert [c.text for c in completions] == ["deploy"]
+    assert "score" in completions[0].display_meta_text
+
+
+if __name__ == "__main__":
+    print("Testing completion...")
+    test_prefix_index()
+    test_command_name_completion()
+    test_index_follows_add_command()
+    test_index_follows_direct_dict_changes()
+    test_option_name_completion()
+    test_fuzzy_search_ranking()
+    test_fuzzy_completion()
+    print("All completion tests passed!")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+测试预解析的类型转换函数
+"""
+
+import sys
+import os
+import array
+from enum import Enum
+from typing import Annotated, List, Optional, Union
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.exceptions import TypeConversionError
+from fastshell.utils import convert_value, get_converter, get_enum_lookup
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+def test_converter_is_memoized():
+    """同一类型只分析一次"""
+    assert get_converter(List[int]) is get_converter(List[int])
+    assert get_converter(Optional[float]) is get_converter(Optional[float])
+
+
+def test_converter_semantics():
+    """各类型的转换结果"""
+    assert get_converter(str)("x") == "x"
+    assert get_converter(bool)("Yes") is True
+    assert get_converter(bool)("off") is False
+    assert get_converter(List[int])("1, 2,,3") == [1, 2, 3]
+    assert get_converter(Optional[int])("5") == 5
+    assert get_converter(Union[int, str])("abc") == "abc"
+    assert get_converter(int | None)("7") == 7
+    assert get_converter(Color)("green") is Color.GREEN
+    assert get_converter(Color)("Red") is Color.RED
+    assert convert_value("2.5", float) == 2.5
+
+
+def test_conversion_errors():
+    """转换失败统一报告为TypeConversionError"""
+    for value, target_type in (("x", int), ("1,x", List[int]), ("blue", Color)):
+        try:
+            get_converter(target_type)(value)
+        except TypeConversionError:
+            pass
+        else:
+            raise AssertionError(f"expected TypeConversionError for {value!r}")
+
+
+def test_enum_lookup():
+    """枚举按值、名称和忽略大小写的名称查找，并按前缀补全"""
+    Region = Enum("Region", {f"EU_WEST_{i}": f"eu-west-{i}" for i in range(3000)})
+    lookup = get_enum_lookup(Region)
+    assert lookup is get_enum_lookup(Region)
+    assert lookup.lookup("eu-west-42") is Region.EU_WEST_42
+    assert lookup.lookup("EU_WEST_7") is Region.EU_WEST_7
+    assert lookup.lookup("eu_west_7") is Region.EU_WEST_7
+    assert lookup.lookup("nowhere") is None
+    assert list(lookup.names_with_prefix("eu_west_299")) == [
+        "EU_WEST_299", "EU_WEST_2990", "EU_WEST_2991", "EU_WEST_2992", "EU_WEST_2993",
+        "EU_WEST_2994", "EU_WEST_2995", "EU_WEST_2996", "EU_WEST_2997", "EU_WEST_2998",
+        "EU_WEST_2999",
+    ]
+    assert get_converter(Region)("Eu_West_1") is Region.EU_WEST_1
+
+
+def test_bulk_numeric_lists():
+    """数值列表一次性转换，空项和错误项按原逻辑处理"""
+    ids = ",".join(str(i) for i in range(10000))
+    assert get_converter(List[int])(ids) == list(range(10000))
+    assert get_converter(List[int])(" 1, 2 ,,3,") == [1, 2, 3]
+    assert get_converter(List[float])("0.5,1e3") == [0.5, 1000.0]
+
+    packed = get_converter(array.array)(ids)
+    assert packed.typecode == "q" and len(packed) == 10000
+    assert get_converter(array.array)("1,2.5").typecode == "d"
+    assert get_converter(array.array)("1,2,3,") == array.array("q", [1, 2, 3])
+    assert get_converter(Annotated[array.array, "f"])("1, 2,").tolist() == [1.0, 2.0]
+    for value, target_type in (("1,x", List[float]), ("1,300", Annotated[array.array, "b"])):
+        try:
+            get_converter(target_type)(value)
+        except TypeConversionError:
+            pass
+        else:
+            raise AssertionError(f"expected TypeConversionError for {value!r}")
+
+
+if __name__ == "__main__":
+    print("Testing converters...")
+    test_converter_is_memoized()
+    test_converter_semantics()
+    test_conversion_errors()
+    test_enum_lookup()
+    test_bulk_numeric_lists()
+    print("All converter tests passed!")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+测试并行扇出执行（execute_many 和 parallel 内置命令）
+"""
+
+import sys
+import os
+import asyncio
+import io
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell import FastShell
+from fastshell.exceptions import FastShellException
+
+app = FastShell(name="fan-out-test")
+
+
+@app.command()
+def square(value: int, offset: int = 0):
+    """计算平方。
+
+    Args:
+        value: 整数
+        offset: 偏移量
+    """
+    if value == 13:
+        raise ValueError("unlucky")
+    return value * value + offset
+
+
+@app.command()
+async def shout(word: str):
+    """异步转为大写。
+
+    Args:
+        word: 单词
+    """
+    await asyncio.sleep(0)
+    return word.upper()
+
+
+def test_results_in_input_order():
+    """结果按输入顺序收集，错误单独记录"""
+    outcomes = app.execute_many("square", ["3", "1 --offset 5", "13", "x"], workers=4, format_output=False)
+    assert [o.result for o in outcomes] == [9, 6, None, None]
+    assert [o.ok for o in outcomes] == [True, True, False, False]
+    assert str(outcomes[2].error) == "unlucky"
+
+
+def test_async_command_fan_out():
+    """异步命令在应用的事件循环上并发执行"""
+    outcomes = app.execute_many("shout", [["a"], ["b"], ["c"]], workers=2, format_output=False)
+    assert [o.result for o in outcomes] == ["A", "B", "C"]
+
+
+def test_process_pool():
+    """进程池执行"""
+    outcomes = app.execute_many("square", ["2", "4"], workers=2, executor="process", format_output=False)
+    assert [o.result for o in outcomes] == [4, 16]
+
+
+def test_parallel_builtin():
+    """parallel 内置命令替换 {} 并渲染一次结果"""
+    app.run_script(io.StringIO("parallel -j 2 square {} --offset 1 ::: 1 2 3\n"), show_summary=False)
+    try:
+        app._run_parallel("parallel square ::: 1 13")
+    except FastShellException as e:
+        assert "1 of 2" in str(e)
+    else:
+        raise AssertionError("expected FastShellException")
+
+
+def test_parallel_on_running_loop():
+    """事件循环运行时 parallel 内置命令不重入循环"""
+    async def main():
+        await app._run_parallel_async("parallel shout ::: a b")
+        await app._run_parallel_async("parallel -j 2 square ::: 2 3")
+        return await app.execute_many_async("shout", ["x", "y"], format_output=False)
+
+    outcomes = app.loop.run_until_complete(main())
+    assert [o.result for o in outcomes] == ["X", "Y"]
+
+
+if __name__ == "__main__":
+    print("Testing fan-out execution...")
+    test_results_in_input_order()
+    test_async_command_fan_out()
+    test_process_pool()
+    test_parallel_builtin()
+    test_parallel_on_running_loop()
+    print("All fan-out tests passed!")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+测试 @file 文件参数
+"""
+
+import sys
+import os
+import json
+import tempfile
+from typing import List, Optional
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell import FastShell
+from fastshell import files
+from fastshell.parser import tokenize
+from fastshell.types import FileReference
+
+app = FastShell(name="file-args-test")
+directory = tempfile.mkdtemp()
+
+
+def write(name, data):
+    """写入临时文件并返回路径"""
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+@app.command()
+def total(ids: List[int], scale: int = 1):
+    """求和。
+
+    Args:
+        ids: 编号列表
+        scale: 倍数
+    """
+    return sum(ids) * scale
+
+
+@app.command()
+def payload(body: str):
+    """解析JSON。
+
+    Args:
+        body: JSON文本
+    """
+    return json.loads(body)
+
+
+@app.command()
+def size(label: str, data: memoryview, raw: bytes = b""):
+    """统计大小。
+
+    Args:
+        label: 标签
+        data: 数据
+        raw: 原始字节
+    """
+    return label, data, raw
+
+
+@app.command()
+def optional(ids: Optional[List[int]] = None, raw: Optional[bytes] = None, data: Optional[memoryview] = None):
+    """可选参数。
+
+    Args:
+        ids: 编号列表
+        raw: 原始字节
+        data: 数据
+    """
+    return ids, raw, data
+
+
+def test_lexer_marks_unquoted_references():
+    """只有未加引号的@开头的词是文件引用"""
+    tokens = list(tokenize("cmd @a.txt '@b' \\@c @\"d e\" @"))
+    assert [type(t) is FileReference for t in tokens] == [False, True, False, False, True, False]
+    assert tokens[4].path == "d e"
+
+
+def test_text_and_list_files():
+    """文本文件按参数类型转换，列表按行拆分"""
+    ids = write("ids.txt", b"\n".join(str(i).encode() for i in range(1000)) + b"\n")
+    assert app.execute_command(f"total @{ids} --scale 2", format_output=False) == 999000
+    body = write("body.json", b'{"a": [1, 2]}\n')
+    assert app.execute_command(f"payload @{body}", format_output=False) == {"a": [1, 2]}
+
+
+def test_binary_targets():
+    """bytes与memoryview参数直接接收文件内容，大文件内存映射"""
+    small = write("small.bin", b"\x00\x01")
+    label, data, raw = app.execute_command(f"size x @{small} --raw @{small}", format_output=False)
+    assert (label, data.tobytes(), raw) == ("x", b"\x00\x01", b"\x00\x01")
+
+    big = write("big.bin", b"z" * files.MMAP_THRESHOLD)
+    _, data, _ = app.execute_command(f"size y @{big}", format_output=False)
+    assert data.readonly and data.nbytes == files.MMAP_THRESHOLD
+    assert type(data.obj).__name__ == "mmap"
+
+
+def test_optional_targets():
+    """Optional 参数按其内部类型加载文件"""
+    ids = write("few.txt", b"1\n2\n3\n")
+    blob = write("blob.bin", b"\xff\x00")
+    numbers, raw, data = app.execute_command(
+        f"optional --ids @{ids} --raw @{blob} --data @{blob}", format_output=False
+    )
+    assert numbers == [1, 2, 3]
+    assert raw == b"\xff\x00" and data.tobytes() == b"\xff\x00"
+
+
+def test_missing_file_is_reported():
+    """文件不存在时报告参数错误"""
+    missing = os.path.join(directory, "missing.txt")
+    assert app.execute_command(f"payload @{missing}", format_output=False) is None
+
+
+if __name__ == "__main__":
+    print("Testing file arguments...")
+    test_lexer_marks_unquoted_references()
+    test_text_and_list_files()
+    test_binary_targets()
+    test_optional_targets()
+    test_missing_file_is_reported()
+    print("All file argument tests passed!")
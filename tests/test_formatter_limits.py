@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+测试大结果的截断、分页与摘要输出
+"""
+
+import sys
+import os
+import io
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.formatter import OutputFormat, ResultFormatter
+
+ROWS = [{"id": i, "name": f"user-{i}"} for i in range(100000)]
+
+
+class TerminalInput(io.StringIO):
+    """模拟交互式终端的标准输入"""
+
+    def isatty(self):
+        return True
+
+
+def make_formatter(format_type, **options):
+    """创建输出到内存缓冲区的格式化器"""
+    buffer = io.StringIO()
+    console = Console(
+        file=buffer, width=120, force_terminal=options.pop("terminal", False), color_system=None
+    )
+    return ResultFormatter(console, format_type, **options), buffer
+
+
+def test_row_cap_footer():
+    """各格式只渲染前 max_rows 行并给出剩余数量"""
+    for format_type in (OutputFormat.TABLE, OutputFormat.JSON, OutputFormat.PLAIN):
+        formatter, buffer = make_formatter(format_type, max_rows=10)
+        formatter.format_result(ROWS)
+        output = buffer.getvalue()
+        assert "user-9" in output and "user-10" not in output, format_type
+        assert "99,990 more" in output, format_type
+
+    formatter, buffer = make_formatter(OutputFormat.TABLE, max_rows=None)
+    formatter.format_result(ROWS[:300])
+    assert "user-299" in buffer.getvalue() and "more" not in buffer.getvalue()
+
+
+def test_depth_cap():
+    """树和美化输出限制嵌套深度"""
+    nested = {"a": {"b": {"c": {"d": 1}}}, "items": list(range(50))}
+    formatter, buffer = make_formatter(OutputFormat.TREE, max_rows=5, max_depth=1)
+    formatter.format_result(nested)
+    output = buffer.getvalue()
+    assert "b (dict, 1 keys)" in output and "c" not in output.replace("dict", "")
+    assert "45 more items" in output
+
+    formatter, buffer = make_formatter(OutputFormat.PRETTY, max_rows=5)
+    formatter.format_result(list(range(50)))
+    assert "+45" in buffer.getvalue()
+
+
+def test_summary():
+    """摘要模式只描述结构"""
+    formatter, buffer = make_formatter(OutputFormat.SUMMARY)
+    formatter.format_result(ROWS)
+    output = buffer.getvalue()
+    assert "100,000 rows, 2 columns" in output
+    assert "name" in output and "user-1" not in output.replace("user-0", "")
+
+
+def test_pager_renders_pages_on_request():
+    """分页器按需渲染下一页"""
+    stdin = sys.stdin
+    sys.stdin = TerminalInput()
+    try:
+        formatter, buffer = make_formatter(OutputFormat.PLAIN, max_rows=10, pager=True, terminal=True)
+        answers = iter(["", "q"])
+        formatter.console.input = lambda *args, **kwargs: next(answers)
+        formatter.format_result(list(range(100)))
+        output = buffer.getvalue()
+        assert "[0, 1," in output and "[10, 11," in output
+        assert "[20," not in output
+        assert "80 more" in output
+
+        # 非终端时退回截断
+        formatter, buffer = make_formatter(OutputFormat.PLAIN, max_rows=10, pager=True)
+        formatter.format_result(list(range(100)))
+        assert "90 more" in buffer.getvalue()
+    finally:
+        sys.stdin = stdin
+
+
+def test_pager_needs_interactive_stdin():
+    """标准输入不是终端时（如批处理脚本）不分页，也不读取输入"""
+    stdin = sys.stdin
+    sys.stdin = io.StringIO("script line\n")
+    try:
+        formatter, buffer = make_formatter(OutputFormat.PLAIN, max_rows=10, pager=True, terminal=True)
+        formatter.format_result(list(range(100)))
+        assert "90 more" in buffer.getvalue()
+        assert sys.stdin.read() == "script line\n"
+    finally:
+        sys.stdin = stdin
+
+
+def test_app_options():
+    """应用切换格式时保留输出限制"""
+    app = FastShell(max_rows=3)
+    app.console = Console(file=io.StringIO())
+    app.set_output_format("summary")
+    assert app.formatter.max_rows == 3
+    assert app.formatter.default_format is OutputFormat.SUMMARY
+
+
+if __name__ == "__main__":
+    print("Testing result size limits...")
+    test_row_cap_footer()
+    test_depth_cap()
+    test_summary()
+    test_pager_renders_pages_on_request()
+    test_pager_needs_interactive_stdin()
+    test_app_options()
+    print("All result size limit tests passed!")
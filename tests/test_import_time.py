@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+测试 import fastshell 的启动耗时预算
+
+非交互式的一次性命令不应加载 prompt_toolkit、Pydantic 和 Rich 的渲染组件。
+预算是相对于同时导入这些依赖的耗时占比，不随机器快慢变化；
+可通过环境变量 FASTSHELL_IMPORT_BUDGET_SHARE 覆盖。
+"""
+
+import sys
+import os
+import subprocess
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import fastshell 的耗时占连同延迟依赖一起导入的耗时的上限（全部提前导入时为 1）
+IMPORT_TIME_BUDGET_SHARE = float(os.environ.get("FASTSHELL_IMPORT_BUDGET_SHARE", "0.6"))
+
+# 这些模块只应在首次使用时导入
+LAZY_MODULES = [
+    "prompt_toolkit",
+    "pydantic",
+    "rich.table",
+    "rich.tree",
+    "rich.syntax",
+    "rich.panel",
+    "rich.pretty",
+    "fastshell.completer",
+]
+
+
+def measure_import_time():
+    """在新进程中测量 import fastshell 及其后导入延迟依赖的耗时（秒）"""
+    code = (
+        "import time; start = time.perf_counter(); import fastshell; "
+        "own = time.perf_counter() - start; "
+        "import %s; print(own, time.perf_counter() - start)" % ", ".join(LAZY_MODULES)
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    own, eager = map(float, result.stdout.split())
+    return own, eager
+
+
+def test_import_time_within_budget():
+    """import fastshell 的耗时只占连同延迟依赖导入的一小部分（取三次中的最小占比）"""
+    runs = [measure_import_time() for _ in range(3)]
+    own, eager = min(runs, key=lambda run: run[0] / run[1])
+    share = own / eager
+    print(
+        f"import fastshell: {own * 1000:.1f} ms of {eager * 1000:.1f} ms with lazy dependencies "
+        f"({share:.0%}, budget {IMPORT_TIME_BUDGET_SHARE:.0%})"
+    )
+    assert share <= IMPORT_TIME_BUDGET_SHARE, f"import fastshell took {share:.0%} of the eager import"
+
+
+def test_heavy_modules_are_lazy():
+    """导入 fastshell 时不加载交互式和渲染依赖"""
+    code = "import sys, fastshell; print(','.join(m for m in %r if m in sys.modules))" % (LAZY_MODULES,)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    assert result.stdout.strip() == "", f"eagerly imported: {result.stdout.strip()}"
+
+
+if __name__ == "__main__":
+    print("Testing import time...")
+    test_import_time_within_budget()
+    test_heavy_modules_are_lazy()
+    print("All import time tests passed!")
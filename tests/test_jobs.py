@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+测试交互模式下的后台任务
+"""
+
+import sys
+import os
+import io
+import asyncio
+import threading
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.exceptions import FastShellException
+from fastshell.formatter import create_formatter
+from fastshell.jobs import JobState
+
+release = threading.Event()
+
+
+def make_app():
+    """创建输出到内存缓冲区的应用"""
+    app = FastShell(name="jobs-test")
+    buffer = io.StringIO()
+    app.console = Console(file=buffer, width=200)
+    app.formatter = create_formatter(app.console, "plain")
+
+    @app.command()
+    def export(rows: int):
+        """阻塞直到被释放。
+
+        Args:
+            rows: 行数
+        """
+        release.wait(5)
+        return f"exported {rows}"
+
+    @app.command()
+    def quick():
+        """立即返回。"""
+        return "quick"
+
+    @app.command()
+    async def sleepy(seconds: float):
+        """异步等待。
+
+        Args:
+            seconds: 秒数
+        """
+        await asyncio.sleep(seconds)
+        return "woke"
+
+    return app, buffer
+
+
+def test_background_job_keeps_prompt_free():
+    """后台任务运行时仍可执行其他命令"""
+    app, buffer = make_app()
+    release.clear()
+
+    async def scenario():
+        assert await app._handle_job_builtin("export 10 &")
+        job = app.jobs.get(1)
+        assert job.state is JobState.RUNNING
+        assert await app.execute_command_async("quick", format_output=False) == "quick"
+
+        release.set()
+        assert await app._handle_job_builtin("fg 1")
+        return job
+
+    job = app.loop.run_until_complete(scenario())
+    assert job.state is JobState.DONE
+    assert job.task.result() == "exported 10"
+    assert "exported 10" in buffer.getvalue()
+    app.close()
+
+
+def test_kill_and_list_jobs():
+    """取消异步任务并列出任务"""
+    app, buffer = make_app()
+
+    async def scenario():
+        await app._handle_job_builtin("sleepy 30 &")
+        await app._handle_job_builtin("sleepy 0 &")
+        await app._handle_job_builtin("kill %1")
+        await app._handle_job_builtin("fg 1")
+        await app._handle_job_builtin("fg")
+        await app._handle_job_builtin("jobs")
+
+    app.loop.run_until_complete(scenario())
+    output = buffer.getvalue()
+    assert "[1] cancelled" in output
+    assert "[2] done" in output
+    assert len(app.jobs) == 0
+    app.close()
+
+
+def test_job_errors():
+    """未知任务与命令错误"""
+    app, _ = make_app()
+
+    async def scenario():
+        for line in ("fg 9", "kill x", "missing &"):
+            try:
+                await app._handle_job_builtin(line)
+            except FastShellException:
+                pass
+            else:
+                raise AssertionError(f"expected FastShellException for {line!r}")
+        assert not await app._handle_job_builtin("quick")
+
+    app.loop.run_until_complete(scenario())
+    app.close()
+
+
+if __name__ == "__main__":
+    print("Testing background jobs...")
+    test_background_job_keeps_prompt_free()
+    test_kill_and_list_jobs()
+    test_job_errors()
+    print("All background job tests passed!")
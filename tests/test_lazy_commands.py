@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+测试延迟注册的命令
+"""
+
+import sys
+import os
+import tempfile
+import textwrap
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.document import Document
+
+from fastshell import FastShell
+from fastshell.command import Command, LazyCommand
+from fastshell.completer import FastShellCompleter
+from fastshell.exceptions import CommandNotFound
+
+PLAIN = textwrap.dedent('''
+    def add(a: int, b: int = 0):
+        """加法。
+
+        Args:
+            a: 第一个数
+            b: 第二个数
+        """
+        return a + b
+
+    def show_all(limit: int = 3, verbose: bool = False, *, pattern: str):
+        """显示全部。"""
+        return limit
+''')
+
+DECORATED = textwrap.dedent('''
+    from lazy_app_host import app
+
+    @app.command("shout")
+    def make_loud(text: str):
+        """大声说。"""
+        return text.upper()
+''')
+
+directory = tempfile.mkdtemp()
+for module_name, source in (("lazy_plain_cmds", PLAIN), ("lazy_decorated_cmds", DECORATED)):
+    with open(os.path.join(directory, f"{module_name}.py"), "w") as f:
+        f.write(source)
+sys.path.insert(0, directory)
+
+
+def test_registration_does_not_import():
+    """注册时不导入模块"""
+    app = FastShell(name="lazy-test")
+    app.add_lazy_commands("lazy_plain_cmds", {"add": "加法", "show-all": "显示全部"})
+    assert "lazy_plain_cmds" not in sys.modules
+    assert isinstance(app.commands["add"], LazyCommand)
+    assert "add" in app.command_index
+
+    assert app.execute_command("add 2 --b 3", format_output=False) == 5
+    assert isinstance(app.commands["add"], Command)
+    assert isinstance(app.commands["show-all"], LazyCommand)
+    assert app.execute_command("show-all --pattern x --limit 7", format_output=False) == 7
+
+
+def test_decorated_module_registers_itself():
+    """模块内使用装饰器注册的命令直接使用"""
+    import types
+
+    app = FastShell(name="lazy-host")
+    host = types.ModuleType("lazy_app_host")
+    host.app = app
+    sys.modules["lazy_app_host"] = host
+    try:
+        app.add_lazy_commands("lazy_decorated_cmds", ["shout"])
+        assert app.execute_command("shout hi", format_output=False) == "HI"
+        assert app.commands["shout"].description == "大声说。"
+    finally:
+        del sys.modules["lazy_app_host"]
+
+
+def test_completion_resolves_on_demand():
+    """补全参数时才加载命令"""
+    app = FastShell(name="lazy-complete")
+    app.add_lazy_commands("lazy_plain_cmds", {"show-all": "显示全部"})
+    completer = FastShellCompleter(app.commands, app.command_index, resolve=app.get_command)
+
+    names = [c.text for c in completer.get_completions(Document("sh"), None)]
+    assert names == ["show-all"]
+    assert isinstance(app.commands["show-all"], LazyCommand)
+
+    options = [c.text for c in completer.get_completions(Document("show-all --"), None)]
+    assert "--verbose" in options
+    assert isinstance(app.commands["show-all"], Command)
+
+
+def test_missing_module_or_function():
+    """无法加载的命令报告为未找到"""
+    app = FastShell(name="lazy-missing")
+    app.add_lazy_commands("no_such_module_here", ["ghost"])
+    app.add_lazy_commands("lazy_plain_cmds", ["subtract"])
+    for name in ("ghost", "subtract"):
+        try:
+            app.get_command(name)
+        except CommandNotFound:
+            pass
+        else:
+            raise AssertionError("expected CommandNotFound")
+
+
+if __name__ == "__main__":
+    print("Testing lazy commands...")
+    test_registration_does_not_import()
+    test_decorated_module_registers_itself()
+    test_completion_resolves_on_demand()
+    test_missing_module_or_function()
+    print("All lazy command tests passed!")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+测试命令元数据磁盘缓存
+"""
+
+import sys
+import os
+import functools
+import importlib.util
+import tempfile
+import textwrap
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell import FastShell
+from fastshell.cache import MetadataCache
+from fastshell.command import Command
+
+SOURCE = textwrap.dedent('''
+    from typing import List
+
+    def tag(name: str, values: List[int], *, label: str = "x", force: bool = False):
+        """打标签。
+
+        Args:
+            name: 名字
+            values: 数值
+        """
+        return f"{label}:{name}:{sum(values)}"
+''')
+
+
+def load_module(directory, source=SOURCE):
+    """把源码写入临时模块并导入"""
+    path = os.path.join(directory, "cached_cmds.py")
+    with open(path, "w") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("cached_cmds", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module, path
+
+
+def test_warm_start_skips_inspection():
+    """命中缓存时不再反射函数"""
+    with tempfile.TemporaryDirectory() as directory:
+        module, _ = load_module(directory)
+        cache_path = os.path.join(directory, "meta.cache")
+
+        cold = MetadataCache(cache_path)
+        expected = Command.from_function(module.tag, "tag", metadata_cache=cold)
+        assert (cold.hits, cold.misses) == (0, 1)
+        cold.save()
+
+        warm = MetadataCache(cache_path)
+        original = Command.inspect_function
+        Command.inspect_function = staticmethod(lambda func: 1 / 0)
+        try:
+            command = Command.from_function(module.tag, "tag", metadata_cache=warm)
+        finally:
+            Command.inspect_function = original
+        assert warm.hits == 1
+        assert command.description == expected.description
+        assert command.parameters == expected.parameters
+        assert command.execute(["a", "1,2"], {"label": "y"}) == "y:a:3"
+
+
+def test_changed_file_invalidates_entry():
+    """源文件变化后重新反射"""
+    with tempfile.TemporaryDirectory() as directory:
+        module, _ = load_module(directory)
+        cache_path = os.path.join(directory, "meta.cache")
+        cache = MetadataCache(cache_path)
+        Command.from_function(module.tag, "tag", metadata_cache=cache)
+        cache.save()
+
+        module, _ = load_module(directory, SOURCE + "\n# edited\n")
+        cache = MetadataCache(cache_path)
+        assert cache.get(module.tag) is None
+        assert cache.misses == 1
+
+
+def logged(func):
+    """定义在测试文件中的装饰器"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def test_same_qualname_and_wrapped_functions():
+    """同名的工厂函数不共享缓存；被装饰函数按其所在模块失效"""
+    def make(doc):
+        def cmd(value: int):
+            return value
+        cmd.__doc__ = doc
+        return cmd
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = os.path.join(directory, "meta.cache")
+        cache = MetadataCache(cache_path)
+        first = Command.from_function(make("第一个"), "a", metadata_cache=cache)
+        second = Command.from_function(make("第二个"), "b", metadata_cache=cache)
+        assert (first.description, second.description) == ("第一个", "第二个")
+        assert cache.hits == 0
+
+        module, _ = load_module(directory)
+        Command.from_function(logged(module.tag), "tag", metadata_cache=cache)
+        cache.save()
+
+        module, _ = load_module(directory, SOURCE + "\n# edited\n")
+        cache = MetadataCache(cache_path)
+        assert cache.get(logged(module.tag)) is None
+
+
+def test_app_option_and_corrupt_file():
+    """应用级选项；损坏的缓存文件被忽略"""
+    with tempfile.TemporaryDirectory() as directory:
+        module, _ = load_module(directory)
+        cache_path = os.path.join(directory, "meta.cache")
+        with open(cache_path, "wb") as f:
+            f.write(b"not a pickle")
+
+        app = FastShell(name="cache-test", metadata_cache=cache_path)
+        app.command("tag")(module.tag)
+        app.close()
+
+        assert MetadataCache(cache_path).get(module.tag) is not None
+
+
+if __name__ == "__main__":
+    print("Testing metadata cache...")
+    test_warm_start_skips_inspection()
+    test_changed_file_invalidates_entry()
+    test_same_qualname_and_wrapped_functions()
+    test_app_option_and_corrupt_file()
+    print("All metadata cache tests passed!")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+测试命令调用统计、延迟直方图与 Prometheus 导出
+"""
+
+import sys
+import os
+import io
+import socket
+import tempfile
+import threading
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.formatter import create_formatter
+from fastshell.metrics import (
+    LatencyHistogram,
+    MetricsExporter,
+    MetricsRegistry,
+    PrometheusFileExporter,
+    PrometheusSocketExporter,
+    render_prometheus,
+)
+
+
+def make_app():
+    """创建输出到内存缓冲区的应用"""
+    app = FastShell(name="metrics-test", use_pydantic=False)
+    buffer = io.StringIO()
+    app.console = Console(file=buffer, width=200)
+    app.formatter = create_formatter(app.console, "json")
+
+    @app.command()
+    def divide(a: int, b: int):
+        """相除。
+
+        Args:
+            a: 被除数
+            b: 除数
+        """
+        return a // b
+
+    return app, buffer
+
+
+def test_histogram_buckets():
+    """直方图桶的相对误差不超过 12.5%"""
+    histogram = LatencyHistogram()
+    values = [0, 7, 15, 16, 1000, 123456, 10 ** 9, 2 ** 60]
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == len(values)
+    assert histogram.max == 2 ** 60
+    assert histogram.percentile(100) == 2 ** 60
+
+    for value in values[3:7]:
+        single = LatencyHistogram()
+        single.record(value)
+        bound = next(single.buckets())[0]
+        assert value <= bound <= value * 1.125
+    cumulative = [count for _, count in histogram.buckets()]
+    assert cumulative == sorted(cumulative) and cumulative[-1] == len(values) - 1
+
+
+def test_execute_records_calls_and_errors():
+    """execute_command 记录调用次数、错误类型与延迟"""
+    app, buffer = make_app()
+    app.execute_command("divide 6 3")
+    app.execute_command("divide 6 x")
+    app.execute_command("divide 1 0")
+    app.execute_command("missing 1")
+
+    divide = app.metrics.commands["divide"]
+    assert divide.calls == 3
+    assert divide.errors == {"TypeConversionError": 1, "ZeroDivisionError": 1}
+    assert divide.latency.total > 0
+    assert app.metrics.commands["<unknown>"].errors == {"CommandNotFound": 1}
+
+    assert app._handle_builtin("stats")
+    assert '"command": "divide"' in buffer.getvalue()
+    assert app._handle_builtin("stats reset")
+    assert not app.metrics.commands
+
+    quiet = FastShell(collect_metrics=False)
+    assert quiet.metrics is None
+
+
+def test_prometheus_export():
+    """以 Prometheus 文本格式写入文件和套接字"""
+    registry = MetricsRegistry()
+    registry.record('say "hi"', 2000)
+    registry.record('say "hi"', 3000, ValueError("bad"))
+    text = render_prometheus(registry)
+    assert 'fastshell_command_calls_total{command="say \\"hi\\""} 2' in text
+    assert 'error="ValueError"} 1' in text
+    assert 'fastshell_command_duration_seconds_bucket{command="say \\"hi\\"",le="+Inf"} 2' in text
+    assert 'fastshell_command_duration_seconds_count{command="say \\"hi\\""} 2' in text
+
+    # 等于 le 上界的值计入该桶
+    edge = MetricsRegistry()
+    edge.record("tick", 17)
+    assert 'fastshell_command_duration_seconds_bucket{command="tick",le="1.7e-08"} 1' in render_prometheus(edge)
+    try:
+        MetricsExporter()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("MetricsExporter is abstract")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "shell.prom")
+        registry.add_exporter(PrometheusFileExporter(path, namespace="app"))
+
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        received = []
+
+        def accept():
+            connection, _ = server.accept()
+            with connection:
+                chunks = iter(lambda: connection.recv(4096), b"")
+                received.append(b"".join(chunks).decode("utf-8"))
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+        registry.add_exporter(PrometheusSocketExporter(server.getsockname()))
+        registry.export()
+        thread.join(5)
+        server.close()
+
+        with open(path, encoding="utf-8") as f:
+            assert f.read().startswith("# HELP app_command_calls_total")
+        assert received == [text]
+
+
+if __name__ == "__main__":
+    print("Testing metrics...")
+    test_histogram_buckets()
+    test_execute_records_calls_and_errors()
+    test_prometheus_export()
+    print("All metrics tests passed!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+测试命令行解析器
+"""
+
+import sys
+import os
+import shlex
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.exceptions import ParseError
+from fastshell.parser import CommandParser, tokenize
+
+QUOTING_CASES = [
+    "",
+    "   ",
+    "cmd a b\tc",
+    "cmd 'single quoted' \"double quoted\"",
+    "cmd a'b'\"c\"d",
+    "cmd '' \"\"",
+    'cmd "escaped \\" quote" "back\\\\slash" "keep \\n"',
+    "cmd escaped\\ space \\'quote\\'",
+    "cmd 'no \\ escapes in single'",
+    "cmd --opt='a b' -x=\"1 2\"",
+]
+
+
+def test_tokenize_matches_shlex():
+    """分词结果与 shlex.split 保持一致（POSIX 引号规则）"""
+    for line in QUOTING_CASES:
+        assert list(tokenize(line)) == shlex.split(line), line
+
+
+def test_tokenize_errors():
+    """未闭合的引号和末尾的反斜杠"""
+    for line in ["cmd 'open", 'cmd "open', "cmd trailing\\"]:
+        try:
+            list(tokenize(line))
+        except ParseError:
+            pass
+        else:
+            raise AssertionError(f"expected ParseError for {line!r}")
+
+
+def test_parse_classifies_tokens():
+    """位置参数、长选项、短选项和组合短选项"""
+    parsed = CommandParser().parse(
+        "search 'hello world' --case-sensitive --max-count 5 --mode=fast-scan -n 3 -vx -q"
+    )
+    assert parsed.command == "search"
+    assert parsed.args == ["hello world"]
+    assert parsed.kwargs == {
+        "case_sensitive": "true",
+        "max_count": "5",
+        "mode": "fast-scan",
+        "n": "3",
+        "vx": "true",
+        "q": "true",
+    }
+
+
+def test_parse_empty_line():
+    """空命令行"""
+    parsed = CommandParser().parse("   ")
+    assert parsed.command is None
+    assert parsed.args == []
+    assert parsed.kwargs == {}
+
+
+def test_parse_partial_incomplete_tokens():
+    """部分解析保留引号和未完成的最后一个词"""
+    parser = CommandParser()
+    parsed = parser.parse_partial('greet "Al')
+    assert parsed.command == "greet"
+    assert parsed.args == ['"Al']
+
+    parsed = parser.parse_partial("greet --count ")
+    assert parsed.kwargs == {"count": ""}
+
+
+def test_parse_partial_incremental_matches_fresh():
+    """增量解析与全新解析结果一致（追加、删除和中间编辑）"""
+    incremental = CommandParser()
+    edits = [
+        "g", "gr", "greet", "greet ", "greet 'a b' ", "greet 'a b' --n",
+        "greet 'a b' --name x", "greet 'a b' --name", "greet 'a b' -",
+        "greet 'c d' -v --name=y ", "greet", "",
+    ]
+    for text in edits:
+        expected = CommandParser().parse_partial(text)
+        parsed = incremental.parse_partial(text)
+        assert (parsed.command, parsed.args, parsed.kwargs) == (
+            expected.command, expected.args, expected.kwargs
+        ), text
+
+
+if __name__ == "__main__":
+    print("Testing command parser...")
+    test_tokenize_matches_shlex()
+    test_tokenize_errors()
+    test_parse_classifies_tokens()
+    test_parse_empty_line()
+    test_parse_partial_incomplete_tokens()
+    test_parse_partial_incremental_matches_fresh()
+    print("All parser tests passed!")
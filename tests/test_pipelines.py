@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+测试命令管道
+"""
+
+import sys
+import os
+import asyncio
+from typing import Iterator, List
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell import FastShell
+from fastshell.exceptions import ParseError
+
+app = FastShell(name="pipe-test")
+produced = []
+
+
+class Record:
+    """不可序列化为字符串再解析的对象"""
+
+    def __init__(self, value):
+        self.value = value
+
+
+@app.command()
+def numbers(count: int) -> Iterator[int]:
+    """生成数字。
+
+    Args:
+        count: 数量
+    """
+    for i in range(count):
+        produced.append(i)
+        yield i
+
+
+@app.command()
+def double(items: Iterator[int]) -> Iterator[int]:
+    """逐个翻倍。
+
+    Args:
+        items: 输入
+    """
+    for item in items:
+        yield item * 2
+
+
+@app.command()
+def head(items: Iterator[int], n: int = 3) -> List[int]:
+    """取前n个。
+
+    Args:
+        items: 输入
+        n: 数量
+    """
+    result = []
+    for item in items:
+        if len(result) == n:
+            break
+        result.append(item)
+    return result
+
+
+@app.command()
+def record(value: int) -> Record:
+    """创建记录。
+
+    Args:
+        value: 值
+    """
+    return Record(value)
+
+
+@app.command(pipe="source")
+def unwrap(prefix: str, source: Record = None) -> str:
+    """读取记录。
+
+    Args:
+        prefix: 前缀
+        source: 记录
+    """
+    return f"{prefix}{source.value}"
+
+
+@app.command()
+async def fetch(value: int) -> Record:
+    """异步创建记录。
+
+    Args:
+        value: 值
+    """
+    await asyncio.sleep(0)
+    return Record(value)
+
+
+def test_objects_pass_without_conversion():
+    """结果作为Python对象传入下一个命令"""
+    assert app.execute_command("record 7 | unwrap v=", format_output=False) == "v=7"
+
+
+def test_generators_run_lazily():
+    """生成器管道按需逐个求值"""
+    produced.clear()
+    result = app.execute_command("numbers 1000000 | double | head 2", format_output=False)
+    assert result == [0, 2]
+    assert produced == [0, 1, 2]
+
+
+def test_async_stage_is_awaited():
+    """异步阶段的结果在传递前被等待"""
+    assert app.execute_command("fetch 5 | unwrap x", format_output=False) == "x5"
+    result = asyncio.run(app.execute_command_async("fetch 6 | unwrap y", format_output=False))
+    assert result == "y6"
+
+
+def test_quoted_pipe_is_literal():
+    """引号中的竖线不分隔命令"""
+    stages = app.parser.parse_pipeline("unwrap 'a|b'")
+    assert len(stages) == 1
+    assert stages[0].args == ["a|b"]
+
+
+def test_empty_stage_is_error():
+    """空的管道阶段报错"""
+    try:
+        app.parser.parse_pipeline("numbers 3 | | head")
+    except ParseError:
+        pass
+    else:
+        raise AssertionError("expected ParseError")
+
+
+if __name__ == "__main__":
+    print("Testing pipelines...")
+    test_objects_pass_without_conversion()
+    test_generators_run_lazily()
+    test_async_stage_is_awaited()
+    test_quoted_pipe_is_literal()
+    test_empty_stage_is_error()
+    print("All pipeline tests passed!")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+测试执行阶段计时与 profile 内置命令
+"""
+
+import sys
+import os
+import io
+import asyncio
+import time
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from rich.console import Console
+
+from fastshell import FastShell
+from fastshell.exceptions import InvalidArguments
+from fastshell.formatter import create_formatter
+from fastshell.profiling import PHASES
+
+
+def make_app():
+    """创建输出到内存缓冲区的应用"""
+    app = FastShell(name="profile-test", use_pydantic=False)
+    buffer = io.StringIO()
+    app.console = Console(file=buffer, width=200)
+    app.formatter = create_formatter(app.console, "plain")
+
+    @app.command()
+    def slow(seconds: float):
+        """等待若干秒。
+
+        Args:
+            seconds: 秒数
+        """
+        time.sleep(seconds)
+        return "done"
+
+    @app.command()
+    async def nap(seconds: float):
+        """异步等待若干秒。
+
+        Args:
+            seconds: 秒数
+        """
+        await asyncio.sleep(seconds)
+        return "rested"
+
+    @app.command()
+    def double(value: int):
+        """加倍。
+
+        Args:
+            value: 数值
+        """
+        return value * 2
+
+    return app, buffer
+
+
+def test_hooks_receive_phase_timings():
+    """注册钩子后每次执行都按阶段计时"""
+    app, _ = make_app()
+    profiles = []
+    app.add_profile_hook(profiles.append)
+
+    assert app.execute_command("slow 0.01 | double --value 3", format_output=False) is None
+    assert app.execute_command("slow 0.05", format_output=False) == "done"
+    assert app.loop.run_until_complete(app.execute_command_async("nap 0.05")) == "rested"
+
+    failed, sync, coroutine = profiles
+    assert isinstance(failed.error, InvalidArguments)
+    assert failed.commands == ["slow", "double"]
+
+    assert sync.error is None and sync.commands == ["slow"]
+    assert list(sync.phases) == list(PHASES)
+    assert sync.phases["call"] >= 0.05
+    assert sync.phases["bind"] < 0.05 and sync.phases["validate"] < 0.05
+    assert coroutine.phases["call"] >= 0.05
+
+    app.remove_profile_hook(profiles.append)
+    app.execute_command("double 2", format_output=False)
+    assert len(profiles) == 3
+    app.close()
+
+
+def test_profile_builtin():
+    """profile 内置命令打印阶段耗时与函数排行"""
+    app, buffer = make_app()
+    assert app._handle_builtin("profile slow 0.01")
+    output = buffer.getvalue()
+    assert "done" in output
+    assert "Profile of 'slow 0.01'" in output
+    for phase in PHASES:
+        assert phase in output
+    assert "cumulative" in output and "sleep" in output
+    app.close()
+
+
+def test_interactive_exits_on_eof():
+    """交互模式在输入结束（Ctrl-D）时退出，而不是当作错误循环"""
+    app, buffer = make_app()
+    with create_pipe_input() as pipe:
+        pipe.send_text("profile double 2\n")
+        pipe.close()
+        with create_app_session(input=pipe, output=DummyOutput()):
+            app.run_interactive()
+    output = buffer.getvalue()
+    assert "Profile of 'double 2'" in output
+    assert "Unexpected error" not in output
+    assert output.rstrip().endswith("Goodbye!")
+    app.close()
+
+
+if __name__ == "__main__":
+    print("Testing profiling...")
+    test_hooks_receive_phase_timings()
+    test_profile_builtin()
+    test_interactive_exits_on_eof()
+    print("All profiling tests passed!")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+测试生成器结果的流式输出
+"""
+
+import sys
+import os
+import io
+import json
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from fastshell.formatter import OutputFormat, ResultFormatter
+
+
+def make_formatter(format_type=OutputFormat.AUTO):
+    """创建输出到内存缓冲区的格式化器"""
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=80)
+    return ResultFormatter(console, format_type, stream_chunk_size=2), buffer
+
+
+def test_plain_stream_is_incremental():
+    """第一行在生成器结束前就已输出"""
+    formatter, buffer = make_formatter(OutputFormat.PLAIN)
+    seen = []
+
+    def lines():
+        yield "first"
+        seen.append(buffer.getvalue())
+        yield "second"
+
+    formatter.format_result(lines())
+    assert seen == ["first\n"]
+    assert buffer.getvalue() == "first\nsecond\n"
+
+
+def test_json_stream_is_ndjson():
+    """JSON 格式按行输出（NDJSON）"""
+    formatter, buffer = make_formatter(OutputFormat.JSON)
+    formatter.format_result({"id": i} for i in range(3))
+    lines = buffer.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_auto_stream_of_dicts_renders_table_chunks():
+    """字典流自动渲染为分块表格"""
+    formatter, buffer = make_formatter()
+    formatter.format_result(iter([{"name": "alpha"}, {"name": "beta"}, {"name": "gamma"}]))
+    output = buffer.getvalue()
+    assert output.count("name") == 1
+    for value in ("alpha", "beta", "gamma"):
+        assert value in output
+
+
+def test_table_stream_shows_first_row_immediately():
+    """表格流的第一行在生成器结束前就已输出"""
+    formatter, buffer = make_formatter(OutputFormat.TABLE)
+    seen = []
+
+    def rows():
+        yield {"name": "alpha"}
+        seen.append(buffer.getvalue())
+        yield {"name": "beta"}
+
+    formatter.format_result(rows())
+    assert "alpha" in seen[0] and "beta" not in seen[0]
+    assert buffer.getvalue().count("name") == 1
+
+
+def test_empty_stream():
+    """空迭代器不输出任何内容"""
+    formatter, buffer = make_formatter()
+    formatter.format_result(iter([]))
+    assert buffer.getvalue() == ""
+
+
+if __name__ == "__main__":
+    print("Testing streaming output...")
+    test_plain_stream_is_incremental()
+    test_json_stream_is_ndjson()
+    test_auto_stream_of_dicts_renders_table_chunks()
+    test_table_stream_shows_first_row_immediately()
+    test_empty_stream()
+    print("All streaming tests passed!")
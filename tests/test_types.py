@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+测试使用 __slots__ 的数据类型与 parse_partial 复用的结果对象
+"""
+
+import sys
+import os
+import tempfile
+from dataclasses import fields
+from typing import List
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastshell.cache import MetadataCache
+from fastshell.command import Command
+from fastshell.parser import CommandParser
+from fastshell.types import Parameter, ParameterType, ParsedCommand
+
+
+def tag(name: str, values: List[int], *, force: bool = False):
+    """打标签。
+
+    Args:
+        name: 名字
+        values: 数值
+    """
+    return name
+
+
+def test_slotted_dataclasses():
+    """Parameter 与 ParsedCommand 没有 __dict__，数据类行为不变"""
+    param = Parameter("count", int, default=1, parameter_type=ParameterType.OPTION)
+    parsed = ParsedCommand("deploy")
+    for obj in (param, parsed):
+        assert not hasattr(obj, "__dict__")
+        assert type(obj).__slots__ == tuple(f.name for f in fields(obj))
+        try:
+            obj.extra = 1
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"{type(obj).__name__} accepted an unknown attribute")
+
+    assert param == Parameter("count", int, default=1, parameter_type=ParameterType.OPTION)
+    assert "name='count'" in repr(param)
+    assert (parsed.args, parsed.kwargs) == ([], {})
+
+
+def test_slotted_parameters_pickle_through_cache():
+    """槽位参数经元数据缓存序列化后保持相等"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "meta.cache")
+        cold = MetadataCache(path)
+        expected = Command.from_function(tag, "tag", metadata_cache=cold)
+        cold.save()
+
+        warm = MetadataCache(path)
+        description, parameters = warm.get(tag)
+        assert warm.hits == 1
+        assert description == expected.description
+        assert parameters == expected.parameters
+        assert all(not hasattr(param, "__dict__") for param in parameters)
+
+
+def test_parse_partial_reuses_result():
+    """parse_partial 每次返回同一个对象，内容被下一次调用覆盖"""
+    parser = CommandParser()
+    first = parser.parse_partial("deploy --re")
+    assert first.command == "deploy" and "re" in first.kwargs
+    second = parser.parse_partial("deploy --region eu web")
+    assert second is first
+    assert second.kwargs == {"region": "eu"} and second.args == ["web"]
+    assert parser.parse_partial("status").args == []
+
+
+if __name__ == "__main__":
+    print("Testing slotted types...")
+    test_slotted_dataclasses()
+    test_slotted_parameters_pickle_through_cache()
+    test_parse_partial_reuses_result()
+    print("All slotted type tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+测试Pydantic验证器缓存
+"""
+
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enum import Enum
+from typing import List, Optional, Union
+from fastshell.exceptions import TypeConversionError
+from fastshell.validation import EnhancedValidator, ValidationConfig
+
+
+def test_repeated_calls_hit_cache():
+    """同一(类型, 字段)只构建一次验证器"""
+    validator = EnhancedValidator()
+    for _ in range(5):
+        assert validator.validate_and_convert("42", int, "count") == 42
+
+    info = validator.cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+    assert info.currsize == 1
+
+
+def test_cache_is_bounded():
+    """缓存按LRU淘汰"""
+    validator = EnhancedValidator(ValidationConfig(cache_size=2))
+    validator.validate_and_convert("1", int, "a")
+    validator.validate_and_convert("1", int, "b")
+    validator.validate_and_convert("1", int, "a")
+    validator.validate_and_convert("1", int, "c")
+
+    assert validator.cache_info().currsize == 2
+    assert (int, "a") in validator._adapters
+    assert (int, "b") not in validator._adapters
+
+
+def test_cached_conversion_semantics():
+    """缓存后的转换结果保持不变"""
+    validator = EnhancedValidator()
+    assert validator.validate_and_convert("1, 2,3", List[int], "ids") == [1, 2, 3]
+    assert validator.validate_and_convert("123", Union[int, str], "value") == 123
+    assert validator.validate_and_convert("hello", Union[int, str], "value") == "hello"
+
+    try:
+        validator.validate_and_convert("abc", int, "count")
+    except TypeConversionError:
+        pass
+    else:
+        raise AssertionError("expected TypeConversionError")
+
+
+def test_legacy_semantics_pinned():
+    """布尔值沿用旧的真值集合，字符串不去除空白，整数接受 5.0 这样的写法"""
+    validator = EnhancedValidator()
+    assert validator.validate_and_convert("yes", bool, "flag") is True
+    assert validator.validate_and_convert("maybe", bool, "flag") is False
+    assert validator.validate_and_convert("t", bool, "flag") is False
+    assert validator.validate_and_convert("on,off,1", List[bool], "flags") == [True, False, True]
+    assert validator.validate_and_convert("  padded ", str, "name") == "  padded "
+    assert validator.validate_and_convert("5.0", int, "count") == 5
+    assert validator.validate_and_convert(" 5 ", int, "count") == 5
+
+
+class Region(Enum):
+    """测试用区域枚举"""
+    EU = "eu-west"
+    US = "us-east"
+
+
+def test_list_and_enum_conventions():
+    """逗号列表（含 Optional 包装）去除空白，枚举容器接受成员名"""
+    validator = EnhancedValidator()
+    assert validator.validate_and_convert("1,2", Optional[List[int]], "ids") == [1, 2]
+    assert validator.validate_and_convert("a, b ,,c", List[str], "names") == ["a", "b", "c"]
+    assert validator.validate_and_convert("EU,eu,us-east", List[Region], "regions") == [
+        Region.EU, Region.EU, Region.US
+    ]
+    assert validator.validate_and_convert("eu", Optional[Region], "region") is Region.EU
+    assert validator.validate_and_convert("EU", Region, "region") is Region.EU
+
+
+if __name__ == "__main__":
+    print("Testing validator cache...")
+    test_repeated_calls_hit_cache()
+    test_cache_is_bounded()
+    test_cached_conversion_semantics()
+    test_legacy_semantics_pinned()
+    test_list_and_enum_conventions()
+    print("All validator cache tests passed!")